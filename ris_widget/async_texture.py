@@ -1,8 +1,13 @@
 # This code is licensed under the MIT License (see LICENSE file for details)
 
+import collections
+import functools
+import heapq
+import itertools
 import threading
-import queue
 import ctypes
+import time
+import weakref
 
 import numpy
 from OpenGL import GL
@@ -17,6 +22,48 @@ IMAGE_TYPE_TO_GL_TEXTURE_FORMATS = {
     'rgba': GL.GL_RGBA32F
 }
 
+IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_16 = {
+    'G': GL.GL_R16,
+    'Ga': GL.GL_RG16,
+    'rgb': GL.GL_RGB16,
+    'rgba': GL.GL_RGBA16
+}
+
+IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_16_SNORM = {
+    'G': GL.GL_R16_SNORM,
+    'Ga': GL.GL_RG16_SNORM,
+    'rgb': GL.GL_RGB16_SNORM,
+    'rgba': GL.GL_RGBA16_SNORM
+}
+
+IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_8 = {
+    'G': GL.GL_R8,
+    'Ga': GL.GL_RG8,
+    'rgb': GL.GL_RGB8,
+    'rgba': GL.GL_RGBA8
+}
+
+# Integer data are stored in normalized integer textures of the same width, which the GL samples as
+# value / dtype max, just as it would normalize the same data uploaded to a float texture. The GL has no
+# suitable texture formats for int32 and float64 data, which are stored as float32.
+NUMPY_DTYPE_TO_GL_TEXTURE_FORMATS = {
+    numpy.bool8: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_8,
+    numpy.uint8: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_8,
+    numpy.uint16: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_16,
+    numpy.int16: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_16_SNORM,
+    numpy.int32: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS,
+    numpy.float32: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS,
+    numpy.float64: IMAGE_TYPE_TO_GL_TEXTURE_FORMATS
+}
+
+# Data of these types are converted as they are uploaded (by the upload thread, not the thread that called
+# upload(): with pixel buffers, in the copy to the buffer that is made anyway), so that images of them are
+# used without a copy of their own.
+NUMPY_DTYPE_TO_UPLOAD_DTYPE = {
+    numpy.int32: numpy.float32,
+    numpy.float64: numpy.float32
+}
+
 IMAGE_TYPE_TO_SOURCE_FORMATS = {
     'G': GL.GL_RED,
     'Ga': GL.GL_RG,
@@ -28,134 +75,1101 @@ NUMPY_DTYPE_TO_GL_PIXEL_TYPE = {
     numpy.bool8: GL.GL_UNSIGNED_BYTE,
     numpy.uint8: GL.GL_UNSIGNED_BYTE,
     numpy.uint16: GL.GL_UNSIGNED_SHORT,
-    numpy.float32: GL.GL_FLOAT
+    numpy.int16: GL.GL_SHORT,
+    numpy.int32: GL.GL_FLOAT, # see NUMPY_DTYPE_TO_UPLOAD_DTYPE
+    numpy.float32: GL.GL_FLOAT,
+    numpy.float64: GL.GL_FLOAT
 }
 
+IMAGE_TYPE_CHANNELS = {'G': 1, 'Ga': 2, 'rgb': 3, 'rgba': 4}
+
+GL_TEXTURE_FORMAT_TEXEL_BYTES = {}
+for formats, channel_bytes in ((IMAGE_TYPE_TO_GL_TEXTURE_FORMATS, 4), (IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_16, 2),
+        (IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_16_SNORM, 2), (IMAGE_TYPE_TO_GL_TEXTURE_FORMATS_8, 1)):
+    for image_type, format in formats.items():
+        GL_TEXTURE_FORMAT_TEXEL_BYTES[format] = IMAGE_TYPE_CHANNELS[image_type] * channel_bytes
+del formats, channel_bytes, image_type, format
+
 USE_BG_UPLOAD_THREAD = True # debug flag for testing with flaky drivers
+USE_NATIVE_TEXTURE_FORMATS = True # debug flag: if False, store all images in float32 textures
+USE_PIXEL_BUFFERS = True # debug flag: if False, the upload thread uploads from client memory and calls glFinish
+PIXEL_BUFFER_COUNT = 3 # number of pixel buffer objects the upload thread cycles through
+MAX_MIPMAP_LEVEL = 6
+MAX_TEXTURE_SIZE = None # images larger than this in either dimension are tiled; if None, the driver's GL_MAX_TEXTURE_SIZE
+TILE_SIZE = 4096
+# Tiles overlap their neighbors by this many texels, so that interpolation (including from mipmaps) at tile seams
+# is the same as elsewhere.
+TILE_BORDER = 2**MAX_MIPMAP_LEVEL
+TILED_TEXTURE_MEMORY_BUDGET = 2**30 # bytes of tiles per tiled texture
+TEXTURE_MEMORY_BUDGET = 2**31 # bytes of all textures, beyond which TextureManager evicts textures not recently drawn
+TEXTURE_POOL_BUDGET = 2**28 # bytes of unused textures that TexturePool keeps for reuse
+UPLOAD_THREAD_COUNT = 2 # number of background upload threads (see UploadQueue)
+# Upload priorities, most urgent first: queued uploads start in order of priority, and then of submission
+UPLOAD_PRIORITY_FOCUSED = 0 # the focused layer, if visible
+UPLOAD_PRIORITY_VISIBLE = 1 # other visible layers
+UPLOAD_PRIORITY_BACKGROUND = 2 # invisible layers and prefetched images
+
+def texture_format(image):
+    """Return the GL internal texture format used to store the given image."""
+    if USE_NATIVE_TEXTURE_FORMATS:
+        formats = NUMPY_DTYPE_TO_GL_TEXTURE_FORMATS[image.data.dtype.type]
+    else:
+        formats = IMAGE_TYPE_TO_GL_TEXTURE_FORMATS
+    return formats[image.type]
+
+def texture_bytes(format, w, h, mipmaps=False):
+    """Return the number of bytes used by a texture of the given internal format and size, and if
+    mipmaps is True, its mipmaps."""
+    levels = min(MAX_MIPMAP_LEVEL, max(w, h).bit_length() - 1) if mipmaps else 0
+    texels = sum(max(1, w >> level) * max(1, h >> level) for level in range(levels + 1))
+    return texels * GL_TEXTURE_FORMAT_TEXEL_BYTES[format]
+
+_DRIVER_MAX_TEXTURE_SIZE = None
+
+def max_texture_size():
+    """Return the largest image width or height that can be stored in a single texture (see MAX_TEXTURE_SIZE),
+    or None if there is no OpenGL to ask."""
+    global _DRIVER_MAX_TEXTURE_SIZE
+    if MAX_TEXTURE_SIZE is not None:
+        return MAX_TEXTURE_SIZE
+    if _DRIVER_MAX_TEXTURE_SIZE is None:
+        if Qt.QOpenGLContext.currentContext() is not None:
+            _DRIVER_MAX_TEXTURE_SIZE = int(GL.glGetIntegerv(GL.GL_MAX_TEXTURE_SIZE))
+        else:
+            surface = Qt.QOffscreenSurface()
+            surface.setFormat(shared_resources.GL_QSURFACE_FORMAT)
+            surface.create()
+            gl_context = Qt.QOpenGLContext()
+            gl_context.setShareContext(Qt.QOpenGLContext.globalShareContext())
+            gl_context.setFormat(surface.format())
+            if not gl_context.create() or not gl_context.makeCurrent(surface):
+                return None # no OpenGL: try again next time
+            try:
+                _DRIVER_MAX_TEXTURE_SIZE = int(GL.glGetIntegerv(GL.GL_MAX_TEXTURE_SIZE))
+            finally:
+                gl_context.doneCurrent()
+    return _DRIVER_MAX_TEXTURE_SIZE
+
+def needs_tiles(image):
+    """Return whether the image is too large for a single texture, and so must be stored in a TiledTexture."""
+    max_size = max_texture_size()
+    return max_size is not None and max(image.data.shape[:2]) > max_size
 
 class AsyncTexture:
-    def __init__(self):
+    def __init__(self, ready_callback=None):
+        # if not None, ready_callback(texture) is called (from the upload thread) when each upload completes
+        self.ready_callback = ready_callback
         self.ready = threading.Event()
+        # Uploads are numbered, so that ready is set only once the most recent one has completed
+        self._upload_serial = 0
+        self._upload_lock = threading.Lock()
         self.status = 'waiting'
         self.texture = None
         self.format = None
-        self.shape = None
+        self.shape = None # the (width, height) of the texture, which is that of the image transposed if transposed is True
+        self.transposed = False
+        self.fence = None
+        # (data, source_format, source_type) of the most recent upload, from which the texture is uploaded again
+        # if it is evicted by the TextureManager
+        self.source = None
+        # Mipmaps are only generated once the texture is drawn minified (see bind()), and from then on are kept
+        # up to date by each upload. If mipmaps is False, they are never generated.
+        self.mipmaps = True
+        self.mipmaps_wanted = False
+        self._mipmaps_current = False
+        self._min_filter = None
+        self._priority = UPLOAD_PRIORITY_VISIBLE
+        # True from when ready_to_bind() finds an upload incomplete until it finds the texture ready: meanwhile,
+        # the texture is not drawn, and ready_callback is expected to have it drawn once ready
+        self.awaited = False
+        # If True, the TextureManager does not evict the texture (e.g. the front texture of a visible layer, which a
+        # view may draw at any time, however long ago it was last drawn)
+        self.pinned = False
+
+    @property
+    def priority(self):
+        """The priority of this texture's uploads in the UploadQueue (one of the UPLOAD_PRIORITY constants)."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority):
+        if priority != self._priority:
+            self._priority = priority
+            if USE_BG_UPLOAD_THREAD and self.status == 'uploading':
+                # move a queued upload ahead of (or behind) the others
+                UploadQueue.get().reprioritize(self)
 
     def upload(self, image, upload_region=None):
-        new_format = IMAGE_TYPE_TO_GL_TEXTURE_FORMATS[image.type]
-        new_shape = image.data.shape[:2]
+        new_format = texture_format(image)
+        data = image.data
+        self.transposed = image.axis_order == 'yx'
+        if self.transposed:
+            # The GL requires rows of pixels to be contiguous, so store an image whose columns are contiguous
+            # transposed, rather than copying it (see bind()).
+            data = data.swapaxes(0, 1)
+            if upload_region is not None:
+                x, y, w, h = upload_region
+                upload_region = y, x, h, w
+        new_shape = data.shape[:2]
 
-        if self.texture is not None and new_format != self.format or new_shape != self.shape:
+        if new_format != self.format or new_shape != self.shape:
+            # (also if there is no texture yet, as an upload in progress may be creating one of the old format and size)
             self.destroy()
         self.format = new_format
         self.shape = new_shape
         source_format = IMAGE_TYPE_TO_SOURCE_FORMATS[image.type]
-        source_type = NUMPY_DTYPE_TO_GL_PIXEL_TYPE[image.data.dtype.type]
-        upload_args = image.data, source_format, source_type, upload_region
+        source_type = NUMPY_DTYPE_TO_GL_PIXEL_TYPE[data.dtype.type]
+        if self.status == 'evicted':
+            # the rest of the image must be uploaded again too
+            upload_region = None
         if self.texture is None and upload_region is not None:
             raise ValueError('The first time the texture is uploaded, the full region must be used.')
-        if self.ready.is_set():
+        self._enqueue_upload(data, source_format, source_type, upload_region)
+
+    def _enqueue_upload(self, data, source_format, source_type, upload_region):
+        self.source = data, source_format, source_type
+        with self._upload_lock:
             # if the texture was already uploaded and done is set, make sure to
             # reset it so that bind waits for this new upload.
+            self._upload_serial += 1
             self.ready.clear()
+        upload_args = data, source_format, source_type, upload_region, self._upload_serial
         self.status = 'uploading'
         if USE_BG_UPLOAD_THREAD:
-            OffscreenContextThread.get().enqueue(self._upload, *upload_args)
+            UploadQueue.get().enqueue_upload(self, *upload_args)
         else:
             self._upload_fg(*upload_args)
 
-    def bind(self, tex_unit):
+    def ready_to_bind(self):
+        """Return whether the texture can be bound without waiting for an upload (its first upload, a partial
+        upload, or, if the texture was evicted, the upload from the retained source data that this starts), so that
+        drawing need not stall until it completes: if not, draw it once ready_callback is called."""
+        if self.status == 'evicted':
+            self._enqueue_upload(*self.source, None)
+        # (set first, in case the upload completes, and ready_callback is called, before ready is checked)
+        self.awaited = True
+        if not self.ready.is_set():
+            return False
+        self.awaited = False
+        return True
+
+    def bind(self, tex_unit, minified=False):
+        """Bind the texture to the given texture unit. If minified is True, the texture will be drawn with
+        fewer screen pixels than texels, so it is bound for sampling from its mipmaps, which are generated if
+        they are not up to date. If transposed is True, the texture must be sampled with its x and y texture
+        coordinates swapped. This waits for an incomplete upload (see ready_to_bind()), including, if the texture was
+        evicted, for it to be uploaded again."""
+        if self.status == 'evicted':
+            self._enqueue_upload(*self.source, None)
         if self.status not in ('uploading', 'uploaded'):
             raise RuntimeError('Cannot bind texture that has not been first uploaded')
         self.ready.wait()
         if hasattr(self, 'exception'):
             raise self.exception
         assert self.texture is not None
+        if self.fence is not None:
+            # the upload was only flushed, not finished: make the GL server (but not this thread) wait for it
+            GL.glWaitSync(self.fence, 0, GL.GL_TIMEOUT_IGNORED)
         GL.glActiveTexture(GL.GL_TEXTURE0 + tex_unit)
         GL.glBindTexture(GL.GL_TEXTURE_2D, self.texture)
+        use_mipmaps = minified and self.mipmaps
+        if use_mipmaps and not self._mipmaps_current:
+            GL.glGenerateMipmap(GL.GL_TEXTURE_2D)
+            self._mipmaps_current = True
+            self.mipmaps_wanted = True
+        min_filter = GL.GL_LINEAR_MIPMAP_LINEAR if use_mipmaps else GL.GL_LINEAR
+        if min_filter != self._min_filter:
+            GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, min_filter)
+            self._min_filter = min_filter
+        TextureManager.get().drawn(self)
 
-    def destroy(self):
+    def evict(self):
+        """Delete the GL texture, which is uploaded again from the retained source data when it is next bound."""
+        # the point of eviction is to free memory, so don't return the texture to the pool
+        self.destroy(recycle=False)
+        if self.source is not None:
+            self.status = 'evicted'
+
+    def destroy(self, recycle=True):
+        """Release the GL texture: if recycle is True, to the TexturePool for reuse by a texture of the same
+        format and size; otherwise, delete it. A queued upload is cancelled, and one in progress is waited for,
+        so that no upload thread is still writing to the texture once it is released."""
+        if USE_BG_UPLOAD_THREAD and self.status == 'uploading':
+            UploadQueue.get().cancel(self)
+            self.status = 'waiting'
         if self.texture is not None:
             # requires a valid context
             assert Qt.QOpenGLContext.currentContext() is not None
-            GL.glDeleteTextures([self.texture])
+            if recycle:
+                TexturePool.get().release(self.texture, self.format, *self.shape, self._mipmaps_current)
+            else:
+                GL.glDeleteTextures([self.texture])
             self.texture = None
+            if self.fence is not None:
+                GL.glDeleteSync(self.fence)
+                self.fence = None
+            self._mipmaps_current = False
+            self._min_filter = None
             self.status = 'waiting'
+            TextureManager.get().remove(self)
 
-    def _upload_fg(self, data, source_format, source_type, upload_region):
+    def _upload_fg(self, data, source_format, source_type, upload_region, serial):
         assert Qt.QOpenGLContext.currentContext() is not None
         orig_unpack_alignment = GL.glGetIntegerv(GL.GL_UNPACK_ALIGNMENT)
         GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
         try:
-            self._upload(data, source_format, source_type, upload_region)
+            self._upload(data, source_format, source_type, upload_region, serial)
         finally:
             # QPainter font rendering for OpenGL surfaces can break if we do not restore GL_UNPACK_ALIGNMENT
             # and this function was called within QPainter's native painting operations
             GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, orig_unpack_alignment)
 
-    def _upload(self, data, source_format, source_type, upload_region):
+    def _upload_bg(self, thread, data, source_format, source_type, upload_region, serial):
+        self._upload(data, source_format, source_type, upload_region, serial, thread.pixel_buffers, thread.mipmap_framebuffers)
+
+    def _upload(self, data, source_format, source_type, upload_region, serial, pixel_buffers=None, mipmap_framebuffers=None):
         try:
+            w, h = self.shape
+            full_upload = upload_region is None
             if self.texture is None:
-                self.texture = GL.glGenTextures(1)
-                alloc_texture = True
+                # A texture from the pool already has storage of the right format and size, so the full
+                # upload below need only replace its contents with glTexSubImage2D. (Its min filter is
+                # reset by bind(), as _min_filter is None.)
+                self.texture = TexturePool.get().lease(self.format, w, h)
+                alloc_texture = self.texture is None
+                if alloc_texture:
+                    self.texture = GL.glGenTextures(1)
+                full_upload = True
             else:
                 alloc_texture = False
             GL.glBindTexture(GL.GL_TEXTURE_2D, self.texture)
-            w, h = self.shape
             if alloc_texture:
-                GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAX_LEVEL, 6)
-                GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR_MIPMAP_LINEAR)
+                GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAX_LEVEL, MAX_MIPMAP_LEVEL)
+                # until mipmaps are generated, the texture must not be sampled from them
+                GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
+                self._min_filter = GL.GL_LINEAR
                 GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_NEAREST)
                 GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_S, GL.GL_CLAMP_TO_EDGE)
                 GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_T, GL.GL_CLAMP_TO_EDGE)
-                GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, self.format, w, h, 0,
-                    source_format, source_type, data.ctypes.data_as(ctypes.c_void_p))
-            else: # texture already exists
-                row_stride = w
+            if pixel_buffers is not None:
+                if alloc_texture:
+                    # allocate storage only: the pixels come from the pixel buffer below
+                    GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, self.format, w, h, 0, source_format, source_type, None)
                 if upload_region is None:
                     x = y = 0
                 else:
                     x, y, w, h = upload_region
                     data = data[x:x+w, y:y+h]
+                pixel_buffers.upload(data, x, y, source_format, source_type)
+            else:
+                if upload_region is None:
+                    x = y = 0
+                else:
+                    x, y, w, h = upload_region
+                    data = data[x:x+w, y:y+h]
+                upload_dtype = NUMPY_DTYPE_TO_UPLOAD_DTYPE.get(data.dtype.type)
+                if upload_dtype is not None:
+                    with numpy.errstate(over='ignore'):
+                        data = data.astype(upload_dtype)
+                # the rows of data may be longer than the texture (e.g. if data is a tile of a larger image)
+                row_length = data.strides[1] // data.strides[0]
                 try:
-                    GL.glPixelStorei(GL.GL_UNPACK_ROW_LENGTH, row_stride)
-                    GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, x, y, w, h,
-                        source_format, source_type, data.ctypes.data_as(ctypes.c_void_p))
+                    GL.glPixelStorei(GL.GL_UNPACK_ROW_LENGTH, row_length)
+                    if alloc_texture:
+                        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, self.format, w, h, 0,
+                            source_format, source_type, data.ctypes.data_as(ctypes.c_void_p))
+                    else:
+                        GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, x, y, w, h,
+                            source_format, source_type, data.ctypes.data_as(ctypes.c_void_p))
                 finally:
                     GL.glPixelStorei(GL.GL_UNPACK_ROW_LENGTH, 0)
-            # whether or not allocating texture, need to regenerate mipmaps
-            GL.glGenerateMipmap(GL.GL_TEXTURE_2D)
-            # need glFinish to make sure that the GL calls (which run asynchronously)
-            # have completed before we set self.ready
-            GL.glFinish()
+            if self.mipmaps and self.mipmaps_wanted:
+                if full_upload or not self._mipmaps_current or mipmap_framebuffers is None:
+                    GL.glGenerateMipmap(GL.GL_TEXTURE_2D)
+                else:
+                    mipmap_framebuffers.update_region(self.texture, self.shape, upload_region)
+                self._mipmaps_current = True
+            else:
+                self._mipmaps_current = False
+            if pixel_buffers is not None:
+                # Rather than waiting here for the upload to complete, fence it and let bind() have the
+                # drawing context wait on the fence. The flush makes the fence visible to other contexts.
+                if self.fence is not None:
+                    GL.glDeleteSync(self.fence)
+                self.fence = GL.glFenceSync(GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+                GL.glFlush()
+            else:
+                # need glFinish to make sure that the GL calls (which run asynchronously)
+                # have completed before we set self.ready
+                GL.glFinish()
             self.status = 'uploaded'
+            TextureManager.get().update(self)
         except Exception as e:
             self.exception = e
         finally:
-            self.ready.set()
+            with self._upload_lock:
+                latest = serial == self._upload_serial
+                if latest:
+                    self.ready.set()
+            if latest and self.ready_callback is not None:
+                self.ready_callback(self)
 
 
-class OffscreenContextThread(Qt.QThread):
-    _ACTIVE_THREAD = None
+class DoubleBufferedTexture:
+    """A front and a back AsyncTexture, so that drawing need not wait for uploads to complete.
+
+    New images are uploaded to the back texture while bind() continues to bind the front texture, which holds
+    the most recent image whose upload has completed. The first bind() after the back texture's upload has
+    completed swaps the two. (If the new image was prefetched by the TexturePrefetcher, its texture replaces
+    the back texture.) Partial updates (with upload_region) are applied to whichever texture holds the
+    newest image.
+
+    If block is True, bind() always binds the newest image, waiting for its upload if necessary, as
+    AsyncTexture.bind() does. Otherwise, bind() never waits: if the texture to bind is not ready (i.e. the first
+    image or a partial update is still being uploaded, or the texture was evicted, in which case it is uploaded
+    again), it returns False without binding it, and ready_callback is called once the texture is ready (see
+    AsyncTexture.ready_to_bind()).
+    """
+    def __init__(self, ready_callback=None):
+        # if not None, ready_callback() is called (from the upload thread) when the upload of the newest image, or of
+        # a texture that bind() could not bind, completes
+        self.ready_callback = ready_callback
+        self.block = False
+        self.front = AsyncTexture(self._on_ready)
+        self.back = AsyncTexture(self._on_ready)
+        self.pending = None # the texture holding the newest image, if it is not (yet) the front texture
+        self._pinned = False
+
+    def upload(self, image, upload_region=None):
+        if upload_region is None:
+            prefetched = TexturePrefetcher.get().take(image)
+            if prefetched is None:
+                self.back.upload(image)
+            else:
+                TextureManager.get().discard(self.back)
+                prefetched.mipmaps = self.front.mipmaps
+                prefetched.mipmaps_wanted = self.front.mipmaps_wanted
+                prefetched.ready_callback = self._on_ready
+                # the prefetched texture's upload, if still queued, is now as urgent as this texture's
+                prefetched.priority = self.front.priority
+                self.back = prefetched
+            self.pending = self.back
+        elif self.pending is not None:
+            self.pending.upload(image, upload_region)
+        else:
+            self.front.upload(image, upload_region)
+
+    def bind(self, tex_unit, minified=False):
+        """Bind the front texture (see above), and return whether it was bound."""
+        pending = self.pending
+        if pending is not None and (self.block or pending.ready.is_set() or
+                self.front.status not in ('uploading', 'uploaded', 'evicted')):
+            self.front, self.back = pending, self.front
+            self.front.pinned, self.back.pinned = self._pinned, False
+            self.pending = None
+            # the back texture will be overwritten before it is drawn again: don't keep its image alive to
+            # upload it again if evicted
+            self.back.source = None
+        if not self.block and not self.front.ready_to_bind():
+            return False
+        self.front.bind(tex_unit, minified)
+        if self.front.mipmaps_wanted:
+            self.back.mipmaps_wanted = True
+        return True
+
+    @property
+    def mipmaps(self):
+        return self.front.mipmaps
+
+    @mipmaps.setter
+    def mipmaps(self, mipmaps):
+        self.front.mipmaps = self.back.mipmaps = mipmaps
+
+    @property
+    def transposed(self):
+        return self.front.transposed
+
+    @property
+    def priority(self):
+        return self.front.priority
+
+    @priority.setter
+    def priority(self, priority):
+        self.front.priority = self.back.priority = priority
+
+    @property
+    def pinned(self):
+        """Whether the front texture is pinned (see AsyncTexture.pinned). The back texture never is."""
+        return self._pinned
+
+    @pinned.setter
+    def pinned(self, pinned):
+        self._pinned = self.front.pinned = pinned
+
+    def destroy(self):
+        self.front.destroy()
+        self.back.destroy()
+        self.pending = None
+
+    def _on_ready(self, texture):
+        if (texture is self.pending or texture.awaited) and self.ready_callback is not None:
+            self.ready_callback()
+
+
+class TextureManager:
+    """Account for the GPU memory used by all AsyncTextures (including mipmaps), and when more than budget bytes
+    are used, evict the textures drawn least recently, other than pinned ones: i.e. those of invisible layers, the
+    back textures of DoubleBufferedTextures, and prefetched textures. An evicted texture is uploaded again when it
+    is next bound.
+
+    To query usage from Python: TextureManager.get().bytes, .textures, and .evictions.
+    """
+    _INSTANCE = None
 
     @classmethod
     def get(cls):
-        if cls._ACTIVE_THREAD is None:
-            cls._ACTIVE_THREAD = cls()
-        return cls._ACTIVE_THREAD
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
 
     def __init__(self):
+        self.budget = TEXTURE_MEMORY_BUDGET
+        self.min_idle = 1 # seconds: textures drawn more recently than this are never evicted
+        self.bytes = 0
+        self.evictions = 0
+        self._discarded = [] # textures no longer used, to be destroyed when a context is current
+        # id(texture) -> [weakref to texture, bytes, time last drawn], least recently drawn first.
+        # Reentrant, as a texture may be garbage collected (removing its entry) while the lock is held.
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def textures(self):
+        """The number of textures with GPU memory allocated."""
+        return len(self._entries)
+
+    def update(self, texture):
+        """Record the memory used by texture, after it is uploaded. May be called from any thread."""
+        nbytes = texture_bytes(texture.format, *texture.shape, texture._mipmaps_current)
+        key = id(texture)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = [weakref.ref(texture, functools.partial(self._remove, key)), nbytes, time.monotonic()]
+                self.bytes += nbytes
+            else:
+                self.bytes += nbytes - entry[1]
+                entry[1] = nbytes
+
+    def drawn(self, texture):
+        """Record that texture was drawn (and so should be evicted last)."""
+        self.update(texture)
+        key = id(texture)
+        with self._lock:
+            self._entries[key][2] = time.monotonic()
+            self._entries.move_to_end(key)
+
+    def remove(self, texture):
+        """Forget a texture whose GL texture has been deleted."""
+        self._remove(id(texture))
+
+    def _remove(self, key, ref=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry[1]
+
+    def discard(self, texture):
+        """Destroy texture, which is no longer used, during the next evict() call (i.e. when a context is current)."""
+        self._discarded.append(texture)
+
+    def evict(self):
+        """Destroy discarded textures, and then evict textures, least recently drawn first, until at most budget
+        bytes are used. Pinned textures, textures drawn in the last min_idle seconds, and textures being uploaded are
+        not evicted. Requires a current OpenGL context."""
+        discarded = self._discarded
+        self._discarded = []
+        for texture in discarded:
+            if USE_BG_UPLOAD_THREAD and UploadQueue.get().is_active(texture):
+                # don't wait for an upload thread to finish writing to the texture: try again next time
+                self._discarded.append(texture)
+            else:
+                # (a queued upload, e.g. of a page that has left the prefetch window, is cancelled)
+                texture.destroy()
+        if self.bytes <= self.budget:
+            return
+        now = time.monotonic()
+        with self._lock:
+            candidates = [ref() for ref, nbytes, drawn in self._entries.values() if now - drawn >= self.min_idle]
+        for texture in candidates:
+            if self.bytes <= self.budget:
+                break
+            if texture is None or texture.pinned or texture.status != 'uploaded' or not texture.ready.is_set():
+                continue
+            texture.evict()
+            self.evictions += 1
+
+
+class TexturePool:
+    """Unused GL textures, by internal format and size, for reuse: a texture leased from the pool needs only
+    to be filled with glTexSubImage2D, rather than allocated with glTexImage2D. AsyncTextures lease from the
+    pool when first uploaded and release to it when destroyed (e.g. when the shape of a layer's image
+    changes), so that flipping between images of a few sizes, or moving images between layers, stops
+    allocating and freeing texture memory. When more than budget bytes are pooled, the textures pooled
+    longest are deleted.
+
+    To query usage from Python: TexturePool.get().hit_rate, .hits, .misses, .bytes, and len().
+    """
+    _INSTANCE = None
+
+    @classmethod
+    def get(cls):
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
+
+    def __init__(self, budget=TEXTURE_POOL_BUDGET):
+        self.budget = budget
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._textures = collections.OrderedDict() # texture -> ((format, w, h), bytes, fence), oldest first
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self):
+        leases = self.hits + self.misses
+        return self.hits / leases if leases else None
+
+    def __len__(self):
+        return len(self._textures)
+
+    def lease(self, format, w, h):
+        """Return a pooled texture with the given internal format and size (which is no longer the pool's),
+        or None if there is none. Requires a current OpenGL context."""
+        key = format, w, h
+        with self._lock:
+            for texture, (texture_key, nbytes, fence) in reversed(self._textures.items()):
+                if texture_key == key:
+                    del self._textures[texture]
+                    self.bytes -= nbytes
+                    self.hits += 1
+                    break
+            else:
+                self.misses += 1
+                return None
+        if fence is not None:
+            # make sure that the context that released the texture is done drawing with it
+            GL.glWaitSync(fence, 0, GL.GL_TIMEOUT_IGNORED)
+            GL.glDeleteSync(fence)
+        return texture
+
+    def release(self, texture, format, w, h, mipmaps=False):
+        """Add a texture that is no longer used to the pool, deleting the oldest pooled textures if the pool
+        exceeds its budget. Requires a current OpenGL context."""
+        nbytes = texture_bytes(format, w, h, mipmaps)
+        if nbytes > self.budget:
+            GL.glDeleteTextures([texture])
+            return
+        gl_context = Qt.QOpenGLContext.currentContext()
+        if gl_context.format().version() >= (3, 2) or gl_context.hasExtension(b'GL_ARB_sync'):
+            fence = GL.glFenceSync(GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        else:
+            fence = None
+        # make the texture's pending drawing commands (and the fence) visible to the other contexts
+        GL.glFlush()
+        deleted = []
+        with self._lock:
+            self._textures[texture] = (format, w, h), nbytes, fence
+            self.bytes += nbytes
+            while self.bytes > self.budget:
+                old_texture, (old_key, old_nbytes, old_fence) = self._textures.popitem(last=False)
+                self.bytes -= old_nbytes
+                deleted.append((old_texture, old_fence))
+        for old_texture, old_fence in deleted:
+            GL.glDeleteTextures([old_texture])
+            if old_fence is not None:
+                GL.glDeleteSync(old_fence)
+
+    def clear(self):
+        """Delete all pooled textures. Requires a current OpenGL context."""
+        with self._lock:
+            textures = list(self._textures.items())
+            self._textures.clear()
+            self.bytes = 0
+        for texture, (key, nbytes, fence) in textures:
+            GL.glDeleteTextures([texture])
+            if fence is not None:
+                GL.glDeleteSync(fence)
+
+
+class TexturePrefetcher:
+    """Upload images to textures before they are drawn, e.g. the images of neighboring flipbook pages. When a
+    prefetched image is assigned to a layer, its DoubleBufferedTexture adopts the prefetched texture rather
+    than uploading the image again.
+    """
+    _INSTANCE = None
+
+    @classmethod
+    def get(cls):
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
+
+    def __init__(self):
+        self._textures = {} # id(image) -> (weakref to image, image generation, AsyncTexture)
+
+    def prefetch(self, image):
+        """Start uploading image, unless it has already been, or it is large enough to be tiled (in which case
+        only the visible tiles are uploaded when it is drawn). Without the background upload thread, uploads
+        require a current context, so nothing is prefetched."""
+        entry = self._textures.get(id(image))
+        if entry is not None and entry[0]() is image and entry[1] == image.generation:
+            return
+        if not USE_BG_UPLOAD_THREAD or needs_tiles(image):
+            return
+        self._release(id(image))
+        texture = AsyncTexture()
+        texture.priority = UPLOAD_PRIORITY_BACKGROUND
+        texture.upload(image)
+        self._textures[id(image)] = weakref.ref(image), image.generation, texture
+
+    def take(self, image):
+        """Return the texture prefetched for image, or None. Returned textures are no longer the prefetcher's
+        responsibility."""
+        entry = self._textures.get(id(image))
+        if entry is None or entry[0]() is not image:
+            return None
+        del self._textures[id(image)]
+        if entry[1] != image.generation:
+            # image has been modified since the texture was uploaded
+            TextureManager.get().discard(entry[2])
+            return None
+        return entry[2]
+
+    def retain(self, images):
+        """Release the textures prefetched for any images other than the given ones."""
+        keep = {id(image) for image in images}
+        for key in list(self._textures):
+            if key not in keep:
+                self._release(key)
+
+    def _release(self, key):
+        entry = self._textures.pop(key, None)
+        if entry is not None:
+            TextureManager.get().discard(entry[2])
+
+    def __len__(self):
+        return len(self._textures)
+
+
+# the parts of an Image that AsyncTexture.upload() uses, for a tile of an image
+_TileImage = collections.namedtuple('_TileImage', ('type', 'data', 'axis_order'))
+
+class TiledTexture:
+    """Store an image too large for a single texture (see max_texture_size()) as a grid of AsyncTexture tiles.
+
+    Tiles are created and uploaded only when they are drawn (see bind_tile()). After each paint, the least
+    recently drawn tiles that were not drawn by that paint are deleted, until the tiles use no more than
+    memory_budget bytes.
+
+    Unless block is True, bind_tile() does not wait for the first upload of a tile, and the region of a tile
+    is not drawn until its upload completes.
+    """
+    pending = None # as for DoubleBufferedTexture: tiles are drawn as soon as their first upload completes
+
+    def __init__(self, ready_callback=None):
+        # if not None, ready_callback() is called (from the upload thread) when the upload of a tile completes
+        self.ready_callback = ready_callback
+        self.block = False
+        self.memory_budget = TILED_TEXTURE_MEMORY_BUDGET
+        self._mipmaps = True
+        self._priority = UPLOAD_PRIORITY_VISIBLE
+        self._pinned = False
+        self.image = None
+        self.format = None
+        self.shape = None
+        self.tile_size = None
+        self.transposed = False # whether the tiles are stored transposed (see AsyncTexture.upload())
+        self.tiles = collections.OrderedDict() # (i, j) -> AsyncTexture, least recently drawn first
+        self._dirty = {} # (i, j) -> region of the tile to upload before it is next drawn (None for all of it)
+        self._unready = set() # tiles whose first upload has not completed
+        self._drawn = set() # tiles drawn since the last end_paint()
+
+    def upload(self, image, upload_region=None):
+        new_format = texture_format(image)
+        new_shape = image.data.shape[:2]
+        if new_format != self.format or new_shape != self.shape:
+            if upload_region is not None:
+                raise ValueError('The first time the texture is uploaded, the full region must be used.')
+            self.destroy()
+            self.format = new_format
+            self.shape = new_shape
+            self.tile_size = min(TILE_SIZE, max_texture_size() - 2 * TILE_BORDER)
+        self.image = image
+        self.transposed = image.axis_order == 'yx'
+        for index in self.tiles:
+            if upload_region is None:
+                self._dirty[index] = None
+                continue
+            x, y, w, h = self._tile_extent(index)
+            rx, ry, rw, rh = upload_region
+            x0, y0 = max(x, rx), max(y, ry)
+            x1, y1 = min(x + w, rx + rw), min(y + h, ry + rh)
+            if x0 < x1 and y0 < y1:
+                region = x0 - x, y0 - y, x1 - x0, y1 - y0
+                if index in self._dirty:
+                    region = _union_region(self._dirty[index], region)
+                self._dirty[index] = region
+
+    def boundaries(self):
+        """Return the positions of the seams between tiles along x and y, as fractions of the image width and height."""
+        return [numpy.arange(self.tile_size, size, self.tile_size) / size for size in self.shape]
+
+    def bind_tile(self, tex_unit, u, v, minified=False):
+        """Bind the tile containing the point (u, v), in fractions of the image width and height, to the given
+        texture unit, uploading it first if needed. Return the (x_scale, y_scale, x_offset, y_offset) transform
+        from fractions of the image size to the tile's texture coordinates, or None if the tile is not ready."""
+        index = tuple(min(int(f * size), size - 1) // self.tile_size for f, size in zip((u, v), self.shape))
+        tile = self.tiles.get(index)
+        if tile is None:
+            tile = AsyncTexture(functools.partial(self._on_tile_ready, index))
+            tile.mipmaps = self._mipmaps
+            tile.priority = self._priority
+            tile.pinned = self._pinned
+            self.tiles[index] = tile
+            self._dirty[index] = None
+            self._unready.add(index)
+        x, y, w, h = self._tile_extent(index)
+        if index in self._dirty:
+            tile.upload(_TileImage(self.image.type, self.image.data[x:x+w, y:y+h], self.image.axis_order), self._dirty.pop(index))
+        self._drawn.add(index)
+        self.tiles.move_to_end(index)
+        if not self.block and (index in self._unready or not tile.ready_to_bind()):
+            return None
+        tile.bind(tex_unit, minified)
+        width, height = self.shape
+        return width / w, height / h, -x / w, -y / h
+
+    def end_paint(self):
+        """Delete least recently drawn tiles, other than those drawn since the last call, while over budget."""
+        used = sum(self._tile_bytes(index) for index in self.tiles)
+        for index, tile in list(self.tiles.items()):
+            if used <= self.memory_budget:
+                break
+            if index in self._drawn or not tile.ready.is_set():
+                continue
+            used -= self._tile_bytes(index)
+            self._delete_tile(index)
+        self._drawn.clear()
+
+    @property
+    def bytes(self):
+        """The number of bytes used by the tiles."""
+        return sum(self._tile_bytes(index) for index in self.tiles)
+
+    @property
+    def mipmaps(self):
+        return self._mipmaps
+
+    @mipmaps.setter
+    def mipmaps(self, mipmaps):
+        self._mipmaps = mipmaps
+        for tile in self.tiles.values():
+            tile.mipmaps = mipmaps
+
+    @property
+    def priority(self):
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority):
+        self._priority = priority
+        for tile in self.tiles.values():
+            tile.priority = priority
+
+    @property
+    def pinned(self):
+        return self._pinned
+
+    @pinned.setter
+    def pinned(self, pinned):
+        self._pinned = pinned
+        for tile in self.tiles.values():
+            tile.pinned = pinned
+
+    def destroy(self):
+        for index in list(self.tiles):
+            self._delete_tile(index)
+        self.format = self.shape = None
+
+    def _tile_extent(self, index):
+        """Return the (x, y, w, h) region of the image stored in the given tile, including its border."""
+        extent = []
+        for i, size in zip(index, self.shape):
+            start = max(0, i * self.tile_size - TILE_BORDER)
+            end = min(size, (i + 1) * self.tile_size + TILE_BORDER)
+            extent += [start, end - start]
+        x, w, y, h = extent
+        return x, y, w, h
+
+    def _tile_bytes(self, index):
+        x, y, w, h = self._tile_extent(index)
+        return texture_bytes(self.format, w, h, self.tiles[index]._mipmaps_current)
+
+    def _delete_tile(self, index):
+        self.tiles.pop(index).destroy()
+        self._dirty.pop(index, None)
+        self._unready.discard(index)
+
+    def _on_tile_ready(self, index, texture):
+        self._unready.discard(index)
+        if self.ready_callback is not None:
+            self.ready_callback()
+
+
+class MipmapFramebuffers:
+    """Update the mipmaps of a region of a texture, rather than regenerating them all with glGenerateMipmap, by
+    downsampling the region from each mipmap level to the next with framebuffer blits. Requires a current OpenGL
+    context, and should only be used from the thread in which that context is current."""
+    def __init__(self):
+        self.read_framebuffer, self.draw_framebuffer = [int(framebuffer) for framebuffer in GL.glGenFramebuffers(2)]
+
+    def update_region(self, texture, shape, region):
+        """Update the mipmaps of the (x, y, w, h) region of texture, which has the given (w, h) shape and
+        must be bound to GL_TEXTURE_2D."""
+        w, h = shape
+        x0, y0, region_w, region_h = region
+        levels = min(MAX_MIPMAP_LEVEL, max(w, h).bit_length() - 1)
+        if 4 * region_w * region_h > w * h:
+            # not worth it: a large region may as well be done all at once
+            GL.glGenerateMipmap(GL.GL_TEXTURE_2D)
+            return
+        x1, y1 = x0 + region_w, y0 + region_h
+        GL.glBindFramebuffer(GL.GL_READ_FRAMEBUFFER, self.read_framebuffer)
+        GL.glBindFramebuffer(GL.GL_DRAW_FRAMEBUFFER, self.draw_framebuffer)
+        try:
+            for level in range(1, levels + 1):
+                src_w, src_h = max(1, w >> (level - 1)), max(1, h >> (level - 1))
+                dst_w, dst_h = max(1, w >> level), max(1, h >> level)
+                # each destination texel is the average of a 2x2 block of source texels
+                dst_x0, dst_y0 = x0 // 2, y0 // 2
+                dst_x1, dst_y1 = min(dst_w, (x1 + 1) // 2), min(dst_h, (y1 + 1) // 2)
+                GL.glFramebufferTexture2D(GL.GL_READ_FRAMEBUFFER, GL.GL_COLOR_ATTACHMENT0, GL.GL_TEXTURE_2D, texture, level - 1)
+                GL.glFramebufferTexture2D(GL.GL_DRAW_FRAMEBUFFER, GL.GL_COLOR_ATTACHMENT0, GL.GL_TEXTURE_2D, texture, level)
+                if (GL.glCheckFramebufferStatus(GL.GL_READ_FRAMEBUFFER) != GL.GL_FRAMEBUFFER_COMPLETE or
+                        GL.glCheckFramebufferStatus(GL.GL_DRAW_FRAMEBUFFER) != GL.GL_FRAMEBUFFER_COMPLETE):
+                    # not all texture formats are color-renderable (e.g. GL_RGB16 need not be)
+                    GL.glGenerateMipmap(GL.GL_TEXTURE_2D)
+                    return
+                GL.glBlitFramebuffer(
+                    2 * dst_x0, 2 * dst_y0, min(src_w, 2 * dst_x1), min(src_h, 2 * dst_y1),
+                    dst_x0, dst_y0, dst_x1, dst_y1,
+                    GL.GL_COLOR_BUFFER_BIT, GL.GL_LINEAR)
+                x0, y0, x1, y1 = dst_x0, dst_y0, dst_x1, dst_y1
+        finally:
+            GL.glFramebufferTexture2D(GL.GL_READ_FRAMEBUFFER, GL.GL_COLOR_ATTACHMENT0, GL.GL_TEXTURE_2D, 0, 0)
+            GL.glFramebufferTexture2D(GL.GL_DRAW_FRAMEBUFFER, GL.GL_COLOR_ATTACHMENT0, GL.GL_TEXTURE_2D, 0, 0)
+            GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, 0)
+
+    @staticmethod
+    def supported(gl_context):
+        """Return whether the given (current) QOpenGLContext supports framebuffer blits."""
+        return gl_context.format().version() >= (3, 0) or gl_context.hasExtension(b'GL_ARB_framebuffer_object')
+
+
+class PixelBufferRing:
+    """Stream texture data through a ring of pixel buffer objects.
+
+    Each upload copies the data into the next buffer of the ring and then has the GL copy that buffer into the
+    texture, which it may do asynchronously. A fence records when each buffer's copy has completed, so that
+    a buffer is only rewritten once the GL is done with it. Requires a current OpenGL context, and should
+    only be used from the thread in which that context is current."""
+    def __init__(self, count=PIXEL_BUFFER_COUNT):
+        self.buffers = [int(buffer) for buffer in numpy.atleast_1d(GL.glGenBuffers(count))]
+        self.sizes = [0] * count
+        self.fences = [None] * count
+        self.next = 0
+
+    def upload(self, data, x, y, source_format, source_type):
+        """Upload data, an (x, y[, c]) array, to the region of the currently-bound GL_TEXTURE_2D that starts at x, y."""
+        index = self.next
+        self.next = (index + 1) % len(self.buffers)
+        fence = self.fences[index]
+        if fence is not None:
+            GL.glClientWaitSync(fence, GL.GL_SYNC_FLUSH_COMMANDS_BIT, GL.GL_TIMEOUT_IGNORED)
+            GL.glDeleteSync(fence)
+            self.fences[index] = None
+        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, self.buffers[index])
+        # data of types that the GL cannot use are converted in the copy to the buffer
+        dtype = numpy.dtype(NUMPY_DTYPE_TO_UPLOAD_DTYPE.get(data.dtype.type, data.dtype))
+        try:
+            nbytes = data.size * dtype.itemsize
+            if nbytes > self.sizes[index]:
+                GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, nbytes, None, GL.GL_STREAM_DRAW)
+                self.sizes[index] = nbytes
+            address = GL.glMapBufferRange(GL.GL_PIXEL_UNPACK_BUFFER, 0, nbytes,
+                GL.GL_MAP_WRITE_BIT | GL.GL_MAP_INVALIDATE_BUFFER_BIT)
+            address = ctypes.cast(address, ctypes.c_void_p).value
+            if not address:
+                raise RuntimeError('Failed to map pixel buffer object.')
+            try:
+                # the GL wants rows of interleaved channels, packed: i.e. a (x, y[, c]) array with
+                # channels varying fastest, then x, then y.
+                w, h = data.shape[:2]
+                channels = 1 if data.ndim == 2 else data.shape[2]
+                item = dtype.itemsize
+                strides = (channels*item, w*channels*item, item)[:data.ndim]
+                buffer = (ctypes.c_char * nbytes).from_address(address)
+                with numpy.errstate(over='ignore'):
+                    numpy.ndarray(data.shape, dtype, buffer=buffer, strides=strides)[...] = data
+            finally:
+                if not GL.glUnmapBuffer(GL.GL_PIXEL_UNPACK_BUFFER):
+                    raise RuntimeError('Pixel buffer object contents were lost during upload.')
+            GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, x, y, w, h, source_format, source_type, ctypes.c_void_p(0))
+            self.fences[index] = GL.glFenceSync(GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        finally:
+            GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, 0)
+
+    @staticmethod
+    def supported(gl_context):
+        """Return whether the given (current) QOpenGLContext supports mapped pixel buffers and fence sync."""
+        version = gl_context.format().version()
+        return ((version >= (3, 0) or gl_context.hasExtension(b'GL_ARB_map_buffer_range')) and
+            (version >= (3, 2) or gl_context.hasExtension(b'GL_ARB_sync')))
+
+
+def _union_region(a, b):
+    """Return the smallest (x, y, w, h) region containing regions a and b, where None is the whole image."""
+    if a is None or b is None:
+        return None
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    w = max(a[0] + a[2], b[0] + b[2]) - x
+    h = max(a[1] + a[3], b[1] + b[3]) - y
+    return x, y, w, h
+
+
+class UploadQueue:
+    """Uploads waiting for the background upload threads, of which there are UPLOAD_THREAD_COUNT, each with its
+    own OpenGL context (shared with all others).
+
+    Uploads start in order of the priority of their textures (see AsyncTexture.priority), and then in the
+    order submitted, so that e.g. the focused layer's image need not wait for prefetched images or for the
+    layers of other windows. Changing the priority of a texture with a queued upload moves the upload
+    accordingly. Only one upload per texture is queued: a newer upload to the same texture replaces (or, for
+    partial uploads, is merged with) the queued one, so that the queue cannot grow faster than uploads
+    complete and only the newest image is uploaded. Uploads to a given texture are never run concurrently,
+    so that they complete in order.
+    """
+    _INSTANCE = None
+
+    @classmethod
+    def get(cls):
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
+
+    def __init__(self, thread_count=UPLOAD_THREAD_COUNT):
+        self.pending_uploads = {} # texture -> upload args
+        self.dropped_uploads = 0 # pending uploads replaced by a newer full upload
+        self.merged_uploads = 0 # partial uploads combined with a pending upload
+        self.running = True
+        self._condition = threading.Condition()
+        self._heap = [] # (priority, sequence number, texture); entries not in _queued are stale
+        self._queued = {} # texture -> its current heap entry
+        self._sequence = itertools.count()
+        self._active = set() # textures being uploaded
+        self._blocked = set() # textures with a pending upload that must wait for an active one
+        self.threads = [OffscreenContextThread(self) for i in range(thread_count)]
+
+    def enqueue_upload(self, texture, data, source_format, source_type, upload_region, serial):
+        with self._condition:
+            pending = self.pending_uploads.get(texture)
+            if pending is None:
+                self._push(texture)
+            elif upload_region is None:
+                self.dropped_uploads += 1
+            else:
+                self.merged_uploads += 1
+                upload_region = _union_region(pending[3], upload_region)
+            self.pending_uploads[texture] = data, source_format, source_type, upload_region, serial
+
+    def reprioritize(self, texture):
+        """Move the queued upload of texture, if any, to reflect a change in texture.priority."""
+        with self._condition:
+            entry = self._queued.get(texture)
+            if entry is not None and entry[0] != texture.priority:
+                self._push(texture)
+
+    def cancel(self, texture):
+        """Drop the queued upload of texture, if any, and wait for an upload of it that has already started
+        (if any) to complete."""
+        with self._condition:
+            self.pending_uploads.pop(texture, None)
+            self._queued.pop(texture, None) # its heap entry is now stale
+            self._blocked.discard(texture)
+            while texture in self._active:
+                self._condition.wait()
+
+    def is_active(self, texture):
+        """Return whether an upload thread is uploading to texture."""
+        with self._condition:
+            return texture in self._active
+
+    def stop(self):
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+
+    def _push(self, texture):
+        # called with self._condition held
+        entry = texture.priority, next(self._sequence), texture
+        self._queued[texture] = entry
+        heapq.heappush(self._heap, entry)
+        self._condition.notify()
+
+    def _next_upload(self):
+        """Wait for the most urgent upload that can start, and return its texture and upload args, or None if
+        the queue has been stopped."""
+        with self._condition:
+            while self.running:
+                while self._heap:
+                    entry = heapq.heappop(self._heap)
+                    texture = entry[2]
+                    if self._queued.get(texture) is not entry:
+                        continue # superseded by a reprioritized entry
+                    del self._queued[texture]
+                    if texture in self._active:
+                        # another thread is uploading to texture: requeue this upload when it is done
+                        self._blocked.add(texture)
+                        continue
+                    self._active.add(texture)
+                    return texture, self.pending_uploads.pop(texture)
+                self._condition.wait()
+
+    def _upload_done(self, texture):
+        with self._condition:
+            self._active.discard(texture)
+            if texture in self._blocked:
+                self._blocked.discard(texture)
+                self._push(texture)
+            # wake any cancel() waiting for this upload, as well as the upload threads
+            self._condition.notify_all()
+
+
+class OffscreenContextThread(Qt.QThread):
+    """A background upload thread, which runs the uploads of an UploadQueue."""
+    def __init__(self, upload_queue):
         super().__init__()
+        self.upload_queue = upload_queue
         self.offscreen_surface = Qt.QOffscreenSurface()
         self.offscreen_surface.setFormat(shared_resources.GL_QSURFACE_FORMAT)
         self.offscreen_surface.create()
-        self.queue = queue.Queue()
-        self.running = True
+        self.pixel_buffers = None
+        self.mipmap_framebuffers = None
         self.start()
 
-    def enqueue(self, func, *args):
-        self.queue.put((func, args))
-
     def run(self):
         gl_context = Qt.QOpenGLContext()
         gl_context.setShareContext(Qt.QOpenGLContext.globalShareContext())
@@ -164,12 +1178,19 @@ class OffscreenContextThread(Qt.QThread):
             raise RuntimeError('Failed to create OpenGL context for background texture upload thread.')
         gl_context.makeCurrent(self.offscreen_surface)
         GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        if USE_PIXEL_BUFFERS and PixelBufferRing.supported(gl_context):
+            self.pixel_buffers = PixelBufferRing()
+        if MipmapFramebuffers.supported(gl_context):
+            self.mipmap_framebuffers = MipmapFramebuffers()
         try:
-            while self.running:
-                func, args = self.queue.get()
-                if not self.running:
-                    # self.running may go to false while blocked waiting on the queue
+            while True:
+                upload = self.upload_queue._next_upload()
+                if upload is None:
                     break
-                func(*args)
+                texture, upload_args = upload
+                try:
+                    texture._upload_bg(self, *upload_args)
+                finally:
+                    self.upload_queue._upload_done(texture)
         finally:
-            gl_context.doneCurrent()
\ No newline at end of file
+            gl_context.doneCurrent()
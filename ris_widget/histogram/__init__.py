@@ -1 +1,2 @@
-from .histogram import histogram
\ No newline at end of file
+from .histogram import histogram, channel_histograms, min_max, percentiles, FLOAT_DTYPES
+from .cache import HistogramCache
\ No newline at end of file
@@ -7,11 +7,59 @@
    we can learn about Py_DEBUG from pyconfig.h, but it is unclear if
    the same works for the other two macros.  Py_DEBUG implies them,
    but not the other way around.
+
+   The implementation is messy (issue #350): on Windows, with _MSC_VER,
+   we have to define Py_LIMITED_API even before including pyconfig.h.
+   In that case, we guess what pyconfig.h will do to the macros above,
+   and check our guess after the #include.
+
+   Note that on Windows, with CPython 3.x, you need >= 3.5 and virtualenv
+   version >= 16.0.0.  With older versions of either, you don't get a
+   copy of PYTHON3.DLL in the virtualenv.  We can't check the version of
+   CPython *before* we even include pyconfig.h.  ffi.set_source() puts
+   a ``#define _CFFI_NO_LIMITED_API'' at the start of this file if it is
+   running on Windows < 3.5, as an attempt at fixing it, but that's
+   arguably wrong because it may not be the target version of Python.
+   Still better than nothing I guess.  As another workaround, you can
+   remove the definition of Py_LIMITED_API here.
+
+   See also 'py_limited_api' in cffi/setuptools_ext.py.
 */
-#ifndef _CFFI_USE_EMBEDDING
-#  include <pyconfig.h>
-#  if !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG)
-#    define Py_LIMITED_API
+#if !defined(_CFFI_USE_EMBEDDING) && !defined(Py_LIMITED_API)
+#  ifdef _MSC_VER
+#    if !defined(_DEBUG) && !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+
+#    include <pyconfig.h>
+     /* sanity-check: Py_LIMITED_API will cause crashes if any of these
+        are also defined.  Normally, the Python file PC/pyconfig.h does not
+        cause any of these to be defined, with the exception that _DEBUG
+        causes Py_DEBUG.  Double-check that. */
+#    ifdef Py_LIMITED_API
+#      if defined(Py_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_TRACE_REFS)
+#        error "pyconfig.h unexpectedly defines Py_TRACE_REFS, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_REF_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_REF_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#    endif
+#  else
+#    include <pyconfig.h>
+#    if !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
 #  endif
 #endif
 
@@ -20,6 +68,9 @@
 extern "C" {
 #endif
 #include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+
 
 /* This part is from file 'cffi/parse_c_type.h'.  It is copied at the
    beginning of C sources generated by CFFI's ffi.set_source(). */
@@ -101,8 +152,12 @@ typedef void *_cffi_opcode_t;
 #define _CFFI_PRIM_UINT_FAST64  45
 #define _CFFI_PRIM_INTMAX       46
 #define _CFFI_PRIM_UINTMAX      47
+#define _CFFI_PRIM_FLOATCOMPLEX 48
+#define _CFFI_PRIM_DOUBLECOMPLEX 49
+#define _CFFI_PRIM_CHAR16       50
+#define _CFFI_PRIM_CHAR32       51
 
-#define _CFFI__NUM_PRIM         48
+#define _CFFI__NUM_PRIM         52
 #define _CFFI__UNKNOWN_PRIM           (-1)
 #define _CFFI__UNKNOWN_FLOAT_PRIM     (-2)
 #define _CFFI__UNKNOWN_LONG_DOUBLE    (-3)
@@ -238,11 +293,15 @@ static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
     typedef unsigned char _Bool;
 #  endif
 # endif
+# define _cffi_float_complex_t   _Fcomplex    /* include <complex.h> for it */
+# define _cffi_double_complex_t  _Dcomplex    /* include <complex.h> for it */
 #else
 # include <stdint.h>
 # if (defined (__SVR4) && defined (__sun)) || defined(_AIX) || defined(__hpux)
 #  include <alloca.h>
 # endif
+# define _cffi_float_complex_t   float _Complex
+# define _cffi_double_complex_t  double _Complex
 #endif
 
 #ifdef __GNUC__
@@ -261,16 +320,13 @@ static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
 #ifndef PYPY_VERSION
 
 
-#if PY_MAJOR_VERSION >= 3
-# define PyInt_FromLong PyLong_FromLong
-#endif
-
 #define _cffi_from_c_double PyFloat_FromDouble
 #define _cffi_from_c_float PyFloat_FromDouble
-#define _cffi_from_c_long PyInt_FromLong
+#define _cffi_from_c_long PyLong_FromLong
 #define _cffi_from_c_ulong PyLong_FromUnsignedLong
 #define _cffi_from_c_longlong PyLong_FromLongLong
 #define _cffi_from_c_ulonglong PyLong_FromUnsignedLongLong
+#define _cffi_from_c__Bool PyBool_FromLong
 
 #define _cffi_to_c_double PyFloat_AsDouble
 #define _cffi_to_c_float PyFloat_AsDouble
@@ -278,12 +334,12 @@ static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
 #define _cffi_from_c_int(x, type)                                        \
     (((type)-1) > 0 ? /* unsigned */                                     \
         (sizeof(type) < sizeof(long) ?                                   \
-            PyInt_FromLong((long)x) :                                    \
+            PyLong_FromLong((long)x) :                                   \
          sizeof(type) == sizeof(long) ?                                  \
             PyLong_FromUnsignedLong((unsigned long)x) :                  \
             PyLong_FromUnsignedLongLong((unsigned long long)x)) :        \
         (sizeof(type) <= sizeof(long) ?                                  \
-            PyInt_FromLong((long)x) :                                    \
+            PyLong_FromLong((long)x) :                                   \
             PyLong_FromLongLong((long long)x)))
 
 #define _cffi_to_c_int(o, type)                                          \
@@ -335,9 +391,9 @@ static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
 #define _cffi_from_c_struct                                              \
     ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[18])
 #define _cffi_to_c_wchar_t                                               \
-    ((wchar_t(*)(PyObject *))_cffi_exports[19])
+    ((_cffi_wchar_t(*)(PyObject *))_cffi_exports[19])
 #define _cffi_from_c_wchar_t                                             \
-    ((PyObject *(*)(wchar_t))_cffi_exports[20])
+    ((PyObject *(*)(_cffi_wchar_t))_cffi_exports[20])
 #define _cffi_to_c_long_double                                           \
     ((long double(*)(PyObject *))_cffi_exports[21])
 #define _cffi_to_c__Bool                                                 \
@@ -350,7 +406,11 @@ static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
 #define _CFFI_CPIDX  25
 #define _cffi_call_python                                                \
     ((void(*)(struct _cffi_externpy_s *, char *))_cffi_exports[_CFFI_CPIDX])
-#define _CFFI_NUM_EXPORTS 26
+#define _cffi_to_c_wchar3216_t                                           \
+    ((int(*)(PyObject *))_cffi_exports[26])
+#define _cffi_from_c_wchar3216_t                                         \
+    ((PyObject *(*)(int))_cffi_exports[27])
+#define _CFFI_NUM_EXPORTS 28
 
 struct _cffi_ctypedescr;
 
@@ -391,6 +451,94 @@ static PyObject *_cffi_init(const char *module_name, Py_ssize_t version,
     return NULL;
 }
 
+
+#ifdef HAVE_WCHAR_H
+typedef wchar_t _cffi_wchar_t;
+#else
+typedef uint16_t _cffi_wchar_t;   /* same random pick as _cffi_backend.c */
+#endif
+
+_CFFI_UNUSED_FN static uint16_t _cffi_to_c_char16_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return (uint16_t)_cffi_to_c_wchar_t(o);
+    else
+        return (uint16_t)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char16_t(uint16_t x)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+_CFFI_UNUSED_FN static int _cffi_to_c_char32_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return (int)_cffi_to_c_wchar_t(o);
+    else
+        return (int)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char32_t(unsigned int x)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+union _cffi_union_alignment_u {
+    unsigned char m_char;
+    unsigned short m_short;
+    unsigned int m_int;
+    unsigned long m_long;
+    unsigned long long m_longlong;
+    float m_float;
+    double m_double;
+    long double m_longdouble;
+};
+
+struct _cffi_freeme_s {
+    struct _cffi_freeme_s *next;
+    union _cffi_union_alignment_u alignment;
+};
+
+_CFFI_UNUSED_FN static int
+_cffi_convert_array_argument(struct _cffi_ctypedescr *ctptr, PyObject *arg,
+                             char **output_data, Py_ssize_t datasize,
+                             struct _cffi_freeme_s **freeme)
+{
+    char *p;
+    if (datasize < 0)
+        return -1;
+
+    p = *output_data;
+    if (p == NULL) {
+        struct _cffi_freeme_s *fp = (struct _cffi_freeme_s *)PyObject_Malloc(
+            offsetof(struct _cffi_freeme_s, alignment) + (size_t)datasize);
+        if (fp == NULL)
+            return -1;
+        fp->next = *freeme;
+        *freeme = fp;
+        p = *output_data = (char *)&fp->alignment;
+    }
+    memset((void *)p, 0, (size_t)datasize);
+    return _cffi_convert_array_from_object(p, ctptr, arg);
+}
+
+_CFFI_UNUSED_FN static void
+_cffi_free_array_arguments(struct _cffi_freeme_s *freeme)
+{
+    do {
+        void *p = (void *)freeme;
+        freeme = freeme->next;
+        PyObject_Free(p);
+    } while (freeme != NULL);
+}
+
 /**********  end CPython-specific section  **********/
 #else
 _CFFI_UNUSED_FN
@@ -430,179 +578,404 @@ static void (*_cffi_call_python_org)(struct _cffi_externpy_s *, char *);
 
 /************************************************************/
 
+// This code is licensed under the MIT License (see LICENSE file for details)
+
 #include <inttypes.h>
 #include <math.h>
-
-void hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint8_t *min, uint8_t *max) {
-    uint8_t working_min = 255;
-    uint8_t working_max = 0;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            histogram[val]++;
+#include <stddef.h>
+#include <string.h>
+
+// uint16_t (image dimensions and mask spans), uint32_t (byte strides) and uint32_t (histogram bin counts)
+// are filled in by build_histogram.py, which compiles each kernel once with narrow types for ordinary
+// images and once more, with a "_wide" suffix, with types large enough for any image.
+
+// The integral kernels count consecutive pixels in SUB_HISTS interleaved sub-histograms, which are summed
+// at the end. Counting every pixel in the same histogram stalls whenever neighboring pixels fall in the
+// same bin (as is common in dark backgrounds), as each increment must wait for the previous one to be
+// stored. Rows of contiguous pixels are read through typed pointers, and their min and max are found in a
+// separate pass over each row while it is in cache, which the compiler can vectorize. Out-of-range values
+// are counted in a discard bin past the end of each sub-histogram, rather than branched around.
+// This is a trade-off for uint16 images: those with dark backgrounds or little variation are histogrammed
+// about 2.5 times as fast as by counting every pixel in one histogram, but uniformly distributed values,
+// which rarely repeat a bin, about 10% more slowly.
+// Unranged uint16 histograms have UINT16_BINS bins (shift is image_bits - 10); values beyond image_bits
+// are discarded. Ranged uint16 histograms may have at most UINT16_BINS bins.
+// int16 images are histogrammed by the uint16 kernels with offset binning: each value is xored with flip
+// (INT16_FLIP, rather than 0, for int16 images), which maps int16 values in order onto uint16 values (value +
+// 32768), so that the bins and min and max are those of the offset values.
+
+#define SUB_HISTS 4
+#define UINT8_BINS 256
+#define UINT16_BINS 1024
+#define INT16_FLIP 0x8000
+
+// bin_uint8 holds the bin (or discard bin) of each uint8 value
+static inline void row_hist_uint8(const char *row, size_t n, uint32_t c_stride, const uint16_t *bin_uint8,
+    uint32_t *sub_hists, uint8_t *min, uint8_t *max) {
+    uint32_t *h0 = sub_hists, *h1 = h0 + UINT8_BINS + 1, *h2 = h1 + UINT8_BINS + 1, *h3 = h2 + UINT8_BINS + 1;
+    uint8_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint8_t)) {
+        const uint8_t *p = (const uint8_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[bin_uint8[p[i]]]++;
+            h1[bin_uint8[p[i+1]]]++;
+            h2[bin_uint8[p[i+2]]]++;
+            h3[bin_uint8[p[i+3]]]++;
+        }
+        for (; i < n; i++) h0[bin_uint8[p[i]]]++;
+        for (i = 0; i < n; i++) {
+            working_min = p[i] < working_min ? p[i] : working_min;
+            working_max = p[i] > working_max ? p[i] : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint8_t val0 = *(const uint8_t *) pixel, val1 = *(const uint8_t *) (pixel + c_stride),
+                val2 = *(const uint8_t *) (pixel + 2*c_stride), val3 = *(const uint8_t *) (pixel + 3*c_stride);
+            h0[bin_uint8[val0]]++;
+            h1[bin_uint8[val1]]++;
+            h2[bin_uint8[val2]]++;
+            h3[bin_uint8[val3]]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint8_t val = *(const uint8_t *) pixel;
+            h0[bin_uint8[val]]++;
             if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+            if (val > working_max) working_max = val;
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void ranged_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
-    uint8_t working_min = 255;
-    uint8_t working_max = 0;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            if (val >= hist_min && val <= hist_max) histogram[val - hist_min]++;
+static inline uint16_t shifted_bin_uint16(uint16_t val, uint8_t shift) {
+    uint16_t bin = val >> shift;
+    return bin < UINT16_BINS ? bin : UINT16_BINS;
+}
+
+static inline uint16_t ranged_bin_uint16(uint16_t val, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
+    float bin_factor) {
+    if (val >= hist_min && val < hist_max) return (uint16_t) (bin_factor * (val - hist_min));
+    return val == hist_max ? n_bins - 1 : UINT16_BINS;
+}
+
+static inline void row_hist_uint16(const char *row, size_t n, uint32_t c_stride, uint16_t flip, uint8_t shift,
+    uint32_t *sub_hists, uint16_t *min, uint16_t *max) {
+    uint32_t *h0 = sub_hists, *h1 = h0 + UINT16_BINS + 1, *h2 = h1 + UINT16_BINS + 1, *h3 = h2 + UINT16_BINS + 1;
+    uint16_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint16_t)) {
+        const uint16_t *p = (const uint16_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[shifted_bin_uint16(p[i] ^ flip, shift)]++;
+            h1[shifted_bin_uint16(p[i+1] ^ flip, shift)]++;
+            h2[shifted_bin_uint16(p[i+2] ^ flip, shift)]++;
+            h3[shifted_bin_uint16(p[i+3] ^ flip, shift)]++;
+        }
+        for (; i < n; i++) h0[shifted_bin_uint16(p[i] ^ flip, shift)]++;
+        for (i = 0; i < n; i++) {
+            uint16_t val = p[i] ^ flip;
+            working_min = val < working_min ? val : working_min;
+            working_max = val > working_max ? val : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint16_t val0 = *(const uint16_t *) pixel ^ flip, val1 = *(const uint16_t *) (pixel + c_stride) ^ flip,
+                val2 = *(const uint16_t *) (pixel + 2*c_stride) ^ flip, val3 = *(const uint16_t *) (pixel + 3*c_stride) ^ flip;
+            h0[shifted_bin_uint16(val0, shift)]++;
+            h1[shifted_bin_uint16(val1, shift)]++;
+            h2[shifted_bin_uint16(val2, shift)]++;
+            h3[shifted_bin_uint16(val3, shift)]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint16_t val = *(const uint16_t *) pixel ^ flip;
+            h0[shifted_bin_uint16(val, shift)]++;
             if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+            if (val > working_max) working_max = val;
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void masked_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t *min, uint8_t *max) {
-        // ends are exclusive bounds
-    uint8_t working_min = 255;
-    uint8_t working_max = 0;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            histogram[val]++;
+static inline void row_ranged_hist_uint16(const char *row, size_t n, uint32_t c_stride, uint16_t flip, uint16_t n_bins,
+    uint16_t hist_min, uint16_t hist_max, float bin_factor, uint32_t *sub_hists, uint16_t *min, uint16_t *max) {
+    uint32_t *h0 = sub_hists, *h1 = h0 + UINT16_BINS + 1, *h2 = h1 + UINT16_BINS + 1, *h3 = h2 + UINT16_BINS + 1;
+    uint16_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint16_t)) {
+        const uint16_t *p = (const uint16_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[ranged_bin_uint16(p[i] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h1[ranged_bin_uint16(p[i+1] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h2[ranged_bin_uint16(p[i+2] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h3[ranged_bin_uint16(p[i+3] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+        }
+        for (; i < n; i++) h0[ranged_bin_uint16(p[i] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+        for (i = 0; i < n; i++) {
+            uint16_t val = p[i] ^ flip;
+            working_min = val < working_min ? val : working_min;
+            working_max = val > working_max ? val : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint16_t val0 = *(const uint16_t *) pixel ^ flip, val1 = *(const uint16_t *) (pixel + c_stride) ^ flip,
+                val2 = *(const uint16_t *) (pixel + 2*c_stride) ^ flip, val3 = *(const uint16_t *) (pixel + 3*c_stride) ^ flip;
+            h0[ranged_bin_uint16(val0, n_bins, hist_min, hist_max, bin_factor)]++;
+            h1[ranged_bin_uint16(val1, n_bins, hist_min, hist_max, bin_factor)]++;
+            h2[ranged_bin_uint16(val2, n_bins, hist_min, hist_max, bin_factor)]++;
+            h3[ranged_bin_uint16(val3, n_bins, hist_min, hist_max, bin_factor)]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint16_t val = *(const uint16_t *) pixel ^ flip;
+            h0[ranged_bin_uint16(val, n_bins, hist_min, hist_max, bin_factor)]++;
             if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+            if (val > working_max) working_max = val;
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void masked_ranged_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
-        // ends are exclusive bounds
-    uint8_t working_min = 255;
-    uint8_t working_max = 0;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            if (val >= hist_min && val <= hist_max) histogram[val - hist_min]++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
-        }
+static inline void merge_sub_hists(const uint32_t *sub_hists, uint16_t sub_hist_bins, uint16_t n_bins, uint32_t *histogram) {
+    // each sub-histogram has sub_hist_bins bins, plus the discard bin
+    uint16_t bin;
+    uint8_t s;
+    for (s = 0; s < SUB_HISTS; s++) {
+        for (bin = 0; bin < n_bins; bin++) histogram[bin] += sub_hists[s*(sub_hist_bins + 1) + bin];
     }
-    *min = working_min;
-    *max = working_max;
 }
 
-void hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
-    uint16_t working_min = 65535;
-    uint16_t working_max = 0;
-    const char *row_start, *pixel;
+static void hist_uint8_impl(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t hist_min, uint8_t hist_max,
+    uint8_t *min, uint8_t *max) {
+    // starts and ends may be NULL for no mask; ends are exclusive bounds
+    uint32_t sub_hists[SUB_HISTS*(UINT8_BINS + 1)] = {0};
+    uint16_t bin_uint8[UINT8_BINS];
+    uint8_t working_min = UINT8_MAX, working_max = 0;
+    const char *row_start;
+    uint16_t start, end;
+    unsigned val;
+    for (val = 0; val < UINT8_BINS; val++) bin_uint8[val] = val >= hist_min && val <= hist_max ? val - hist_min : UINT8_BINS;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            histogram[val >> shift]++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
-        }
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        row_hist_uint8(row_start + start*c_stride, end - start, c_stride, bin_uint8, sub_hists, &working_min, &working_max);
     }
+    merge_sub_hists(sub_hists, UINT8_BINS, UINT8_BINS, histogram);
     *min = working_min;
     *max = working_max;
 }
 
-void ranged_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
-    uint16_t working_min = 65535;
-    uint16_t working_max = 0;
-    const char *row_start, *pixel;
-    float bin_factor = (float) n_bins / (hist_max - hist_min);
-    uint32_t *last_bin = histogram + n_bins - 1;
+static void hist_uint16_impl(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t flip, uint8_t ranged, uint8_t shift,
+    uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
+    // starts and ends may be NULL for no mask; ends are exclusive bounds
+    uint32_t sub_hists[SUB_HISTS*(UINT16_BINS + 1)] = {0};
+    uint16_t working_min = UINT16_MAX, working_max = 0;
+    float bin_factor = ranged ? (float) n_bins / (hist_max - hist_min) : 0;
+    const char *row_start;
+    uint16_t start, end;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            if (val >= hist_min && val < hist_max)
-                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
-            else if (val == hist_max) (*last_bin)++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
-        }
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        if (ranged) row_ranged_hist_uint16(row_start + start*c_stride, end - start, c_stride, flip, n_bins, hist_min,
+            hist_max, bin_factor, sub_hists, &working_min, &working_max);
+        else row_hist_uint16(row_start + start*c_stride, end - start, c_stride, flip, shift, sub_hists, &working_min,
+            &working_max);
     }
+    merge_sub_hists(sub_hists, UINT16_BINS, ranged ? n_bins : UINT16_BINS, histogram);
     *min = working_min;
     *max = working_max;
 }
 
+void hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    uint32_t *histogram, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, UINT8_MAX, min, max);
+}
+
+void ranged_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    uint32_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, hist_min, hist_max, min, max);
+}
+
+void masked_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, UINT8_MAX, min, max);
+}
+
+void masked_ranged_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, hist_min, hist_max, min, max);
+}
+
+void hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    uint32_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, 0, shift, 0, 0, 0, min, max);
+}
+
+void ranged_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    uint32_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, 1, 0, n_bins, hist_min, hist_max, min, max);
+}
+
 void masked_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
     const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
-        // ends are exclusive bounds
-    uint16_t working_min = 65535;
-    uint16_t working_max = 0;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            histogram[val >> shift]++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
-        }
-    }
-    *min = working_min;
-    *max = working_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, 0, shift, 0, 0, 0, min, max);
 }
 
 void masked_ranged_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
     const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
     uint16_t *min, uint16_t *max) {
-        // ends are exclusive bounds
-    uint16_t working_min = 255;
-    uint16_t working_max = 0;
-    const char *row_start, *pixel;
-    float bin_factor = (float) n_bins / (hist_max - hist_min);
-    uint32_t *last_bin = histogram + n_bins - 1;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            if (val >= hist_min && val < hist_max)
-                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
-            else if (val == hist_max) (*last_bin)++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, 1, 0, n_bins, hist_min, hist_max, min, max);
+}
+
+// min and max are flipped back from offset values; hist_min and hist_max are flipped to them.
+
+void hist_int16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    uint32_t *histogram, uint8_t shift, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, INT16_FLIP, 0, shift, 0, 0, 0,
+        &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void ranged_hist_int16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    uint32_t *histogram, uint16_t n_bins, int16_t hist_min, int16_t hist_max, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, INT16_FLIP, 1, 0, n_bins,
+        (uint16_t) hist_min ^ INT16_FLIP, (uint16_t) hist_max ^ INT16_FLIP, &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void masked_hist_int16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t shift, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, INT16_FLIP, 0, shift, 0, 0, 0,
+        &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void masked_ranged_hist_int16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t n_bins, int16_t hist_min, int16_t hist_max,
+    int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, INT16_FLIP, 1, 0, n_bins,
+        (uint16_t) hist_min ^ INT16_FLIP, (uint16_t) hist_max ^ INT16_FLIP, &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+// The min and max alone, of uint16 values or, with flip INT16_FLIP, of offset int16 values (as for the
+// histogram kernels). starts and ends may be NULL for no mask; ends are exclusive bounds.
+void minmax_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint16_t flip, uint16_t *min, uint16_t *max) {
+    uint16_t working_min = UINT16_MAX, working_max = 0;
+    const char *row_start;
+    uint16_t start, end;
+    size_t i, n;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        n = end - start;
+        if (c_stride == sizeof(uint16_t)) {
+            // (integer min and max reductions may be reordered, so the compiler can vectorize this loop)
+            const uint16_t *p = (const uint16_t *) row_start + start;
+            for (i = 0; i < n; i++) {
+                uint16_t val = p[i] ^ flip;
+                working_min = val < working_min ? val : working_min;
+                working_max = val > working_max ? val : working_max;
+            }
+        } else {
+            const char *pixel = row_start + start*c_stride;
+            for (i = 0; i < n; i++, pixel += c_stride) {
+                uint16_t val = *(const uint16_t *) pixel ^ flip;
+                if (val < working_min) working_min = val;
+                if (val > working_max) working_max = val;
+            }
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
+// Contiguous rows are scanned in MINMAX_LANES independent lanes, which the compiler can vectorize (a single
+// running min and max cannot be, as floating-point min and max reductions may not be reordered).
+#define MINMAX_LANES 8
+
 void minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
     float *min, float *max) {
-    float working_min = INFINITY;
-    float working_max = -INFINITY;
+    float working_min = *(float *) image;
+    float working_max = *(float *) image;
+    float lane_mins[MINMAX_LANES], lane_maxs[MINMAX_LANES];
     const char *row_start, *pixel;
+    size_t i, lane;
+    for (lane = 0; lane < MINMAX_LANES; lane++) lane_mins[lane] = lane_maxs[lane] = working_min;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
+        if (c_stride == sizeof(float)) {
+            const float *p = (const float *) row_start;
+            for (i = 0; i + MINMAX_LANES <= cols; i += MINMAX_LANES) {
+                for (lane = 0; lane < MINMAX_LANES; lane++) {
+                    lane_mins[lane] = p[i+lane] < lane_mins[lane] ? p[i+lane] : lane_mins[lane];
+                    lane_maxs[lane] = p[i+lane] > lane_maxs[lane] ? p[i+lane] : lane_maxs[lane];
+                }
+            }
+            pixel = row_start + i*c_stride;
+        } else {
+            pixel = row_start;
+        }
+        for (; pixel != row_start + cols*c_stride; pixel += c_stride) {
             float val = *(float *) pixel;
             if (val < working_min) working_min = val;
             else if (val > working_max) working_max = val;
         }
     }
+    for (lane = 0; lane < MINMAX_LANES; lane++) {
+        if (lane_mins[lane] < working_min) working_min = lane_mins[lane];
+        if (lane_maxs[lane] > working_max) working_max = lane_maxs[lane];
+    }
     *min = working_min;
     *max = working_max;
 }
 
 void masked_minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
     const uint16_t *starts, const uint16_t *ends, float *min, float *max) {
-        // ends are exclusive bounds
-    float working_min = INFINITY;
-    float working_max = -INFINITY;
+    // ends are exclusive bounds
+    float working_min, working_max;
+    working_min = working_max = *(float *) (image + (*starts)*c_stride);
     const char *row_start, *pixel;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
         for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
@@ -616,7 +989,9 @@ void masked_minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32
 }
 
 void ranged_hist_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint16_t n_bins, float hist_min, float hist_max) {
+    uint32_t *histogram, uint16_t n_bins, float hist_min, float hist_max, float *min, float *max) {
+    float working_min = *(float *) image;
+    float working_max = *(float *) image;
     const char *row_start, *pixel;
     float bin_factor = (float) n_bins / (hist_max - hist_min);
     uint32_t *last_bin = histogram + n_bins - 1;
@@ -626,13 +1001,21 @@ void ranged_hist_float(const char *image, uint16_t rows, uint16_t cols, uint32_t
             if (val >= hist_min && val < hist_max)
                 histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
             else if (val == hist_max) (*last_bin)++;
+
+            if (val < working_min) working_min = val;
+            else if (val > working_max) working_max = val;
         }
     }
+    *min = working_min;
+    *max = working_max;
 }
 
 void masked_ranged_hist_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t n_bins, float hist_min, float hist_max) {
-        // ends are exclusive bounds
+    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t n_bins, float hist_min, float hist_max,
+    float *min, float *max) {
+    // ends are exclusive bounds
+    float working_min, working_max;
+    working_min = working_max = *(float *) (image + (*starts)*c_stride);
     const char *row_start, *pixel;
     float bin_factor = (float) n_bins / (hist_max - hist_min);
     uint32_t *last_bin = histogram + n_bins - 1;
@@ -642,287 +1025,5693 @@ void masked_ranged_hist_float(const char *image, uint16_t rows, uint16_t cols, u
             if (val >= hist_min && val < hist_max)
                 histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
             else if (val == hist_max) (*last_bin)++;
+
+            if (val < working_min) working_min = val;
+            else if (val > working_max) working_max = val;
         }
     }
+    *min = working_min;
+    *max = working_max;
 }
 
-/************************************************************/
+// Multichannel kernels: each pixel has n_channels (at most 4) components, ch_stride bytes apart. For each
+// channel, the min, max and (if histograms is not NULL) histogram are accumulated in one pass; histograms
+// holds n_channels consecutive histograms of n_bins each, each followed by a discard bin for values
+// outside the histogram (as is luma_histogram). If luma_histogram is not NULL, the CIE 1931
+// linear luminance of the first three channels is also calculated and histogrammed on the fly, with
+// the same arithmetic as the equivalent numpy expression. starts and ends may be NULL for no mask.
+// As for a single channel, int16 images are histogrammed by the uint16 kernel, with offset binning.
+
+void channel_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t ch_stride, uint8_t n_channels,
+    uint32_t *histograms, uint32_t *luma_histogram, uint8_t hist_min, uint8_t hist_max,
+    uint8_t *mins, uint8_t *maxs, uint8_t *luma_min, uint8_t *luma_max) {
+    // ends are exclusive bounds
+    uint8_t working_mins[4] = {UINT8_MAX, UINT8_MAX, UINT8_MAX, UINT8_MAX}, working_maxs[4] = {0, 0, 0, 0};
+    uint8_t working_luma_min = UINT8_MAX, working_luma_max = 0;
+    const char *row_start, *pixel, *row_end;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                uint8_t val = *(uint8_t *) (pixel + c*ch_stride);
+                if (histograms && val >= hist_min && val <= hist_max) histograms[c*(UINT8_BINS + 1) + val - hist_min]++;
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma_histogram) {
+                uint8_t val = (uint8_t) (0.2126 * *(uint8_t *) pixel + 0.7152 * *(uint8_t *) (pixel + ch_stride) +
+                    0.0722 * *(uint8_t *) (pixel + 2*ch_stride));
+                if (val >= hist_min && val <= hist_max) luma_histogram[val - hist_min]++;
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
 
-static void *_cffi_types[] = {
-/*  0 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, float *, float *)
-/*  1 */ _CFFI_OP(_CFFI_OP_POINTER, 144), // char const *
-/*  2 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20), // uint16_t
-/*  3 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/*  4 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22), // uint32_t
-/*  5 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/*  6 */ _CFFI_OP(_CFFI_OP_POINTER, 30), // float *
-/*  7 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
-/*  8 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/*  9 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, float *, float *)
-/* 10 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 11 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 12 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 13 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 14 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 15 */ _CFFI_OP(_CFFI_OP_POINTER, 2), // uint16_t const *
-/* 16 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 17 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
-/* 18 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
-/* 19 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 20 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint16_t, float, float)
-/* 21 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 22 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 23 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 24 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 25 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 26 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 27 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 28 */ _CFFI_OP(_CFFI_OP_POINTER, 4), // uint32_t *
-/* 29 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 30 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13), // float
-/* 31 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
-/* 32 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 33 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *)
-/* 34 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 35 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 36 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 37 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 38 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 39 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 40 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 41 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 42 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 43 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 44 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 45 */ _CFFI_OP(_CFFI_OP_POINTER, 2), // uint16_t *
-/* 46 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 47 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 48 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t *, uint8_t *)
-/* 49 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 50 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 51 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 52 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 53 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 54 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 55 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 56 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 57 */ _CFFI_OP(_CFFI_OP_POINTER, 69), // uint8_t *
-/* 58 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 59 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 60 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t, uint16_t *, uint16_t *)
-/* 61 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 62 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 63 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 64 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 65 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 66 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 67 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 68 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 69 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18), // uint8_t
-/* 70 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 71 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 72 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 73 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t, uint8_t, uint8_t *, uint8_t *)
-/* 74 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 75 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 76 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 77 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 78 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 79 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 80 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
-/* 81 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 82 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
-/* 83 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
-/* 84 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 85 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 86 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 87 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint16_t, float, float)
-/* 88 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 89 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 90 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 91 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 92 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 93 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 94 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 95 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
-/* 96 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
-/* 97 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 98 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *)
-/* 99 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 100 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 101 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 102 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 103 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 104 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 105 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 106 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 107 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 108 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 109 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 110 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 111 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t *, uint8_t *)
-/* 112 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 113 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 114 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 115 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 116 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 117 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 118 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 119 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 120 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 121 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t, uint16_t *, uint16_t *)
-/* 122 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 123 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 124 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 125 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 126 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 127 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 128 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
-/* 129 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 130 */ _CFFI_OP(_CFFI_OP_NOOP, 45),
-/* 131 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 132 */ _CFFI_OP(_CFFI_OP_FUNCTION, 145), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t, uint8_t, uint8_t *, uint8_t *)
-/* 133 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
-/* 134 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 135 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
-/* 136 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 137 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
-/* 138 */ _CFFI_OP(_CFFI_OP_NOOP, 28),
-/* 139 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
-/* 140 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
-/* 141 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 142 */ _CFFI_OP(_CFFI_OP_NOOP, 57),
-/* 143 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
-/* 144 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 2), // char
-/* 145 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 0), // void
-};
+void channel_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t ch_stride, uint8_t n_channels,
+    uint32_t *histograms, uint32_t *luma_histogram, uint16_t flip, uint8_t ranged, uint8_t shift, uint16_t n_bins,
+    uint16_t hist_min, uint16_t hist_max, uint16_t *mins, uint16_t *maxs, uint16_t *luma_min, uint16_t *luma_max) {
+    // ends are exclusive bounds. Each value is first xored with flip (INT16_FLIP for int16 images, else 0). If ranged
+    // is zero, values are binned by shifting right by shift bits (and those beyond the n_bins bins, i.e. beyond
+    // image_bits, are discarded); otherwise, values in [hist_min, hist_max] are binned into n_bins equal bins.
+    uint16_t working_mins[4] = {UINT16_MAX, UINT16_MAX, UINT16_MAX, UINT16_MAX}, working_maxs[4] = {0, 0, 0, 0};
+    uint16_t working_luma_min = UINT16_MAX, working_luma_max = 0;
+    const char *row_start, *pixel, *row_end;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                uint16_t val = *(uint16_t *) (pixel + c*ch_stride) ^ flip;
+                if (histograms) {
+                    uint32_t *histogram = histograms + c*(n_bins + 1);
+                    if (!ranged) histogram[val >> shift < n_bins ? val >> shift : n_bins]++;
+                    else if (val >= hist_min && val < hist_max) histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                    else if (val == hist_max) histogram[n_bins - 1]++;
+                }
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma_histogram) {
+                uint16_t val = (uint16_t) (0.2126 * (*(uint16_t *) pixel ^ flip) +
+                    0.7152 * (*(uint16_t *) (pixel + ch_stride) ^ flip) +
+                    0.0722 * (*(uint16_t *) (pixel + 2*ch_stride) ^ flip));
+                if (!ranged) luma_histogram[val >> shift < n_bins ? val >> shift : n_bins]++;
+                else if (val >= hist_min && val < hist_max) luma_histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                else if (val == hist_max) luma_histogram[n_bins - 1]++;
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
 
-static void _cffi_d_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint8_t x6, uint16_t * x7, uint16_t * x8)
-{
-  hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+void channel_minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t ch_stride, uint8_t n_channels,
+    uint8_t luma, float *mins, float *maxs, float *luma_min, float *luma_max) {
+    // ends are exclusive bounds
+    float working_mins[4] = {INFINITY, INFINITY, INFINITY, INFINITY}, working_maxs[4] = {-INFINITY, -INFINITY, -INFINITY, -INFINITY};
+    float working_luma_min = INFINITY, working_luma_max = -INFINITY;
+    const char *row_start, *pixel, *row_end;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                float val = *(float *) (pixel + c*ch_stride);
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma) {
+                float val = 0.2126f * *(float *) pixel + 0.7152f * *(float *) (pixel + ch_stride) +
+                    0.0722f * *(float *) (pixel + 2*ch_stride);
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
 }
-#ifndef PYPY_VERSION
-static PyObject *
-_cffi_f_hist_uint16(PyObject *self, PyObject *args)
-{
-  char const * x0;
-  uint16_t x1;
-  uint16_t x2;
-  uint32_t x3;
-  uint32_t x4;
-  uint32_t * x5;
-  uint8_t x6;
-  uint16_t * x7;
-  uint16_t * x8;
-  Py_ssize_t datasize;
-  PyObject *arg0;
-  PyObject *arg1;
-  PyObject *arg2;
-  PyObject *arg3;
-  PyObject *arg4;
-  PyObject *arg5;
-  PyObject *arg6;
-  PyObject *arg7;
-  PyObject *arg8;
 
-  if (!PyArg_UnpackTuple(args, "hist_uint16", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
-    return NULL;
+void channel_hist_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
+    const uint16_t *starts, const uint16_t *ends, uint32_t ch_stride, uint8_t n_channels,
+    uint32_t *histograms, uint32_t *luma_histogram, uint16_t n_bins, float hist_min, float hist_max) {
+    // ends are exclusive bounds
+    const char *row_start, *pixel, *row_end;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            if (histograms) {
+                for (c = 0; c < n_channels; c++) {
+                    float val = *(float *) (pixel + c*ch_stride);
+                    uint32_t *histogram = histograms + c*(n_bins + 1);
+                    if (val >= hist_min && val < hist_max)
+                        histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                    else if (val == hist_max) histogram[n_bins - 1]++;
+                }
+            }
+            if (luma_histogram) {
+                float val = 0.2126f * *(float *) pixel + 0.7152f * *(float *) (pixel + ch_stride) +
+                    0.0722f * *(float *) (pixel + 2*ch_stride);
+                if (val >= hist_min && val < hist_max)
+                    luma_histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                else if (val == hist_max) luma_histogram[n_bins - 1]++;
+            }
+        }
+    }
+}
 
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(1), arg0, (char **)&x0);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
-      return NULL;
-  }
+// Copying pixels between memory layouts (e.g. to transpose an image) one row at a time reads or writes with a
+// stride of a whole row, touching a new cache line for every pixel. copy_pixels instead copies square blocks
+// of COPY_BLOCK x COPY_BLOCK pixels, whose source and destination cache lines stay in cache while each block is
+// copied. Pixels have n_channels items of item_bytes (1, 2, 4, or 8) bytes each, and the destination's channels
+// must be contiguous. Within a block, the inner loop runs along the columns, so the destination's contiguous
+// axis should be the column axis.
+
+#define COPY_BLOCK 64
+
+// item_bytes is a constant in each call, so that the memcpy calls compile to single loads and stores
+static inline void copy_block(const char *src, char *dst, uint16_t rows, uint16_t cols, uint32_t src_r_stride,
+    uint32_t src_c_stride, uint32_t src_channel_stride, uint32_t dst_r_stride, uint32_t dst_c_stride,
+    uint8_t n_channels, const size_t item_bytes) {
+    uint16_t r, c;
+    uint8_t channel;
+    for (r = 0; r < rows; r++) {
+        const char *src_pixel = src + r * src_r_stride;
+        char *dst_pixel = dst + r * dst_r_stride;
+        if (n_channels == 1) {
+            for (c = 0; c < cols; c++, src_pixel += src_c_stride, dst_pixel += dst_c_stride) {
+                memcpy(dst_pixel, src_pixel, item_bytes);
+            }
+        } else {
+            for (c = 0; c < cols; c++, src_pixel += src_c_stride, dst_pixel += dst_c_stride) {
+                for (channel = 0; channel < n_channels; channel++) {
+                    memcpy(dst_pixel + channel * item_bytes, src_pixel + channel * src_channel_stride, item_bytes);
+                }
+            }
+        }
+    }
+}
 
-  x1 = _cffi_to_c_int(arg1, uint16_t);
-  if (x1 == (uint16_t)-1 && PyErr_Occurred())
-    return NULL;
+void copy_pixels(const char *src, char *dst, uint16_t rows, uint16_t cols, uint32_t src_r_stride, uint32_t src_c_stride,
+    uint32_t src_channel_stride, uint32_t dst_r_stride, uint32_t dst_c_stride, uint8_t n_channels, uint8_t item_bytes) {
+    uint16_t r0, c0, block_rows, block_cols;
+    for (r0 = 0; r0 < rows; r0 += block_rows) {
+        block_rows = rows - r0 < COPY_BLOCK ? rows - r0 : COPY_BLOCK;
+        for (c0 = 0; c0 < cols; c0 += block_cols) {
+            const char *src_block = src + r0 * src_r_stride + c0 * src_c_stride;
+            char *dst_block = dst + r0 * dst_r_stride + c0 * dst_c_stride;
+            block_cols = cols - c0 < COPY_BLOCK ? cols - c0 : COPY_BLOCK;
+            switch (item_bytes) {
+                case 1: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 1); break;
+                case 2: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 2); break;
+                case 4: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 4); break;
+                case 8: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 8); break;
+            }
+        }
+    }
+}
 
-  x2 = _cffi_to_c_int(arg2, uint16_t);
-  if (x2 == (uint16_t)-1 && PyErr_Occurred())
-    return NULL;
+// This code is licensed under the MIT License (see LICENSE file for details)
 
-  x3 = _cffi_to_c_int(arg3, uint32_t);
-  if (x3 == (uint32_t)-1 && PyErr_Occurred())
-    return NULL;
+#include <inttypes.h>
+#include <math.h>
+#include <stddef.h>
+#include <string.h>
+
+// size_t (image dimensions and mask spans), size_t (byte strides) and uint64_t (histogram bin counts)
+// are filled in by build_histogram.py, which compiles each kernel once with narrow types for ordinary
+// images and once more, with a "_wide" suffix, with types large enough for any image.
+
+// The integral kernels count consecutive pixels in SUB_HISTS interleaved sub-histograms, which are summed
+// at the end. Counting every pixel in the same histogram stalls whenever neighboring pixels fall in the
+// same bin (as is common in dark backgrounds), as each increment must wait for the previous one to be
+// stored. Rows of contiguous pixels are read through typed pointers, and their min and max are found in a
+// separate pass over each row while it is in cache, which the compiler can vectorize. Out-of-range values
+// are counted in a discard bin past the end of each sub-histogram, rather than branched around.
+// This is a trade-off for uint16 images: those with dark backgrounds or little variation are histogrammed
+// about 2.5 times as fast as by counting every pixel in one histogram, but uniformly distributed values,
+// which rarely repeat a bin, about 10% more slowly.
+// Unranged uint16 histograms have UINT16_BINS bins (shift is image_bits - 10); values beyond image_bits
+// are discarded. Ranged uint16 histograms may have at most UINT16_BINS bins.
+// int16 images are histogrammed by the uint16 kernels with offset binning: each value is xored with flip
+// (INT16_FLIP, rather than 0, for int16 images), which maps int16 values in order onto uint16 values (value +
+// 32768), so that the bins and min and max are those of the offset values.
+
+#define SUB_HISTS 4
+#define UINT8_BINS 256
+#define UINT16_BINS 1024
+#define INT16_FLIP 0x8000
+
+// bin_uint8 holds the bin (or discard bin) of each uint8 value
+static inline void row_hist_uint8_wide(const char *row, size_t n, size_t c_stride, const uint16_t *bin_uint8,
+    uint64_t *sub_hists, uint8_t *min, uint8_t *max) {
+    uint64_t *h0 = sub_hists, *h1 = h0 + UINT8_BINS + 1, *h2 = h1 + UINT8_BINS + 1, *h3 = h2 + UINT8_BINS + 1;
+    uint8_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint8_t)) {
+        const uint8_t *p = (const uint8_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[bin_uint8[p[i]]]++;
+            h1[bin_uint8[p[i+1]]]++;
+            h2[bin_uint8[p[i+2]]]++;
+            h3[bin_uint8[p[i+3]]]++;
+        }
+        for (; i < n; i++) h0[bin_uint8[p[i]]]++;
+        for (i = 0; i < n; i++) {
+            working_min = p[i] < working_min ? p[i] : working_min;
+            working_max = p[i] > working_max ? p[i] : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint8_t val0 = *(const uint8_t *) pixel, val1 = *(const uint8_t *) (pixel + c_stride),
+                val2 = *(const uint8_t *) (pixel + 2*c_stride), val3 = *(const uint8_t *) (pixel + 3*c_stride);
+            h0[bin_uint8[val0]]++;
+            h1[bin_uint8[val1]]++;
+            h2[bin_uint8[val2]]++;
+            h3[bin_uint8[val3]]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint8_t val = *(const uint8_t *) pixel;
+            h0[bin_uint8[val]]++;
+            if (val < working_min) working_min = val;
+            if (val > working_max) working_max = val;
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
 
-  x4 = _cffi_to_c_int(arg4, uint32_t);
-  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+static inline uint16_t shifted_bin_uint16_wide(uint16_t val, uint8_t shift) {
+    uint16_t bin = val >> shift;
+    return bin < UINT16_BINS ? bin : UINT16_BINS;
+}
+
+static inline uint16_t ranged_bin_uint16_wide(uint16_t val, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
+    float bin_factor) {
+    if (val >= hist_min && val < hist_max) return (uint16_t) (bin_factor * (val - hist_min));
+    return val == hist_max ? n_bins - 1 : UINT16_BINS;
+}
+
+static inline void row_hist_uint16_wide(const char *row, size_t n, size_t c_stride, uint16_t flip, uint8_t shift,
+    uint64_t *sub_hists, uint16_t *min, uint16_t *max) {
+    uint64_t *h0 = sub_hists, *h1 = h0 + UINT16_BINS + 1, *h2 = h1 + UINT16_BINS + 1, *h3 = h2 + UINT16_BINS + 1;
+    uint16_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint16_t)) {
+        const uint16_t *p = (const uint16_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[shifted_bin_uint16_wide(p[i] ^ flip, shift)]++;
+            h1[shifted_bin_uint16_wide(p[i+1] ^ flip, shift)]++;
+            h2[shifted_bin_uint16_wide(p[i+2] ^ flip, shift)]++;
+            h3[shifted_bin_uint16_wide(p[i+3] ^ flip, shift)]++;
+        }
+        for (; i < n; i++) h0[shifted_bin_uint16_wide(p[i] ^ flip, shift)]++;
+        for (i = 0; i < n; i++) {
+            uint16_t val = p[i] ^ flip;
+            working_min = val < working_min ? val : working_min;
+            working_max = val > working_max ? val : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint16_t val0 = *(const uint16_t *) pixel ^ flip, val1 = *(const uint16_t *) (pixel + c_stride) ^ flip,
+                val2 = *(const uint16_t *) (pixel + 2*c_stride) ^ flip, val3 = *(const uint16_t *) (pixel + 3*c_stride) ^ flip;
+            h0[shifted_bin_uint16_wide(val0, shift)]++;
+            h1[shifted_bin_uint16_wide(val1, shift)]++;
+            h2[shifted_bin_uint16_wide(val2, shift)]++;
+            h3[shifted_bin_uint16_wide(val3, shift)]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint16_t val = *(const uint16_t *) pixel ^ flip;
+            h0[shifted_bin_uint16_wide(val, shift)]++;
+            if (val < working_min) working_min = val;
+            if (val > working_max) working_max = val;
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+static inline void row_ranged_hist_uint16_wide(const char *row, size_t n, size_t c_stride, uint16_t flip, uint16_t n_bins,
+    uint16_t hist_min, uint16_t hist_max, float bin_factor, uint64_t *sub_hists, uint16_t *min, uint16_t *max) {
+    uint64_t *h0 = sub_hists, *h1 = h0 + UINT16_BINS + 1, *h2 = h1 + UINT16_BINS + 1, *h3 = h2 + UINT16_BINS + 1;
+    uint16_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint16_t)) {
+        const uint16_t *p = (const uint16_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[ranged_bin_uint16_wide(p[i] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h1[ranged_bin_uint16_wide(p[i+1] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h2[ranged_bin_uint16_wide(p[i+2] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h3[ranged_bin_uint16_wide(p[i+3] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+        }
+        for (; i < n; i++) h0[ranged_bin_uint16_wide(p[i] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+        for (i = 0; i < n; i++) {
+            uint16_t val = p[i] ^ flip;
+            working_min = val < working_min ? val : working_min;
+            working_max = val > working_max ? val : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint16_t val0 = *(const uint16_t *) pixel ^ flip, val1 = *(const uint16_t *) (pixel + c_stride) ^ flip,
+                val2 = *(const uint16_t *) (pixel + 2*c_stride) ^ flip, val3 = *(const uint16_t *) (pixel + 3*c_stride) ^ flip;
+            h0[ranged_bin_uint16_wide(val0, n_bins, hist_min, hist_max, bin_factor)]++;
+            h1[ranged_bin_uint16_wide(val1, n_bins, hist_min, hist_max, bin_factor)]++;
+            h2[ranged_bin_uint16_wide(val2, n_bins, hist_min, hist_max, bin_factor)]++;
+            h3[ranged_bin_uint16_wide(val3, n_bins, hist_min, hist_max, bin_factor)]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint16_t val = *(const uint16_t *) pixel ^ flip;
+            h0[ranged_bin_uint16_wide(val, n_bins, hist_min, hist_max, bin_factor)]++;
+            if (val < working_min) working_min = val;
+            if (val > working_max) working_max = val;
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+static inline void merge_sub_hists_wide(const uint64_t *sub_hists, uint16_t sub_hist_bins, uint16_t n_bins, uint64_t *histogram) {
+    // each sub-histogram has sub_hist_bins bins, plus the discard bin
+    uint16_t bin;
+    uint8_t s;
+    for (s = 0; s < SUB_HISTS; s++) {
+        for (bin = 0; bin < n_bins; bin++) histogram[bin] += sub_hists[s*(sub_hist_bins + 1) + bin];
+    }
+}
+
+static void hist_uint8_impl_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint8_t hist_min, uint8_t hist_max,
+    uint8_t *min, uint8_t *max) {
+    // starts and ends may be NULL for no mask; ends are exclusive bounds
+    uint64_t sub_hists[SUB_HISTS*(UINT8_BINS + 1)] = {0};
+    uint16_t bin_uint8[UINT8_BINS];
+    uint8_t working_min = UINT8_MAX, working_max = 0;
+    const char *row_start;
+    size_t start, end;
+    unsigned val;
+    for (val = 0; val < UINT8_BINS; val++) bin_uint8[val] = val >= hist_min && val <= hist_max ? val - hist_min : UINT8_BINS;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        row_hist_uint8_wide(row_start + start*c_stride, end - start, c_stride, bin_uint8, sub_hists, &working_min, &working_max);
+    }
+    merge_sub_hists_wide(sub_hists, UINT8_BINS, UINT8_BINS, histogram);
+    *min = working_min;
+    *max = working_max;
+}
+
+static void hist_uint16_impl_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint16_t flip, uint8_t ranged, uint8_t shift,
+    uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
+    // starts and ends may be NULL for no mask; ends are exclusive bounds
+    uint64_t sub_hists[SUB_HISTS*(UINT16_BINS + 1)] = {0};
+    uint16_t working_min = UINT16_MAX, working_max = 0;
+    float bin_factor = ranged ? (float) n_bins / (hist_max - hist_min) : 0;
+    const char *row_start;
+    size_t start, end;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        if (ranged) row_ranged_hist_uint16_wide(row_start + start*c_stride, end - start, c_stride, flip, n_bins, hist_min,
+            hist_max, bin_factor, sub_hists, &working_min, &working_max);
+        else row_hist_uint16_wide(row_start + start*c_stride, end - start, c_stride, flip, shift, sub_hists, &working_min,
+            &working_max);
+    }
+    merge_sub_hists_wide(sub_hists, UINT16_BINS, ranged ? n_bins : UINT16_BINS, histogram);
+    *min = working_min;
+    *max = working_max;
+}
+
+void hist_uint8_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl_wide(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, UINT8_MAX, min, max);
+}
+
+void ranged_hist_uint8_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl_wide(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, hist_min, hist_max, min, max);
+}
+
+void masked_hist_uint8_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl_wide(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, UINT8_MAX, min, max);
+}
+
+void masked_ranged_hist_uint8_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl_wide(image, rows, cols, r_stride, c_stride, starts, ends, histogram, hist_min, hist_max, min, max);
+}
+
+void hist_uint16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, 0, shift, 0, 0, 0, min, max);
+}
+
+void ranged_hist_uint16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, 1, 0, n_bins, hist_min, hist_max, min, max);
+}
+
+void masked_hist_uint16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, 0, shift, 0, 0, 0, min, max);
+}
+
+void masked_ranged_hist_uint16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
+    uint16_t *min, uint16_t *max) {
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, 1, 0, n_bins, hist_min, hist_max, min, max);
+}
+
+// min and max are flipped back from offset values; hist_min and hist_max are flipped to them.
+
+void hist_int16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint8_t shift, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, INT16_FLIP, 0, shift, 0, 0, 0,
+        &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void ranged_hist_int16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint16_t n_bins, int16_t hist_min, int16_t hist_max, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, INT16_FLIP, 1, 0, n_bins,
+        (uint16_t) hist_min ^ INT16_FLIP, (uint16_t) hist_max ^ INT16_FLIP, &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void masked_hist_int16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint8_t shift, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, starts, ends, histogram, INT16_FLIP, 0, shift, 0, 0, 0,
+        &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void masked_ranged_hist_int16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint16_t n_bins, int16_t hist_min, int16_t hist_max,
+    int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl_wide(image, rows, cols, r_stride, c_stride, starts, ends, histogram, INT16_FLIP, 1, 0, n_bins,
+        (uint16_t) hist_min ^ INT16_FLIP, (uint16_t) hist_max ^ INT16_FLIP, &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+// The min and max alone, of uint16 values or, with flip INT16_FLIP, of offset int16 values (as for the
+// histogram kernels). starts and ends may be NULL for no mask; ends are exclusive bounds.
+void minmax_uint16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint16_t flip, uint16_t *min, uint16_t *max) {
+    uint16_t working_min = UINT16_MAX, working_max = 0;
+    const char *row_start;
+    size_t start, end;
+    size_t i, n;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        n = end - start;
+        if (c_stride == sizeof(uint16_t)) {
+            // (integer min and max reductions may be reordered, so the compiler can vectorize this loop)
+            const uint16_t *p = (const uint16_t *) row_start + start;
+            for (i = 0; i < n; i++) {
+                uint16_t val = p[i] ^ flip;
+                working_min = val < working_min ? val : working_min;
+                working_max = val > working_max ? val : working_max;
+            }
+        } else {
+            const char *pixel = row_start + start*c_stride;
+            for (i = 0; i < n; i++, pixel += c_stride) {
+                uint16_t val = *(const uint16_t *) pixel ^ flip;
+                if (val < working_min) working_min = val;
+                if (val > working_max) working_max = val;
+            }
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+// Contiguous rows are scanned in MINMAX_LANES independent lanes, which the compiler can vectorize (a single
+// running min and max cannot be, as floating-point min and max reductions may not be reordered).
+#define MINMAX_LANES 8
+
+void minmax_float_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    float *min, float *max) {
+    float working_min = *(float *) image;
+    float working_max = *(float *) image;
+    float lane_mins[MINMAX_LANES], lane_maxs[MINMAX_LANES];
+    const char *row_start, *pixel;
+    size_t i, lane;
+    for (lane = 0; lane < MINMAX_LANES; lane++) lane_mins[lane] = lane_maxs[lane] = working_min;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        if (c_stride == sizeof(float)) {
+            const float *p = (const float *) row_start;
+            for (i = 0; i + MINMAX_LANES <= cols; i += MINMAX_LANES) {
+                for (lane = 0; lane < MINMAX_LANES; lane++) {
+                    lane_mins[lane] = p[i+lane] < lane_mins[lane] ? p[i+lane] : lane_mins[lane];
+                    lane_maxs[lane] = p[i+lane] > lane_maxs[lane] ? p[i+lane] : lane_maxs[lane];
+                }
+            }
+            pixel = row_start + i*c_stride;
+        } else {
+            pixel = row_start;
+        }
+        for (; pixel != row_start + cols*c_stride; pixel += c_stride) {
+            float val = *(float *) pixel;
+            if (val < working_min) working_min = val;
+            else if (val > working_max) working_max = val;
+        }
+    }
+    for (lane = 0; lane < MINMAX_LANES; lane++) {
+        if (lane_mins[lane] < working_min) working_min = lane_mins[lane];
+        if (lane_maxs[lane] > working_max) working_max = lane_maxs[lane];
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+void masked_minmax_float_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, float *min, float *max) {
+    // ends are exclusive bounds
+    float working_min, working_max;
+    working_min = working_max = *(float *) (image + (*starts)*c_stride);
+    const char *row_start, *pixel;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
+        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
+            float val = *(float *) pixel;
+            if (val < working_min) working_min = val;
+            else if (val > working_max) working_max = val;
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+void ranged_hist_float_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    uint64_t *histogram, uint16_t n_bins, float hist_min, float hist_max, float *min, float *max) {
+    float working_min = *(float *) image;
+    float working_max = *(float *) image;
+    const char *row_start, *pixel;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    uint64_t *last_bin = histogram + n_bins - 1;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
+            float val = *(float *) pixel;
+            if (val >= hist_min && val < hist_max)
+                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+            else if (val == hist_max) (*last_bin)++;
+
+            if (val < working_min) working_min = val;
+            else if (val > working_max) working_max = val;
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+void masked_ranged_hist_float_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, uint64_t *histogram, uint16_t n_bins, float hist_min, float hist_max,
+    float *min, float *max) {
+    // ends are exclusive bounds
+    float working_min, working_max;
+    working_min = working_max = *(float *) (image + (*starts)*c_stride);
+    const char *row_start, *pixel;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    uint64_t *last_bin = histogram + n_bins - 1;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
+        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
+            float val = *(float *) pixel;
+            if (val >= hist_min && val < hist_max)
+                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+            else if (val == hist_max) (*last_bin)++;
+
+            if (val < working_min) working_min = val;
+            else if (val > working_max) working_max = val;
+        }
+    }
+    *min = working_min;
+    *max = working_max;
+}
+
+// Multichannel kernels: each pixel has n_channels (at most 4) components, ch_stride bytes apart. For each
+// channel, the min, max and (if histograms is not NULL) histogram are accumulated in one pass; histograms
+// holds n_channels consecutive histograms of n_bins each, each followed by a discard bin for values
+// outside the histogram (as is luma_histogram). If luma_histogram is not NULL, the CIE 1931
+// linear luminance of the first three channels is also calculated and histogrammed on the fly, with
+// the same arithmetic as the equivalent numpy expression. starts and ends may be NULL for no mask.
+// As for a single channel, int16 images are histogrammed by the uint16 kernel, with offset binning.
+
+void channel_hist_uint8_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, size_t ch_stride, uint8_t n_channels,
+    uint64_t *histograms, uint64_t *luma_histogram, uint8_t hist_min, uint8_t hist_max,
+    uint8_t *mins, uint8_t *maxs, uint8_t *luma_min, uint8_t *luma_max) {
+    // ends are exclusive bounds
+    uint8_t working_mins[4] = {UINT8_MAX, UINT8_MAX, UINT8_MAX, UINT8_MAX}, working_maxs[4] = {0, 0, 0, 0};
+    uint8_t working_luma_min = UINT8_MAX, working_luma_max = 0;
+    const char *row_start, *pixel, *row_end;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                uint8_t val = *(uint8_t *) (pixel + c*ch_stride);
+                if (histograms && val >= hist_min && val <= hist_max) histograms[c*(UINT8_BINS + 1) + val - hist_min]++;
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma_histogram) {
+                uint8_t val = (uint8_t) (0.2126 * *(uint8_t *) pixel + 0.7152 * *(uint8_t *) (pixel + ch_stride) +
+                    0.0722 * *(uint8_t *) (pixel + 2*ch_stride));
+                if (val >= hist_min && val <= hist_max) luma_histogram[val - hist_min]++;
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
+
+void channel_hist_uint16_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, size_t ch_stride, uint8_t n_channels,
+    uint64_t *histograms, uint64_t *luma_histogram, uint16_t flip, uint8_t ranged, uint8_t shift, uint16_t n_bins,
+    uint16_t hist_min, uint16_t hist_max, uint16_t *mins, uint16_t *maxs, uint16_t *luma_min, uint16_t *luma_max) {
+    // ends are exclusive bounds. Each value is first xored with flip (INT16_FLIP for int16 images, else 0). If ranged
+    // is zero, values are binned by shifting right by shift bits (and those beyond the n_bins bins, i.e. beyond
+    // image_bits, are discarded); otherwise, values in [hist_min, hist_max] are binned into n_bins equal bins.
+    uint16_t working_mins[4] = {UINT16_MAX, UINT16_MAX, UINT16_MAX, UINT16_MAX}, working_maxs[4] = {0, 0, 0, 0};
+    uint16_t working_luma_min = UINT16_MAX, working_luma_max = 0;
+    const char *row_start, *pixel, *row_end;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                uint16_t val = *(uint16_t *) (pixel + c*ch_stride) ^ flip;
+                if (histograms) {
+                    uint64_t *histogram = histograms + c*(n_bins + 1);
+                    if (!ranged) histogram[val >> shift < n_bins ? val >> shift : n_bins]++;
+                    else if (val >= hist_min && val < hist_max) histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                    else if (val == hist_max) histogram[n_bins - 1]++;
+                }
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma_histogram) {
+                uint16_t val = (uint16_t) (0.2126 * (*(uint16_t *) pixel ^ flip) +
+                    0.7152 * (*(uint16_t *) (pixel + ch_stride) ^ flip) +
+                    0.0722 * (*(uint16_t *) (pixel + 2*ch_stride) ^ flip));
+                if (!ranged) luma_histogram[val >> shift < n_bins ? val >> shift : n_bins]++;
+                else if (val >= hist_min && val < hist_max) luma_histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                else if (val == hist_max) luma_histogram[n_bins - 1]++;
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
+
+void channel_minmax_float_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, size_t ch_stride, uint8_t n_channels,
+    uint8_t luma, float *mins, float *maxs, float *luma_min, float *luma_max) {
+    // ends are exclusive bounds
+    float working_mins[4] = {INFINITY, INFINITY, INFINITY, INFINITY}, working_maxs[4] = {-INFINITY, -INFINITY, -INFINITY, -INFINITY};
+    float working_luma_min = INFINITY, working_luma_max = -INFINITY;
+    const char *row_start, *pixel, *row_end;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                float val = *(float *) (pixel + c*ch_stride);
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma) {
+                float val = 0.2126f * *(float *) pixel + 0.7152f * *(float *) (pixel + ch_stride) +
+                    0.0722f * *(float *) (pixel + 2*ch_stride);
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
+
+void channel_hist_float_wide(const char *image, size_t rows, size_t cols, size_t r_stride, size_t c_stride,
+    const size_t *starts, const size_t *ends, size_t ch_stride, uint8_t n_channels,
+    uint64_t *histograms, uint64_t *luma_histogram, uint16_t n_bins, float hist_min, float hist_max) {
+    // ends are exclusive bounds
+    const char *row_start, *pixel, *row_end;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            if (histograms) {
+                for (c = 0; c < n_channels; c++) {
+                    float val = *(float *) (pixel + c*ch_stride);
+                    uint64_t *histogram = histograms + c*(n_bins + 1);
+                    if (val >= hist_min && val < hist_max)
+                        histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                    else if (val == hist_max) histogram[n_bins - 1]++;
+                }
+            }
+            if (luma_histogram) {
+                float val = 0.2126f * *(float *) pixel + 0.7152f * *(float *) (pixel + ch_stride) +
+                    0.0722f * *(float *) (pixel + 2*ch_stride);
+                if (val >= hist_min && val < hist_max)
+                    luma_histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                else if (val == hist_max) luma_histogram[n_bins - 1]++;
+            }
+        }
+    }
+}
+
+// Copying pixels between memory layouts (e.g. to transpose an image) one row at a time reads or writes with a
+// stride of a whole row, touching a new cache line for every pixel. copy_pixels_wide instead copies square blocks
+// of COPY_BLOCK x COPY_BLOCK pixels, whose source and destination cache lines stay in cache while each block is
+// copied. Pixels have n_channels items of item_bytes (1, 2, 4, or 8) bytes each, and the destination's channels
+// must be contiguous. Within a block, the inner loop runs along the columns, so the destination's contiguous
+// axis should be the column axis.
+
+#define COPY_BLOCK 64
+
+// item_bytes is a constant in each call, so that the memcpy calls compile to single loads and stores
+static inline void copy_block_wide(const char *src, char *dst, size_t rows, size_t cols, size_t src_r_stride,
+    size_t src_c_stride, size_t src_channel_stride, size_t dst_r_stride, size_t dst_c_stride,
+    uint8_t n_channels, const size_t item_bytes) {
+    size_t r, c;
+    uint8_t channel;
+    for (r = 0; r < rows; r++) {
+        const char *src_pixel = src + r * src_r_stride;
+        char *dst_pixel = dst + r * dst_r_stride;
+        if (n_channels == 1) {
+            for (c = 0; c < cols; c++, src_pixel += src_c_stride, dst_pixel += dst_c_stride) {
+                memcpy(dst_pixel, src_pixel, item_bytes);
+            }
+        } else {
+            for (c = 0; c < cols; c++, src_pixel += src_c_stride, dst_pixel += dst_c_stride) {
+                for (channel = 0; channel < n_channels; channel++) {
+                    memcpy(dst_pixel + channel * item_bytes, src_pixel + channel * src_channel_stride, item_bytes);
+                }
+            }
+        }
+    }
+}
+
+void copy_pixels_wide(const char *src, char *dst, size_t rows, size_t cols, size_t src_r_stride, size_t src_c_stride,
+    size_t src_channel_stride, size_t dst_r_stride, size_t dst_c_stride, uint8_t n_channels, uint8_t item_bytes) {
+    size_t r0, c0, block_rows, block_cols;
+    for (r0 = 0; r0 < rows; r0 += block_rows) {
+        block_rows = rows - r0 < COPY_BLOCK ? rows - r0 : COPY_BLOCK;
+        for (c0 = 0; c0 < cols; c0 += block_cols) {
+            const char *src_block = src + r0 * src_r_stride + c0 * src_c_stride;
+            char *dst_block = dst + r0 * dst_r_stride + c0 * dst_c_stride;
+            block_cols = cols - c0 < COPY_BLOCK ? cols - c0 : COPY_BLOCK;
+            switch (item_bytes) {
+                case 1: copy_block_wide(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 1); break;
+                case 2: copy_block_wide(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 2); break;
+                case 4: copy_block_wide(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 4); break;
+                case 8: copy_block_wide(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 8); break;
+            }
+        }
+    }
+}
+
+
+/************************************************************/
+
+static void *_cffi_types[] = {
+/*  0 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, char *, size_t, size_t, size_t, size_t, size_t, size_t, size_t, uint8_t, uint8_t)
+/*  1 */ _CFFI_OP(_CFFI_OP_POINTER, 598), // char const *
+/*  2 */ _CFFI_OP(_CFFI_OP_POINTER, 598), // char *
+/*  3 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28), // size_t
+/*  4 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/*  5 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/*  6 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/*  7 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/*  8 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/*  9 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 10 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18), // uint8_t
+/* 11 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 12 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 13 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, char *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t, uint32_t, uint32_t, uint8_t, uint8_t)
+/* 14 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 15 */ _CFFI_OP(_CFFI_OP_NOOP, 2),
+/* 16 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20), // uint16_t
+/* 17 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 18 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22), // uint32_t
+/* 19 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 20 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 21 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 22 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 23 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 24 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 25 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 26 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, float *, float *)
+/* 27 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 28 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 29 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 30 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 31 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 32 */ _CFFI_OP(_CFFI_OP_POINTER, 59), // float *
+/* 33 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 34 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 35 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, float *, float *)
+/* 36 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 37 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 38 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 39 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 40 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 41 */ _CFFI_OP(_CFFI_OP_POINTER, 3), // size_t const *
+/* 42 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 43 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 44 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 45 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 46 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, size_t, uint8_t, uint64_t *, uint64_t *, uint16_t, float, float)
+/* 47 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 48 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 49 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 50 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 51 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 52 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 53 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 54 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 55 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 56 */ _CFFI_OP(_CFFI_OP_POINTER, 599), // uint64_t *
+/* 57 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 58 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 59 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13), // float
+/* 60 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 61 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 62 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, size_t, uint8_t, uint64_t *, uint64_t *, uint16_t, uint8_t, uint8_t, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *, uint16_t *, uint16_t *)
+/* 63 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 64 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 65 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 66 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 67 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 68 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 69 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 70 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 71 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 72 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 73 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 74 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 75 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 76 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 77 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 78 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 79 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 80 */ _CFFI_OP(_CFFI_OP_POINTER, 16), // uint16_t *
+/* 81 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 82 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 83 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 84 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 85 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, size_t, uint8_t, uint64_t *, uint64_t *, uint8_t, uint8_t, uint8_t *, uint8_t *, uint8_t *, uint8_t *)
+/* 86 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 87 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 88 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 89 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 90 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 91 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 92 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 93 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 94 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 95 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 96 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 97 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 98 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 99 */ _CFFI_OP(_CFFI_OP_POINTER, 10), // uint8_t *
+/* 100 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 101 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 102 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 103 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 104 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, size_t, uint8_t, uint8_t, float *, float *, float *, float *)
+/* 105 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 106 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 107 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 108 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 109 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 110 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 111 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 112 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 113 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 114 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 115 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 116 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 117 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 118 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 119 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 120 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint16_t, uint16_t *, uint16_t *)
+/* 121 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 122 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 123 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 124 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 125 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 126 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 127 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 128 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 129 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 130 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 131 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 132 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint16_t, float, float, float *, float *)
+/* 133 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 134 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 135 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 136 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 137 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 138 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 139 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 140 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 141 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 142 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 143 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 144 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 145 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 146 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 147 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint16_t, int16_t, int16_t, int16_t *, int16_t *)
+/* 148 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 149 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 150 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 151 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 152 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 153 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 154 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 155 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 156 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 157 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19), // int16_t
+/* 158 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 159 */ _CFFI_OP(_CFFI_OP_POINTER, 157), // int16_t *
+/* 160 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 161 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 162 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *)
+/* 163 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 164 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 165 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 166 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 167 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 168 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 169 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 170 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 171 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 172 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 173 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 174 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 175 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 176 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 177 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint8_t *, uint8_t *)
+/* 178 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 179 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 180 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 181 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 182 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 183 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 184 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 185 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 186 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 187 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 188 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 189 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint8_t, int16_t *, int16_t *)
+/* 190 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 191 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 192 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 193 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 194 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 195 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 196 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 197 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 198 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 199 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 200 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 201 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 202 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint8_t, uint16_t *, uint16_t *)
+/* 203 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 204 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 205 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 206 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 207 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 208 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 209 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 210 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 211 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 212 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 213 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 214 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 215 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, size_t const *, size_t const *, uint64_t *, uint8_t, uint8_t, uint8_t *, uint8_t *)
+/* 216 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 217 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 218 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 219 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 220 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 221 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 222 */ _CFFI_OP(_CFFI_OP_NOOP, 41),
+/* 223 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 224 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 225 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 226 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 227 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 228 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 229 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint16_t, float, float, float *, float *)
+/* 230 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 231 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 232 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 233 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 234 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 235 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 236 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 237 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 238 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 239 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 240 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 241 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 242 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint16_t, int16_t, int16_t, int16_t *, int16_t *)
+/* 243 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 244 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 245 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 246 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 247 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 248 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 249 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 250 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 251 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 252 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 253 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 254 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 255 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *)
+/* 256 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 257 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 258 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 259 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 260 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 261 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 262 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 263 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 264 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 265 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 266 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 267 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 268 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint8_t *, uint8_t *)
+/* 269 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 270 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 271 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 272 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 273 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 274 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 275 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 276 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 277 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 278 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint8_t, int16_t *, int16_t *)
+/* 279 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 280 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 281 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 282 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 283 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 284 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 285 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 286 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 287 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 288 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 289 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint8_t, uint16_t *, uint16_t *)
+/* 290 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 291 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 292 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 293 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 294 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 295 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 296 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 297 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 298 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 299 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 300 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, size_t, size_t, size_t, size_t, uint64_t *, uint8_t, uint8_t, uint8_t *, uint8_t *)
+/* 301 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 302 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 303 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 304 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 305 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 306 */ _CFFI_OP(_CFFI_OP_NOOP, 56),
+/* 307 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 308 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 309 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 310 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 311 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 312 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, float *, float *)
+/* 313 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 314 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 315 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 316 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 317 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 318 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 319 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 320 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 321 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, float *, float *)
+/* 322 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 323 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 324 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 325 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 326 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 327 */ _CFFI_OP(_CFFI_OP_POINTER, 16), // uint16_t const *
+/* 328 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 329 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 330 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 331 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 332 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint16_t, uint16_t *, uint16_t *)
+/* 333 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 334 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 335 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 336 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 337 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 338 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 339 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 340 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 341 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 342 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 343 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 344 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint16_t, float, float, float *, float *)
+/* 345 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 346 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 347 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 348 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 349 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 350 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 351 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 352 */ _CFFI_OP(_CFFI_OP_POINTER, 18), // uint32_t *
+/* 353 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 354 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 355 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 356 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 357 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 358 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 359 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint16_t, int16_t, int16_t, int16_t *, int16_t *)
+/* 360 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 361 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 362 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 363 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 364 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 365 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 366 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 367 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 368 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 369 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 370 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 371 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 372 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 373 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 374 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *)
+/* 375 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 376 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 377 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 378 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 379 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 380 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 381 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 382 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 383 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 384 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 385 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 386 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 387 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 388 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 389 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t *, uint8_t *)
+/* 390 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 391 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 392 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 393 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 394 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 395 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 396 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 397 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 398 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 399 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 400 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 401 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t, int16_t *, int16_t *)
+/* 402 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 403 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 404 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 405 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 406 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 407 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 408 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 409 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 410 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 411 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 412 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 413 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 414 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t, uint16_t *, uint16_t *)
+/* 415 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 416 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 417 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 418 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 419 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 420 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 421 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 422 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 423 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 424 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 425 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 426 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 427 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t *, uint8_t, uint8_t, uint8_t *, uint8_t *)
+/* 428 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 429 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 430 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 431 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 432 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 433 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 434 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 435 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 436 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 437 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 438 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 439 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 440 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 441 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t, uint8_t, uint32_t *, uint32_t *, uint16_t, float, float)
+/* 442 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 443 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 444 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 445 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 446 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 447 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 448 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 449 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 450 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 451 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 452 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 453 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 454 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 455 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 456 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 457 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t, uint8_t, uint32_t *, uint32_t *, uint16_t, uint8_t, uint8_t, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *, uint16_t *, uint16_t *)
+/* 458 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 459 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 460 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 461 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 462 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 463 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 464 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 465 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 466 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 467 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 468 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 469 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 470 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 471 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 472 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 473 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 474 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 475 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 476 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 477 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 478 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 479 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 480 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t, uint8_t, uint32_t *, uint32_t *, uint8_t, uint8_t, uint8_t *, uint8_t *, uint8_t *, uint8_t *)
+/* 481 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 482 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 483 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 484 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 485 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 486 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 487 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 488 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 489 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 490 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 491 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 492 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 493 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 494 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 495 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 496 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 497 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 498 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 499 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint16_t const *, uint16_t const *, uint32_t, uint8_t, uint8_t, float *, float *, float *, float *)
+/* 500 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 501 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 502 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 503 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 504 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 505 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 506 */ _CFFI_OP(_CFFI_OP_NOOP, 327),
+/* 507 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 508 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 509 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 510 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 511 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 512 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 513 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 514 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 515 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint16_t, float, float, float *, float *)
+/* 516 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 517 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 518 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 519 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 520 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 521 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 522 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 523 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 524 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 13),
+/* 525 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 526 */ _CFFI_OP(_CFFI_OP_NOOP, 32),
+/* 527 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 528 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint16_t, int16_t, int16_t, int16_t *, int16_t *)
+/* 529 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 530 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 531 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 532 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 533 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 534 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 535 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 536 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 537 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 19),
+/* 538 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 539 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 540 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 541 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint16_t, uint16_t, uint16_t, uint16_t *, uint16_t *)
+/* 542 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 543 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 544 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 545 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 546 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 547 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 548 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 549 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 550 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 551 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 552 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 553 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 554 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t *, uint8_t *)
+/* 555 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 556 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 557 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 558 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 559 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 560 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 561 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 562 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 563 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 564 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t, int16_t *, int16_t *)
+/* 565 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 566 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 567 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 568 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 569 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 570 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 571 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 572 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 573 */ _CFFI_OP(_CFFI_OP_NOOP, 159),
+/* 574 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 575 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t, uint16_t *, uint16_t *)
+/* 576 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 577 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 578 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 579 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 580 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 581 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 582 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 583 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 584 */ _CFFI_OP(_CFFI_OP_NOOP, 80),
+/* 585 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 586 */ _CFFI_OP(_CFFI_OP_FUNCTION, 600), // void()(char const *, uint16_t, uint16_t, uint32_t, uint32_t, uint32_t *, uint8_t, uint8_t, uint8_t *, uint8_t *)
+/* 587 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 588 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 589 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 20),
+/* 590 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 591 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22),
+/* 592 */ _CFFI_OP(_CFFI_OP_NOOP, 352),
+/* 593 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 594 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18),
+/* 595 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 596 */ _CFFI_OP(_CFFI_OP_NOOP, 99),
+/* 597 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 598 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 2), // char
+/* 599 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24), // uint64_t
+/* 600 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 0), // void
+};
+
+static void _cffi_d_channel_hist_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t x7, uint8_t x8, uint32_t * x9, uint32_t * x10, uint16_t x11, float x12, float x13)
+{
+  channel_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_hist_float(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t x7;
+  uint8_t x8;
+  uint32_t * x9;
+  uint32_t * x10;
+  uint16_t x11;
+  float x12;
+  float x13;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+
+  if (!PyArg_UnpackTuple(args, "channel_hist_float", 14, 14, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, uint32_t);
+  if (x7 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x11 = _cffi_to_c_int(arg11, uint16_t);
+  if (x11 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x12 = (float)_cffi_to_c_float(arg12);
+  if (x12 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  x13 = (float)_cffi_to_c_float(arg13);
+  if (x13 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_hist_float _cffi_d_channel_hist_float
+#endif
+
+static void _cffi_d_channel_hist_float_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, size_t x7, uint8_t x8, uint64_t * x9, uint64_t * x10, uint16_t x11, float x12, float x13)
+{
+  channel_hist_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_hist_float_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  size_t x7;
+  uint8_t x8;
+  uint64_t * x9;
+  uint64_t * x10;
+  uint16_t x11;
+  float x12;
+  float x13;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+
+  if (!PyArg_UnpackTuple(args, "channel_hist_float_wide", 14, 14, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, size_t);
+  if (x7 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x11 = _cffi_to_c_int(arg11, uint16_t);
+  if (x11 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x12 = (float)_cffi_to_c_float(arg12);
+  if (x12 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  x13 = (float)_cffi_to_c_float(arg13);
+  if (x13 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_hist_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_hist_float_wide _cffi_d_channel_hist_float_wide
+#endif
+
+static void _cffi_d_channel_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t x7, uint8_t x8, uint32_t * x9, uint32_t * x10, uint16_t x11, uint8_t x12, uint8_t x13, uint16_t x14, uint16_t x15, uint16_t x16, uint16_t * x17, uint16_t * x18, uint16_t * x19, uint16_t * x20)
+{
+  channel_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16, x17, x18, x19, x20);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_hist_uint16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t x7;
+  uint8_t x8;
+  uint32_t * x9;
+  uint32_t * x10;
+  uint16_t x11;
+  uint8_t x12;
+  uint8_t x13;
+  uint16_t x14;
+  uint16_t x15;
+  uint16_t x16;
+  uint16_t * x17;
+  uint16_t * x18;
+  uint16_t * x19;
+  uint16_t * x20;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+  PyObject *arg14;
+  PyObject *arg15;
+  PyObject *arg16;
+  PyObject *arg17;
+  PyObject *arg18;
+  PyObject *arg19;
+  PyObject *arg20;
+
+  if (!PyArg_UnpackTuple(args, "channel_hist_uint16", 21, 21, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13, &arg14, &arg15, &arg16, &arg17, &arg18, &arg19, &arg20))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, uint32_t);
+  if (x7 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x11 = _cffi_to_c_int(arg11, uint16_t);
+  if (x11 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x12 = _cffi_to_c_int(arg12, uint8_t);
+  if (x12 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x13 = _cffi_to_c_int(arg13, uint8_t);
+  if (x13 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x14 = _cffi_to_c_int(arg14, uint16_t);
+  if (x14 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x15 = _cffi_to_c_int(arg15, uint16_t);
+  if (x15 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x16 = _cffi_to_c_int(arg16, uint16_t);
+  if (x16 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg17, (char **)&x17);
+  if (datasize != 0) {
+    x17 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg17, (char **)&x17,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg18, (char **)&x18);
+  if (datasize != 0) {
+    x18 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg18, (char **)&x18,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg19, (char **)&x19);
+  if (datasize != 0) {
+    x19 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg19, (char **)&x19,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg20, (char **)&x20);
+  if (datasize != 0) {
+    x20 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg20, (char **)&x20,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16, x17, x18, x19, x20); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_hist_uint16 _cffi_d_channel_hist_uint16
+#endif
+
+static void _cffi_d_channel_hist_uint16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, size_t x7, uint8_t x8, uint64_t * x9, uint64_t * x10, uint16_t x11, uint8_t x12, uint8_t x13, uint16_t x14, uint16_t x15, uint16_t x16, uint16_t * x17, uint16_t * x18, uint16_t * x19, uint16_t * x20)
+{
+  channel_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16, x17, x18, x19, x20);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_hist_uint16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  size_t x7;
+  uint8_t x8;
+  uint64_t * x9;
+  uint64_t * x10;
+  uint16_t x11;
+  uint8_t x12;
+  uint8_t x13;
+  uint16_t x14;
+  uint16_t x15;
+  uint16_t x16;
+  uint16_t * x17;
+  uint16_t * x18;
+  uint16_t * x19;
+  uint16_t * x20;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+  PyObject *arg14;
+  PyObject *arg15;
+  PyObject *arg16;
+  PyObject *arg17;
+  PyObject *arg18;
+  PyObject *arg19;
+  PyObject *arg20;
+
+  if (!PyArg_UnpackTuple(args, "channel_hist_uint16_wide", 21, 21, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13, &arg14, &arg15, &arg16, &arg17, &arg18, &arg19, &arg20))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, size_t);
+  if (x7 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x11 = _cffi_to_c_int(arg11, uint16_t);
+  if (x11 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x12 = _cffi_to_c_int(arg12, uint8_t);
+  if (x12 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x13 = _cffi_to_c_int(arg13, uint8_t);
+  if (x13 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x14 = _cffi_to_c_int(arg14, uint16_t);
+  if (x14 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x15 = _cffi_to_c_int(arg15, uint16_t);
+  if (x15 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x16 = _cffi_to_c_int(arg16, uint16_t);
+  if (x16 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg17, (char **)&x17);
+  if (datasize != 0) {
+    x17 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg17, (char **)&x17,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg18, (char **)&x18);
+  if (datasize != 0) {
+    x18 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg18, (char **)&x18,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg19, (char **)&x19);
+  if (datasize != 0) {
+    x19 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg19, (char **)&x19,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg20, (char **)&x20);
+  if (datasize != 0) {
+    x20 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg20, (char **)&x20,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16, x17, x18, x19, x20); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_hist_uint16_wide _cffi_d_channel_hist_uint16_wide
+#endif
+
+static void _cffi_d_channel_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t x7, uint8_t x8, uint32_t * x9, uint32_t * x10, uint8_t x11, uint8_t x12, uint8_t * x13, uint8_t * x14, uint8_t * x15, uint8_t * x16)
+{
+  channel_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_hist_uint8(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t x7;
+  uint8_t x8;
+  uint32_t * x9;
+  uint32_t * x10;
+  uint8_t x11;
+  uint8_t x12;
+  uint8_t * x13;
+  uint8_t * x14;
+  uint8_t * x15;
+  uint8_t * x16;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+  PyObject *arg14;
+  PyObject *arg15;
+  PyObject *arg16;
+
+  if (!PyArg_UnpackTuple(args, "channel_hist_uint8", 17, 17, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13, &arg14, &arg15, &arg16))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, uint32_t);
+  if (x7 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x11 = _cffi_to_c_int(arg11, uint8_t);
+  if (x11 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x12 = _cffi_to_c_int(arg12, uint8_t);
+  if (x12 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg13, (char **)&x13);
+  if (datasize != 0) {
+    x13 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg13, (char **)&x13,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg14, (char **)&x14);
+  if (datasize != 0) {
+    x14 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg14, (char **)&x14,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg15, (char **)&x15);
+  if (datasize != 0) {
+    x15 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg15, (char **)&x15,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg16, (char **)&x16);
+  if (datasize != 0) {
+    x16 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg16, (char **)&x16,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_hist_uint8 _cffi_d_channel_hist_uint8
+#endif
+
+static void _cffi_d_channel_hist_uint8_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, size_t x7, uint8_t x8, uint64_t * x9, uint64_t * x10, uint8_t x11, uint8_t x12, uint8_t * x13, uint8_t * x14, uint8_t * x15, uint8_t * x16)
+{
+  channel_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_hist_uint8_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  size_t x7;
+  uint8_t x8;
+  uint64_t * x9;
+  uint64_t * x10;
+  uint8_t x11;
+  uint8_t x12;
+  uint8_t * x13;
+  uint8_t * x14;
+  uint8_t * x15;
+  uint8_t * x16;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+  PyObject *arg14;
+  PyObject *arg15;
+  PyObject *arg16;
+
+  if (!PyArg_UnpackTuple(args, "channel_hist_uint8_wide", 17, 17, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13, &arg14, &arg15, &arg16))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, size_t);
+  if (x7 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x11 = _cffi_to_c_int(arg11, uint8_t);
+  if (x11 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x12 = _cffi_to_c_int(arg12, uint8_t);
+  if (x12 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg13, (char **)&x13);
+  if (datasize != 0) {
+    x13 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg13, (char **)&x13,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg14, (char **)&x14);
+  if (datasize != 0) {
+    x14 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg14, (char **)&x14,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg15, (char **)&x15);
+  if (datasize != 0) {
+    x15 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg15, (char **)&x15,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg16, (char **)&x16);
+  if (datasize != 0) {
+    x16 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg16, (char **)&x16,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_hist_uint8_wide _cffi_d_channel_hist_uint8_wide
+#endif
+
+static void _cffi_d_channel_minmax_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t x7, uint8_t x8, uint8_t x9, float * x10, float * x11, float * x12, float * x13)
+{
+  channel_minmax_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_minmax_float(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t x7;
+  uint8_t x8;
+  uint8_t x9;
+  float * x10;
+  float * x11;
+  float * x12;
+  float * x13;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+
+  if (!PyArg_UnpackTuple(args, "channel_minmax_float", 14, 14, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, uint32_t);
+  if (x7 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint8_t);
+  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg13, (char **)&x13);
+  if (datasize != 0) {
+    x13 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg13, (char **)&x13,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_minmax_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_minmax_float _cffi_d_channel_minmax_float
+#endif
+
+static void _cffi_d_channel_minmax_float_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, size_t x7, uint8_t x8, uint8_t x9, float * x10, float * x11, float * x12, float * x13)
+{
+  channel_minmax_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_channel_minmax_float_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  size_t x7;
+  uint8_t x8;
+  uint8_t x9;
+  float * x10;
+  float * x11;
+  float * x12;
+  float * x13;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+  PyObject *arg13;
+
+  if (!PyArg_UnpackTuple(args, "channel_minmax_float_wide", 14, 14, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12, &arg13))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, size_t);
+  if (x7 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint8_t);
+  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg13, (char **)&x13);
+  if (datasize != 0) {
+    x13 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg13, (char **)&x13,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { channel_minmax_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_channel_minmax_float_wide _cffi_d_channel_minmax_float_wide
+#endif
+
+static void _cffi_d_copy_pixels(char const * x0, char * x1, uint16_t x2, uint16_t x3, uint32_t x4, uint32_t x5, uint32_t x6, uint32_t x7, uint32_t x8, uint8_t x9, uint8_t x10)
+{
+  copy_pixels(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_copy_pixels(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  char * x1;
+  uint16_t x2;
+  uint16_t x3;
+  uint32_t x4;
+  uint32_t x5;
+  uint32_t x6;
+  uint32_t x7;
+  uint32_t x8;
+  uint8_t x9;
+  uint8_t x10;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+
+  if (!PyArg_UnpackTuple(args, "copy_pixels", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(2), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(2), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint16_t);
+  if (x3 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x5 = _cffi_to_c_int(arg5, uint32_t);
+  if (x5 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x6 = _cffi_to_c_int(arg6, uint32_t);
+  if (x6 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x7 = _cffi_to_c_int(arg7, uint32_t);
+  if (x7 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, uint32_t);
+  if (x8 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint8_t);
+  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = _cffi_to_c_int(arg10, uint8_t);
+  if (x10 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { copy_pixels(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_copy_pixels _cffi_d_copy_pixels
+#endif
+
+static void _cffi_d_copy_pixels_wide(char const * x0, char * x1, size_t x2, size_t x3, size_t x4, size_t x5, size_t x6, size_t x7, size_t x8, uint8_t x9, uint8_t x10)
+{
+  copy_pixels_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_copy_pixels_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  char * x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t x5;
+  size_t x6;
+  size_t x7;
+  size_t x8;
+  uint8_t x9;
+  uint8_t x10;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+
+  if (!PyArg_UnpackTuple(args, "copy_pixels_wide", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(2), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(2), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x5 = _cffi_to_c_int(arg5, size_t);
+  if (x5 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x6 = _cffi_to_c_int(arg6, size_t);
+  if (x6 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x7 = _cffi_to_c_int(arg7, size_t);
+  if (x7 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, size_t);
+  if (x8 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint8_t);
+  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = _cffi_to_c_int(arg10, uint8_t);
+  if (x10 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { copy_pixels_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_copy_pixels_wide _cffi_d_copy_pixels_wide
+#endif
+
+static void _cffi_d_hist_int16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint8_t x6, int16_t * x7, int16_t * x8)
+{
+  hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_hist_int16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint32_t * x5;
+  uint8_t x6;
+  int16_t * x7;
+  int16_t * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "hist_int16", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x6 = _cffi_to_c_int(arg6, uint8_t);
+  if (x6 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_hist_int16 _cffi_d_hist_int16
+#endif
+
+static void _cffi_d_hist_int16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint8_t x6, int16_t * x7, int16_t * x8)
+{
+  hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_hist_int16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
+  uint8_t x6;
+  int16_t * x7;
+  int16_t * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "hist_int16_wide", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x6 = _cffi_to_c_int(arg6, uint8_t);
+  if (x6 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_hist_int16_wide _cffi_d_hist_int16_wide
+#endif
+
+static void _cffi_d_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint8_t x6, uint16_t * x7, uint16_t * x8)
+{
+  hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_hist_uint16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint32_t * x5;
+  uint8_t x6;
+  uint16_t * x7;
+  uint16_t * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "hist_uint16", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x6 = _cffi_to_c_int(arg6, uint8_t);
+  if (x6 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_hist_uint16 _cffi_d_hist_uint16
+#endif
+
+static void _cffi_d_hist_uint16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint8_t x6, uint16_t * x7, uint16_t * x8)
+{
+  hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_hist_uint16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
+  uint8_t x6;
+  uint16_t * x7;
+  uint16_t * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "hist_uint16_wide", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x6 = _cffi_to_c_int(arg6, uint8_t);
+  if (x6 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_hist_uint16_wide _cffi_d_hist_uint16_wide
+#endif
+
+static void _cffi_d_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint8_t * x6, uint8_t * x7)
+{
+  hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_hist_uint8(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint32_t * x5;
+  uint8_t * x6;
+  uint8_t * x7;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+
+  if (!PyArg_UnpackTuple(args, "hist_uint8", 8, 8, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_hist_uint8 _cffi_d_hist_uint8
+#endif
+
+static void _cffi_d_hist_uint8_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint8_t * x6, uint8_t * x7)
+{
+  hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_hist_uint8_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
+  uint8_t * x6;
+  uint8_t * x7;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+
+  if (!PyArg_UnpackTuple(args, "hist_uint8_wide", 8, 8, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_hist_uint8_wide _cffi_d_hist_uint8_wide
+#endif
+
+static void _cffi_d_masked_hist_int16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t x8, int16_t * x9, int16_t * x10)
+{
+  masked_hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_hist_int16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint8_t x8;
+  int16_t * x9;
+  int16_t * x10;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+
+  if (!PyArg_UnpackTuple(args, "masked_hist_int16", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_hist_int16 _cffi_d_masked_hist_int16
+#endif
+
+static void _cffi_d_masked_hist_int16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint8_t x8, int16_t * x9, int16_t * x10)
+{
+  masked_hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_hist_int16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint8_t x8;
+  int16_t * x9;
+  int16_t * x10;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+
+  if (!PyArg_UnpackTuple(args, "masked_hist_int16_wide", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_hist_int16_wide _cffi_d_masked_hist_int16_wide
+#endif
+
+static void _cffi_d_masked_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t x8, uint16_t * x9, uint16_t * x10)
+{
+  masked_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_hist_uint16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint8_t x8;
+  uint16_t * x9;
+  uint16_t * x10;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+
+  if (!PyArg_UnpackTuple(args, "masked_hist_uint16", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_hist_uint16 _cffi_d_masked_hist_uint16
+#endif
+
+static void _cffi_d_masked_hist_uint16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint8_t x8, uint16_t * x9, uint16_t * x10)
+{
+  masked_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_hist_uint16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint8_t x8;
+  uint16_t * x9;
+  uint16_t * x10;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+
+  if (!PyArg_UnpackTuple(args, "masked_hist_uint16_wide", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_hist_uint16_wide _cffi_d_masked_hist_uint16_wide
+#endif
+
+static void _cffi_d_masked_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t * x8, uint8_t * x9)
+{
+  masked_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_hist_uint8(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint8_t * x8;
+  uint8_t * x9;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+
+  if (!PyArg_UnpackTuple(args, "masked_hist_uint8", 10, 10, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_hist_uint8 _cffi_d_masked_hist_uint8
+#endif
+
+static void _cffi_d_masked_hist_uint8_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint8_t * x8, uint8_t * x9)
+{
+  masked_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_hist_uint8_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint8_t * x8;
+  uint8_t * x9;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+
+  if (!PyArg_UnpackTuple(args, "masked_hist_uint8_wide", 10, 10, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_hist_uint8_wide _cffi_d_masked_hist_uint8_wide
+#endif
+
+static void _cffi_d_masked_minmax_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, float * x7, float * x8)
+{
+  masked_minmax_float(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_minmax_float(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  float * x7;
+  float * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "masked_minmax_float", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_minmax_float(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_minmax_float _cffi_d_masked_minmax_float
+#endif
+
+static void _cffi_d_masked_minmax_float_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, float * x7, float * x8)
+{
+  masked_minmax_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_minmax_float_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  float * x7;
+  float * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "masked_minmax_float_wide", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_minmax_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_minmax_float_wide _cffi_d_masked_minmax_float_wide
+#endif
+
+static void _cffi_d_masked_ranged_hist_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint16_t x8, float x9, float x10, float * x11, float * x12)
+{
+  masked_ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_float(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint16_t x8;
+  float x9;
+  float x10;
+  float * x11;
+  float * x12;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_float", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = (float)_cffi_to_c_float(arg9);
+  if (x9 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = (float)_cffi_to_c_float(arg10);
+  if (x10 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_float _cffi_d_masked_ranged_hist_float
+#endif
+
+static void _cffi_d_masked_ranged_hist_float_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint16_t x8, float x9, float x10, float * x11, float * x12)
+{
+  masked_ranged_hist_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_float_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint16_t x8;
+  float x9;
+  float x10;
+  float * x11;
+  float * x12;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_float_wide", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = (float)_cffi_to_c_float(arg9);
+  if (x9 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = (float)_cffi_to_c_float(arg10);
+  if (x10 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(32), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_float_wide _cffi_d_masked_ranged_hist_float_wide
+#endif
+
+static void _cffi_d_masked_ranged_hist_int16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint16_t x8, int16_t x9, int16_t x10, int16_t * x11, int16_t * x12)
+{
+  masked_ranged_hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_int16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint16_t x8;
+  int16_t x9;
+  int16_t x10;
+  int16_t * x11;
+  int16_t * x12;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_int16", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, int16_t);
+  if (x9 == (int16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = _cffi_to_c_int(arg10, int16_t);
+  if (x10 == (int16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_int16 _cffi_d_masked_ranged_hist_int16
+#endif
+
+static void _cffi_d_masked_ranged_hist_int16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint16_t x8, int16_t x9, int16_t x10, int16_t * x11, int16_t * x12)
+{
+  masked_ranged_hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_int16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint16_t x8;
+  int16_t x9;
+  int16_t x10;
+  int16_t * x11;
+  int16_t * x12;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_int16_wide", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, int16_t);
+  if (x9 == (int16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = _cffi_to_c_int(arg10, int16_t);
+  if (x10 == (int16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_int16_wide _cffi_d_masked_ranged_hist_int16_wide
+#endif
+
+static void _cffi_d_masked_ranged_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint16_t x8, uint16_t x9, uint16_t x10, uint16_t * x11, uint16_t * x12)
+{
+  masked_ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_uint16(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint16_t x8;
+  uint16_t x9;
+  uint16_t x10;
+  uint16_t * x11;
+  uint16_t * x12;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_uint16", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint16_t);
+  if (x9 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = _cffi_to_c_int(arg10, uint16_t);
+  if (x10 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_uint16 _cffi_d_masked_ranged_hist_uint16
+#endif
+
+static void _cffi_d_masked_ranged_hist_uint16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint16_t x8, uint16_t x9, uint16_t x10, uint16_t * x11, uint16_t * x12)
+{
+  masked_ranged_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_uint16_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint16_t x8;
+  uint16_t x9;
+  uint16_t x10;
+  uint16_t * x11;
+  uint16_t * x12;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+  PyObject *arg12;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_uint16_wide", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg5, (char **)&x5);
+      _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(28), arg5) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x6 = _cffi_to_c_int(arg6, uint8_t);
-  if (x6 == (uint8_t)-1 && PyErr_Occurred())
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg7, (char **)&x7);
+      _cffi_type(41), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
       return NULL;
-    x7 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(45), arg7) < 0)
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint16_t);
+  if (x9 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x10 = _cffi_to_c_int(arg10, uint16_t);
+  if (x10 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg8, (char **)&x8);
+      _cffi_type(80), arg11, (char **)&x11);
   if (datasize != 0) {
-    if (datasize < 0)
+    x11 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
       return NULL;
-    x8 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x8, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x8, _cffi_type(45), arg8) < 0)
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg12, (char **)&x12);
+  if (datasize != 0) {
+    x12 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg12, (char **)&x12,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  { masked_ranged_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_hist_uint16 _cffi_d_hist_uint16
+#  define _cffi_f_masked_ranged_hist_uint16_wide _cffi_d_masked_ranged_hist_uint16_wide
 #endif
 
-static void _cffi_d_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint8_t * x6, uint8_t * x7)
+static void _cffi_d_masked_ranged_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t x8, uint8_t x9, uint8_t * x10, uint8_t * x11)
 {
-  hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7);
+  masked_ranged_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_hist_uint8(PyObject *self, PyObject *args)
+_cffi_f_masked_ranged_hist_uint8(PyObject *self, PyObject *args)
 {
   char const * x0;
   uint16_t x1;
   uint16_t x2;
   uint32_t x3;
   uint32_t x4;
-  uint32_t * x5;
-  uint8_t * x6;
-  uint8_t * x7;
+  uint16_t const * x5;
+  uint16_t const * x6;
+  uint32_t * x7;
+  uint8_t x8;
+  uint8_t x9;
+  uint8_t * x10;
+  uint8_t * x11;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_uint8", 12, 12, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint16_t);
+  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, uint16_t);
+  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint32_t);
+  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, uint32_t);
+  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(327), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(352), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint8_t);
+  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_uint8 _cffi_d_masked_ranged_hist_uint8
+#endif
+
+static void _cffi_d_masked_ranged_hist_uint8_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint64_t * x7, uint8_t x8, uint8_t x9, uint8_t * x10, uint8_t * x11)
+{
+  masked_ranged_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_masked_ranged_hist_uint8_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint64_t * x7;
+  uint8_t x8;
+  uint8_t x9;
+  uint8_t * x10;
+  uint8_t * x11;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
+  PyObject *arg11;
+
+  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_uint8_wide", 12, 12, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(41), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg7, (char **)&x7);
+  if (datasize != 0) {
+    x7 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg7, (char **)&x7,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x8 = _cffi_to_c_int(arg8, uint8_t);
+  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x9 = _cffi_to_c_int(arg9, uint8_t);
+  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg11, (char **)&x11);
+  if (datasize != 0) {
+    x11 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg11, (char **)&x11,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { masked_ranged_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_masked_ranged_hist_uint8_wide _cffi_d_masked_ranged_hist_uint8_wide
+#endif
+
+static void _cffi_d_minmax_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, float * x5, float * x6)
+{
+  minmax_float(x0, x1, x2, x3, x4, x5, x6);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_minmax_float(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  uint16_t x1;
+  uint16_t x2;
+  uint32_t x3;
+  uint32_t x4;
+  float * x5;
+  float * x6;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -930,19 +6719,16 @@ _cffi_f_hist_uint8(PyObject *self, PyObject *args)
   PyObject *arg4;
   PyObject *arg5;
   PyObject *arg6;
-  PyObject *arg7;
 
-  if (!PyArg_UnpackTuple(args, "hist_uint8", 8, 8, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7))
+  if (!PyArg_UnpackTuple(args, "minmax_float", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -963,72 +6749,55 @@ _cffi_f_hist_uint8(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg5, (char **)&x5);
+      _cffi_type(32), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(28), arg5) < 0)
-      return NULL;
-  }
-
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg6, (char **)&x6);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(57), arg6) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg7, (char **)&x7);
+      _cffi_type(32), arg6, (char **)&x6);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(57), arg7) < 0)
+    x6 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7); }
+  { minmax_float(x0, x1, x2, x3, x4, x5, x6); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_hist_uint8 _cffi_d_hist_uint8
+#  define _cffi_f_minmax_float _cffi_d_minmax_float
 #endif
 
-static void _cffi_d_masked_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t x8, uint16_t * x9, uint16_t * x10)
+static void _cffi_d_minmax_float_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, float * x5, float * x6)
 {
-  masked_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+  minmax_float_wide(x0, x1, x2, x3, x4, x5, x6);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_masked_hist_uint16(PyObject *self, PyObject *args)
+_cffi_f_minmax_float_wide(PyObject *self, PyObject *args)
 {
   char const * x0;
-  uint16_t x1;
-  uint16_t x2;
-  uint32_t x3;
-  uint32_t x4;
-  uint16_t const * x5;
-  uint16_t const * x6;
-  uint32_t * x7;
-  uint8_t x8;
-  uint16_t * x9;
-  uint16_t * x10;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  float * x5;
+  float * x6;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1036,121 +6805,75 @@ _cffi_f_masked_hist_uint16(PyObject *self, PyObject *args)
   PyObject *arg4;
   PyObject *arg5;
   PyObject *arg6;
-  PyObject *arg7;
-  PyObject *arg8;
-  PyObject *arg9;
-  PyObject *arg10;
 
-  if (!PyArg_UnpackTuple(args, "masked_hist_uint16", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+  if (!PyArg_UnpackTuple(args, "minmax_float_wide", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x1 = _cffi_to_c_int(arg1, uint16_t);
-  if (x1 == (uint16_t)-1 && PyErr_Occurred())
-    return NULL;
-
-  x2 = _cffi_to_c_int(arg2, uint16_t);
-  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x3 = _cffi_to_c_int(arg3, uint32_t);
-  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x4 = _cffi_to_c_int(arg4, uint32_t);
-  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg5, (char **)&x5);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(15), arg5) < 0)
-      return NULL;
-  }
-
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg6, (char **)&x6);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(15), arg6) < 0)
-      return NULL;
-  }
-
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg7, (char **)&x7);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(28), arg7) < 0)
-      return NULL;
-  }
-
-  x8 = _cffi_to_c_int(arg8, uint8_t);
-  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg9, (char **)&x9);
+      _cffi_type(32), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x9 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x9, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x9, _cffi_type(45), arg9) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg10, (char **)&x10);
+      _cffi_type(32), arg6, (char **)&x6);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x10 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x10, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x10, _cffi_type(45), arg10) < 0)
+    x6 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { masked_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  { minmax_float_wide(x0, x1, x2, x3, x4, x5, x6); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_masked_hist_uint16 _cffi_d_masked_hist_uint16
+#  define _cffi_f_minmax_float_wide _cffi_d_minmax_float_wide
 #endif
 
-static void _cffi_d_masked_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t * x8, uint8_t * x9)
+static void _cffi_d_minmax_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint16_t x7, uint16_t * x8, uint16_t * x9)
 {
-  masked_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9);
+  minmax_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_masked_hist_uint8(PyObject *self, PyObject *args)
+_cffi_f_minmax_uint16(PyObject *self, PyObject *args)
 {
   char const * x0;
   uint16_t x1;
@@ -1159,10 +6882,11 @@ _cffi_f_masked_hist_uint8(PyObject *self, PyObject *args)
   uint32_t x4;
   uint16_t const * x5;
   uint16_t const * x6;
-  uint32_t * x7;
-  uint8_t * x8;
-  uint8_t * x9;
+  uint16_t x7;
+  uint16_t * x8;
+  uint16_t * x9;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1174,17 +6898,15 @@ _cffi_f_masked_hist_uint8(PyObject *self, PyObject *args)
   PyObject *arg8;
   PyObject *arg9;
 
-  if (!PyArg_UnpackTuple(args, "masked_hist_uint8", 10, 10, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9))
+  if (!PyArg_UnpackTuple(args, "minmax_uint16", 10, 10, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -1205,92 +6927,80 @@ _cffi_f_masked_hist_uint8(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg5, (char **)&x5);
+      _cffi_type(327), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(15), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg6, (char **)&x6);
+      _cffi_type(327), arg6, (char **)&x6);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(15), arg6) < 0)
+    x6 = ((size_t)datasize) <= 640 ? (uint16_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(327), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg7, (char **)&x7);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(28), arg7) < 0)
-      return NULL;
-  }
+  x7 = _cffi_to_c_int(arg7, uint16_t);
+  if (x7 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg8, (char **)&x8);
+      _cffi_type(80), arg8, (char **)&x8);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x8 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x8, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x8, _cffi_type(57), arg8) < 0)
+    x8 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg9, (char **)&x9);
+      _cffi_type(80), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x9 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x9, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x9, _cffi_type(57), arg9) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { masked_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9); }
+  { minmax_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_masked_hist_uint8 _cffi_d_masked_hist_uint8
+#  define _cffi_f_minmax_uint16 _cffi_d_minmax_uint16
 #endif
 
-static void _cffi_d_masked_minmax_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, float * x7, float * x8)
+static void _cffi_d_minmax_uint16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, size_t const * x5, size_t const * x6, uint16_t x7, uint16_t * x8, uint16_t * x9)
 {
-  masked_minmax_float(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+  minmax_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_masked_minmax_float(PyObject *self, PyObject *args)
+_cffi_f_minmax_uint16_wide(PyObject *self, PyObject *args)
 {
   char const * x0;
-  uint16_t x1;
-  uint16_t x2;
-  uint32_t x3;
-  uint32_t x4;
-  uint16_t const * x5;
-  uint16_t const * x6;
-  float * x7;
-  float * x8;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  size_t const * x5;
+  size_t const * x6;
+  uint16_t x7;
+  uint16_t * x8;
+  uint16_t * x9;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1300,115 +7010,112 @@ _cffi_f_masked_minmax_float(PyObject *self, PyObject *args)
   PyObject *arg6;
   PyObject *arg7;
   PyObject *arg8;
+  PyObject *arg9;
 
-  if (!PyArg_UnpackTuple(args, "masked_minmax_float", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+  if (!PyArg_UnpackTuple(args, "minmax_uint16_wide", 10, 10, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x1 = _cffi_to_c_int(arg1, uint16_t);
-  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x2 = _cffi_to_c_int(arg2, uint16_t);
-  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x3 = _cffi_to_c_int(arg3, uint32_t);
-  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x4 = _cffi_to_c_int(arg4, uint32_t);
-  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg5, (char **)&x5);
+      _cffi_type(41), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(15), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg6, (char **)&x6);
+      _cffi_type(41), arg6, (char **)&x6);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(15), arg6) < 0)
+    x6 = ((size_t)datasize) <= 640 ? (size_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(41), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
+  x7 = _cffi_to_c_int(arg7, uint16_t);
+  if (x7 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(6), arg7, (char **)&x7);
+      _cffi_type(80), arg8, (char **)&x8);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (float *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(6), arg7) < 0)
+    x8 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(6), arg8, (char **)&x8);
+      _cffi_type(80), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x8 = (float *)alloca((size_t)datasize);
-    memset((void *)x8, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x8, _cffi_type(6), arg8) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { masked_minmax_float(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  { minmax_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_masked_minmax_float _cffi_d_masked_minmax_float
+#  define _cffi_f_minmax_uint16_wide _cffi_d_minmax_uint16_wide
 #endif
 
-static void _cffi_d_masked_ranged_hist_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint16_t x8, float x9, float x10)
+static void _cffi_d_ranged_hist_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint16_t x6, float x7, float x8, float * x9, float * x10)
 {
-  masked_ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+  ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_masked_ranged_hist_float(PyObject *self, PyObject *args)
+_cffi_f_ranged_hist_float(PyObject *self, PyObject *args)
 {
   char const * x0;
   uint16_t x1;
   uint16_t x2;
   uint32_t x3;
   uint32_t x4;
-  uint16_t const * x5;
-  uint16_t const * x6;
-  uint32_t * x7;
-  uint16_t x8;
-  float x9;
-  float x10;
+  uint32_t * x5;
+  uint16_t x6;
+  float x7;
+  float x8;
+  float * x9;
+  float * x10;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1421,17 +7128,15 @@ _cffi_f_masked_ranged_hist_float(PyObject *self, PyObject *args)
   PyObject *arg9;
   PyObject *arg10;
 
-  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_float", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+  if (!PyArg_UnpackTuple(args, "ranged_hist_float", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -1452,86 +7157,80 @@ _cffi_f_masked_ranged_hist_float(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg5, (char **)&x5);
+      _cffi_type(352), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(15), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
+  x6 = _cffi_to_c_int(arg6, uint16_t);
+  if (x6 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x7 = (float)_cffi_to_c_float(arg7);
+  if (x7 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = (float)_cffi_to_c_float(arg8);
+  if (x8 == (float)-1 && PyErr_Occurred())
+    return NULL;
+
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg6, (char **)&x6);
+      _cffi_type(32), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(15), arg6) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg7, (char **)&x7);
+      _cffi_type(32), arg10, (char **)&x10);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(28), arg7) < 0)
+    x10 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x8 = _cffi_to_c_int(arg8, uint16_t);
-  if (x8 == (uint16_t)-1 && PyErr_Occurred())
-    return NULL;
-
-  x9 = (float)_cffi_to_c_float(arg9);
-  if (x9 == (float)-1 && PyErr_Occurred())
-    return NULL;
-
-  x10 = (float)_cffi_to_c_float(arg10);
-  if (x10 == (float)-1 && PyErr_Occurred())
-    return NULL;
-
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { masked_ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  { ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_masked_ranged_hist_float _cffi_d_masked_ranged_hist_float
+#  define _cffi_f_ranged_hist_float _cffi_d_ranged_hist_float
 #endif
 
-static void _cffi_d_masked_ranged_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint16_t x8, uint16_t x9, uint16_t x10, uint16_t * x11, uint16_t * x12)
+static void _cffi_d_ranged_hist_float_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint16_t x6, float x7, float x8, float * x9, float * x10)
 {
-  masked_ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12);
+  ranged_hist_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_masked_ranged_hist_uint16(PyObject *self, PyObject *args)
+_cffi_f_ranged_hist_float_wide(PyObject *self, PyObject *args)
 {
   char const * x0;
-  uint16_t x1;
-  uint16_t x2;
-  uint32_t x3;
-  uint32_t x4;
-  uint16_t const * x5;
-  uint16_t const * x6;
-  uint32_t * x7;
-  uint16_t x8;
-  uint16_t x9;
-  uint16_t x10;
-  uint16_t * x11;
-  uint16_t * x12;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
+  uint16_t x6;
+  float x7;
+  float x8;
+  float * x9;
+  float * x10;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1543,141 +7242,110 @@ _cffi_f_masked_ranged_hist_uint16(PyObject *self, PyObject *args)
   PyObject *arg8;
   PyObject *arg9;
   PyObject *arg10;
-  PyObject *arg11;
-  PyObject *arg12;
 
-  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_uint16", 13, 13, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11, &arg12))
+  if (!PyArg_UnpackTuple(args, "ranged_hist_float_wide", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x1 = _cffi_to_c_int(arg1, uint16_t);
-  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x2 = _cffi_to_c_int(arg2, uint16_t);
-  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x3 = _cffi_to_c_int(arg3, uint32_t);
-  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x4 = _cffi_to_c_int(arg4, uint32_t);
-  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg5, (char **)&x5);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(15), arg5) < 0)
-      return NULL;
-  }
-
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg6, (char **)&x6);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(15), arg6) < 0)
-      return NULL;
-  }
-
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg7, (char **)&x7);
+      _cffi_type(56), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(28), arg7) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x8 = _cffi_to_c_int(arg8, uint16_t);
-  if (x8 == (uint16_t)-1 && PyErr_Occurred())
+  x6 = _cffi_to_c_int(arg6, uint16_t);
+  if (x6 == (uint16_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x9 = _cffi_to_c_int(arg9, uint16_t);
-  if (x9 == (uint16_t)-1 && PyErr_Occurred())
+  x7 = (float)_cffi_to_c_float(arg7);
+  if (x7 == (float)-1 && PyErr_Occurred())
     return NULL;
 
-  x10 = _cffi_to_c_int(arg10, uint16_t);
-  if (x10 == (uint16_t)-1 && PyErr_Occurred())
+  x8 = (float)_cffi_to_c_float(arg8);
+  if (x8 == (float)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg11, (char **)&x11);
+      _cffi_type(32), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x11 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x11, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x11, _cffi_type(45), arg11) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg12, (char **)&x12);
+      _cffi_type(32), arg10, (char **)&x10);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x12 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x12, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x12, _cffi_type(45), arg12) < 0)
+    x10 = ((size_t)datasize) <= 640 ? (float *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(32), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { masked_ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12); }
+  { ranged_hist_float_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_masked_ranged_hist_uint16 _cffi_d_masked_ranged_hist_uint16
+#  define _cffi_f_ranged_hist_float_wide _cffi_d_ranged_hist_float_wide
 #endif
 
-static void _cffi_d_masked_ranged_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint16_t const * x5, uint16_t const * x6, uint32_t * x7, uint8_t x8, uint8_t x9, uint8_t * x10, uint8_t * x11)
+static void _cffi_d_ranged_hist_int16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint16_t x6, int16_t x7, int16_t x8, int16_t * x9, int16_t * x10)
 {
-  masked_ranged_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11);
+  ranged_hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_masked_ranged_hist_uint8(PyObject *self, PyObject *args)
+_cffi_f_ranged_hist_int16(PyObject *self, PyObject *args)
 {
   char const * x0;
   uint16_t x1;
   uint16_t x2;
   uint32_t x3;
   uint32_t x4;
-  uint16_t const * x5;
-  uint16_t const * x6;
-  uint32_t * x7;
-  uint8_t x8;
-  uint8_t x9;
-  uint8_t * x10;
-  uint8_t * x11;
+  uint32_t * x5;
+  uint16_t x6;
+  int16_t x7;
+  int16_t x8;
+  int16_t * x9;
+  int16_t * x10;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1689,19 +7357,16 @@ _cffi_f_masked_ranged_hist_uint8(PyObject *self, PyObject *args)
   PyObject *arg8;
   PyObject *arg9;
   PyObject *arg10;
-  PyObject *arg11;
 
-  if (!PyArg_UnpackTuple(args, "masked_ranged_hist_uint8", 12, 12, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10, &arg11))
+  if (!PyArg_UnpackTuple(args, "ranged_hist_int16", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -1722,98 +7387,80 @@ _cffi_f_masked_ranged_hist_uint8(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg5, (char **)&x5);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(15), arg5) < 0)
-      return NULL;
-  }
-
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(15), arg6, (char **)&x6);
+      _cffi_type(352), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x6 = (uint16_t const *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(15), arg6) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg7, (char **)&x7);
-  if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x7 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x7, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x7, _cffi_type(28), arg7) < 0)
-      return NULL;
-  }
+  x6 = _cffi_to_c_int(arg6, uint16_t);
+  if (x6 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
 
-  x8 = _cffi_to_c_int(arg8, uint8_t);
-  if (x8 == (uint8_t)-1 && PyErr_Occurred())
+  x7 = _cffi_to_c_int(arg7, int16_t);
+  if (x7 == (int16_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x9 = _cffi_to_c_int(arg9, uint8_t);
-  if (x9 == (uint8_t)-1 && PyErr_Occurred())
+  x8 = _cffi_to_c_int(arg8, int16_t);
+  if (x8 == (int16_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg10, (char **)&x10);
+      _cffi_type(159), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x10 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x10, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x10, _cffi_type(57), arg10) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg11, (char **)&x11);
+      _cffi_type(159), arg10, (char **)&x10);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x11 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x11, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x11, _cffi_type(57), arg11) < 0)
+    x10 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { masked_ranged_hist_uint8(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11); }
+  { ranged_hist_int16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_masked_ranged_hist_uint8 _cffi_d_masked_ranged_hist_uint8
+#  define _cffi_f_ranged_hist_int16 _cffi_d_ranged_hist_int16
 #endif
 
-static void _cffi_d_minmax_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, float * x5, float * x6)
+static void _cffi_d_ranged_hist_int16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint16_t x6, int16_t x7, int16_t x8, int16_t * x9, int16_t * x10)
 {
-  minmax_float(x0, x1, x2, x3, x4, x5, x6);
+  ranged_hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_minmax_float(PyObject *self, PyObject *args)
+_cffi_f_ranged_hist_int16_wide(PyObject *self, PyObject *args)
 {
   char const * x0;
-  uint16_t x1;
-  uint16_t x2;
-  uint32_t x3;
-  uint32_t x4;
-  float * x5;
-  float * x6;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
+  uint16_t x6;
+  int16_t x7;
+  int16_t x8;
+  int16_t * x9;
+  int16_t * x10;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1821,80 +7468,100 @@ _cffi_f_minmax_float(PyObject *self, PyObject *args)
   PyObject *arg4;
   PyObject *arg5;
   PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
 
-  if (!PyArg_UnpackTuple(args, "minmax_float", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
+  if (!PyArg_UnpackTuple(args, "ranged_hist_int16_wide", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x1 = _cffi_to_c_int(arg1, uint16_t);
-  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x2 = _cffi_to_c_int(arg2, uint16_t);
-  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x3 = _cffi_to_c_int(arg3, uint32_t);
-  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x4 = _cffi_to_c_int(arg4, uint32_t);
-  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(6), arg5, (char **)&x5);
+      _cffi_type(56), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (float *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(6), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
+  x6 = _cffi_to_c_int(arg6, uint16_t);
+  if (x6 == (uint16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x7 = _cffi_to_c_int(arg7, int16_t);
+  if (x7 == (int16_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x8 = _cffi_to_c_int(arg8, int16_t);
+  if (x8 == (int16_t)-1 && PyErr_Occurred())
+    return NULL;
+
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(6), arg6, (char **)&x6);
+      _cffi_type(159), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
+    x9 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
-    x6 = (float *)alloca((size_t)datasize);
-    memset((void *)x6, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x6, _cffi_type(6), arg6) < 0)
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(159), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (int16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(159), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { minmax_float(x0, x1, x2, x3, x4, x5, x6); }
+  { ranged_hist_int16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_minmax_float _cffi_d_minmax_float
+#  define _cffi_f_ranged_hist_int16_wide _cffi_d_ranged_hist_int16_wide
 #endif
 
-static void _cffi_d_ranged_hist_float(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint16_t x6, float x7, float x8)
+static void _cffi_d_ranged_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint16_t x6, uint16_t x7, uint16_t x8, uint16_t * x9, uint16_t * x10)
 {
-  ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+  ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_ranged_hist_float(PyObject *self, PyObject *args)
+_cffi_f_ranged_hist_uint16(PyObject *self, PyObject *args)
 {
   char const * x0;
   uint16_t x1;
@@ -1903,9 +7570,12 @@ _cffi_f_ranged_hist_float(PyObject *self, PyObject *args)
   uint32_t x4;
   uint32_t * x5;
   uint16_t x6;
-  float x7;
-  float x8;
+  uint16_t x7;
+  uint16_t x8;
+  uint16_t * x9;
+  uint16_t * x10;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -1915,18 +7585,18 @@ _cffi_f_ranged_hist_float(PyObject *self, PyObject *args)
   PyObject *arg6;
   PyObject *arg7;
   PyObject *arg8;
+  PyObject *arg9;
+  PyObject *arg10;
 
-  if (!PyArg_UnpackTuple(args, "ranged_hist_float", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+  if (!PyArg_UnpackTuple(args, "ranged_hist_uint16", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -1947,13 +7617,11 @@ _cffi_f_ranged_hist_float(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg5, (char **)&x5);
+      _cffi_type(352), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(28), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -1961,48 +7629,68 @@ _cffi_f_ranged_hist_float(PyObject *self, PyObject *args)
   if (x6 == (uint16_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x7 = (float)_cffi_to_c_float(arg7);
-  if (x7 == (float)-1 && PyErr_Occurred())
+  x7 = _cffi_to_c_int(arg7, uint16_t);
+  if (x7 == (uint16_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x8 = (float)_cffi_to_c_float(arg8);
-  if (x8 == (float)-1 && PyErr_Occurred())
+  x8 = _cffi_to_c_int(arg8, uint16_t);
+  if (x8 == (uint16_t)-1 && PyErr_Occurred())
     return NULL;
 
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg10, (char **)&x10);
+  if (datasize != 0) {
+    x10 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { ranged_hist_float(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  { ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_ranged_hist_float _cffi_d_ranged_hist_float
+#  define _cffi_f_ranged_hist_uint16 _cffi_d_ranged_hist_uint16
 #endif
 
-static void _cffi_d_ranged_hist_uint16(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint16_t x6, uint16_t x7, uint16_t x8, uint16_t * x9, uint16_t * x10)
+static void _cffi_d_ranged_hist_uint16_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint16_t x6, uint16_t x7, uint16_t x8, uint16_t * x9, uint16_t * x10)
 {
-  ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
+  ranged_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10);
 }
 #ifndef PYPY_VERSION
 static PyObject *
-_cffi_f_ranged_hist_uint16(PyObject *self, PyObject *args)
+_cffi_f_ranged_hist_uint16_wide(PyObject *self, PyObject *args)
 {
   char const * x0;
-  uint16_t x1;
-  uint16_t x2;
-  uint32_t x3;
-  uint32_t x4;
-  uint32_t * x5;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
   uint16_t x6;
   uint16_t x7;
   uint16_t x8;
   uint16_t * x9;
   uint16_t * x10;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -2015,44 +7703,40 @@ _cffi_f_ranged_hist_uint16(PyObject *self, PyObject *args)
   PyObject *arg9;
   PyObject *arg10;
 
-  if (!PyArg_UnpackTuple(args, "ranged_hist_uint16", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
+  if (!PyArg_UnpackTuple(args, "ranged_hist_uint16_wide", 11, 11, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9, &arg10))
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
-  x1 = _cffi_to_c_int(arg1, uint16_t);
-  if (x1 == (uint16_t)-1 && PyErr_Occurred())
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x2 = _cffi_to_c_int(arg2, uint16_t);
-  if (x2 == (uint16_t)-1 && PyErr_Occurred())
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x3 = _cffi_to_c_int(arg3, uint32_t);
-  if (x3 == (uint32_t)-1 && PyErr_Occurred())
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
-  x4 = _cffi_to_c_int(arg4, uint32_t);
-  if (x4 == (uint32_t)-1 && PyErr_Occurred())
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg5, (char **)&x5);
+      _cffi_type(56), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(28), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -2069,39 +7753,36 @@ _cffi_f_ranged_hist_uint16(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg9, (char **)&x9);
+      _cffi_type(80), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x9 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x9, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x9, _cffi_type(45), arg9) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(45), arg10, (char **)&x10);
+      _cffi_type(80), arg10, (char **)&x10);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x10 = (uint16_t *)alloca((size_t)datasize);
-    memset((void *)x10, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x10, _cffi_type(45), arg10) < 0)
+    x10 = ((size_t)datasize) <= 640 ? (uint16_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg10, (char **)&x10,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   Py_BEGIN_ALLOW_THREADS
   _cffi_restore_errno();
-  { ranged_hist_uint16(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
+  { ranged_hist_uint16_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10); }
   _cffi_save_errno();
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
 #else
-#  define _cffi_f_ranged_hist_uint16 _cffi_d_ranged_hist_uint16
+#  define _cffi_f_ranged_hist_uint16_wide _cffi_d_ranged_hist_uint16_wide
 #endif
 
 static void _cffi_d_ranged_hist_uint8(char const * x0, uint16_t x1, uint16_t x2, uint32_t x3, uint32_t x4, uint32_t * x5, uint8_t x6, uint8_t x7, uint8_t * x8, uint8_t * x9)
@@ -2123,6 +7804,7 @@ _cffi_f_ranged_hist_uint8(PyObject *self, PyObject *args)
   uint8_t * x8;
   uint8_t * x9;
   Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
   PyObject *arg0;
   PyObject *arg1;
   PyObject *arg2;
@@ -2140,11 +7822,9 @@ _cffi_f_ranged_hist_uint8(PyObject *self, PyObject *args)
   datasize = _cffi_prepare_pointer_call_argument(
       _cffi_type(1), arg0, (char **)&x0);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x0 = (char const *)alloca((size_t)datasize);
-    memset((void *)x0, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x0, _cffi_type(1), arg0) < 0)
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -2165,13 +7845,11 @@ _cffi_f_ranged_hist_uint8(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(28), arg5, (char **)&x5);
+      _cffi_type(352), arg5, (char **)&x5);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x5 = (uint32_t *)alloca((size_t)datasize);
-    memset((void *)x5, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x5, _cffi_type(28), arg5) < 0)
+    x5 = ((size_t)datasize) <= 640 ? (uint32_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(352), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -2184,24 +7862,20 @@ _cffi_f_ranged_hist_uint8(PyObject *self, PyObject *args)
     return NULL;
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg8, (char **)&x8);
+      _cffi_type(99), arg8, (char **)&x8);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x8 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x8, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x8, _cffi_type(57), arg8) < 0)
+    x8 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
   datasize = _cffi_prepare_pointer_call_argument(
-      _cffi_type(57), arg9, (char **)&x9);
+      _cffi_type(99), arg9, (char **)&x9);
   if (datasize != 0) {
-    if (datasize < 0)
-      return NULL;
-    x9 = (uint8_t *)alloca((size_t)datasize);
-    memset((void *)x9, 0, (size_t)datasize);
-    if (_cffi_convert_array_from_object((char *)x9, _cffi_type(57), arg9) < 0)
+    x9 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
       return NULL;
   }
 
@@ -2212,6 +7886,7 @@ _cffi_f_ranged_hist_uint8(PyObject *self, PyObject *args)
   Py_END_ALLOW_THREADS
 
   (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
   Py_INCREF(Py_None);
   return Py_None;
 }
@@ -2219,19 +7894,160 @@ _cffi_f_ranged_hist_uint8(PyObject *self, PyObject *args)
 #  define _cffi_f_ranged_hist_uint8 _cffi_d_ranged_hist_uint8
 #endif
 
+static void _cffi_d_ranged_hist_uint8_wide(char const * x0, size_t x1, size_t x2, size_t x3, size_t x4, uint64_t * x5, uint8_t x6, uint8_t x7, uint8_t * x8, uint8_t * x9)
+{
+  ranged_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_ranged_hist_uint8_wide(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  size_t x2;
+  size_t x3;
+  size_t x4;
+  uint64_t * x5;
+  uint8_t x6;
+  uint8_t x7;
+  uint8_t * x8;
+  uint8_t * x9;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+  PyObject *arg9;
+
+  if (!PyArg_UnpackTuple(args, "ranged_hist_uint8_wide", 10, 10, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8, &arg9))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(56), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(56), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x6 = _cffi_to_c_int(arg6, uint8_t);
+  if (x6 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x7 = _cffi_to_c_int(arg7, uint8_t);
+  if (x7 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(99), arg9, (char **)&x9);
+  if (datasize != 0) {
+    x9 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(99), arg9, (char **)&x9,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { ranged_hist_uint8_wide(x0, x1, x2, x3, x4, x5, x6, x7, x8, x9); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_ranged_hist_uint8_wide _cffi_d_ranged_hist_uint8_wide
+#endif
+
 static const struct _cffi_global_s _cffi_globals[] = {
-  { "hist_uint16", (void *)_cffi_f_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 121), (void *)_cffi_d_hist_uint16 },
-  { "hist_uint8", (void *)_cffi_f_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 111), (void *)_cffi_d_hist_uint8 },
-  { "masked_hist_uint16", (void *)_cffi_f_masked_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 60), (void *)_cffi_d_masked_hist_uint16 },
-  { "masked_hist_uint8", (void *)_cffi_f_masked_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 48), (void *)_cffi_d_masked_hist_uint8 },
-  { "masked_minmax_float", (void *)_cffi_f_masked_minmax_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_masked_minmax_float },
-  { "masked_ranged_hist_float", (void *)_cffi_f_masked_ranged_hist_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 20), (void *)_cffi_d_masked_ranged_hist_float },
-  { "masked_ranged_hist_uint16", (void *)_cffi_f_masked_ranged_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 33), (void *)_cffi_d_masked_ranged_hist_uint16 },
-  { "masked_ranged_hist_uint8", (void *)_cffi_f_masked_ranged_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 73), (void *)_cffi_d_masked_ranged_hist_uint8 },
-  { "minmax_float", (void *)_cffi_f_minmax_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 0), (void *)_cffi_d_minmax_float },
-  { "ranged_hist_float", (void *)_cffi_f_ranged_hist_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 87), (void *)_cffi_d_ranged_hist_float },
-  { "ranged_hist_uint16", (void *)_cffi_f_ranged_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 98), (void *)_cffi_d_ranged_hist_uint16 },
-  { "ranged_hist_uint8", (void *)_cffi_f_ranged_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 132), (void *)_cffi_d_ranged_hist_uint8 },
+  { "channel_hist_float", (void *)_cffi_f_channel_hist_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 441), (void *)_cffi_d_channel_hist_float },
+  { "channel_hist_float_wide", (void *)_cffi_f_channel_hist_float_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 46), (void *)_cffi_d_channel_hist_float_wide },
+  { "channel_hist_uint16", (void *)_cffi_f_channel_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 457), (void *)_cffi_d_channel_hist_uint16 },
+  { "channel_hist_uint16_wide", (void *)_cffi_f_channel_hist_uint16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 62), (void *)_cffi_d_channel_hist_uint16_wide },
+  { "channel_hist_uint8", (void *)_cffi_f_channel_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 480), (void *)_cffi_d_channel_hist_uint8 },
+  { "channel_hist_uint8_wide", (void *)_cffi_f_channel_hist_uint8_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 85), (void *)_cffi_d_channel_hist_uint8_wide },
+  { "channel_minmax_float", (void *)_cffi_f_channel_minmax_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 499), (void *)_cffi_d_channel_minmax_float },
+  { "channel_minmax_float_wide", (void *)_cffi_f_channel_minmax_float_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 104), (void *)_cffi_d_channel_minmax_float_wide },
+  { "copy_pixels", (void *)_cffi_f_copy_pixels, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 13), (void *)_cffi_d_copy_pixels },
+  { "copy_pixels_wide", (void *)_cffi_f_copy_pixels_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 0), (void *)_cffi_d_copy_pixels_wide },
+  { "hist_int16", (void *)_cffi_f_hist_int16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 564), (void *)_cffi_d_hist_int16 },
+  { "hist_int16_wide", (void *)_cffi_f_hist_int16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 278), (void *)_cffi_d_hist_int16_wide },
+  { "hist_uint16", (void *)_cffi_f_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 575), (void *)_cffi_d_hist_uint16 },
+  { "hist_uint16_wide", (void *)_cffi_f_hist_uint16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 289), (void *)_cffi_d_hist_uint16_wide },
+  { "hist_uint8", (void *)_cffi_f_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 554), (void *)_cffi_d_hist_uint8 },
+  { "hist_uint8_wide", (void *)_cffi_f_hist_uint8_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 268), (void *)_cffi_d_hist_uint8_wide },
+  { "masked_hist_int16", (void *)_cffi_f_masked_hist_int16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 401), (void *)_cffi_d_masked_hist_int16 },
+  { "masked_hist_int16_wide", (void *)_cffi_f_masked_hist_int16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 189), (void *)_cffi_d_masked_hist_int16_wide },
+  { "masked_hist_uint16", (void *)_cffi_f_masked_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 414), (void *)_cffi_d_masked_hist_uint16 },
+  { "masked_hist_uint16_wide", (void *)_cffi_f_masked_hist_uint16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 202), (void *)_cffi_d_masked_hist_uint16_wide },
+  { "masked_hist_uint8", (void *)_cffi_f_masked_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 389), (void *)_cffi_d_masked_hist_uint8 },
+  { "masked_hist_uint8_wide", (void *)_cffi_f_masked_hist_uint8_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 177), (void *)_cffi_d_masked_hist_uint8_wide },
+  { "masked_minmax_float", (void *)_cffi_f_masked_minmax_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 321), (void *)_cffi_d_masked_minmax_float },
+  { "masked_minmax_float_wide", (void *)_cffi_f_masked_minmax_float_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 35), (void *)_cffi_d_masked_minmax_float_wide },
+  { "masked_ranged_hist_float", (void *)_cffi_f_masked_ranged_hist_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 344), (void *)_cffi_d_masked_ranged_hist_float },
+  { "masked_ranged_hist_float_wide", (void *)_cffi_f_masked_ranged_hist_float_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 132), (void *)_cffi_d_masked_ranged_hist_float_wide },
+  { "masked_ranged_hist_int16", (void *)_cffi_f_masked_ranged_hist_int16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 359), (void *)_cffi_d_masked_ranged_hist_int16 },
+  { "masked_ranged_hist_int16_wide", (void *)_cffi_f_masked_ranged_hist_int16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 147), (void *)_cffi_d_masked_ranged_hist_int16_wide },
+  { "masked_ranged_hist_uint16", (void *)_cffi_f_masked_ranged_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 374), (void *)_cffi_d_masked_ranged_hist_uint16 },
+  { "masked_ranged_hist_uint16_wide", (void *)_cffi_f_masked_ranged_hist_uint16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 162), (void *)_cffi_d_masked_ranged_hist_uint16_wide },
+  { "masked_ranged_hist_uint8", (void *)_cffi_f_masked_ranged_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 427), (void *)_cffi_d_masked_ranged_hist_uint8 },
+  { "masked_ranged_hist_uint8_wide", (void *)_cffi_f_masked_ranged_hist_uint8_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 215), (void *)_cffi_d_masked_ranged_hist_uint8_wide },
+  { "minmax_float", (void *)_cffi_f_minmax_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 312), (void *)_cffi_d_minmax_float },
+  { "minmax_float_wide", (void *)_cffi_f_minmax_float_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 26), (void *)_cffi_d_minmax_float_wide },
+  { "minmax_uint16", (void *)_cffi_f_minmax_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 332), (void *)_cffi_d_minmax_uint16 },
+  { "minmax_uint16_wide", (void *)_cffi_f_minmax_uint16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 120), (void *)_cffi_d_minmax_uint16_wide },
+  { "ranged_hist_float", (void *)_cffi_f_ranged_hist_float, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 515), (void *)_cffi_d_ranged_hist_float },
+  { "ranged_hist_float_wide", (void *)_cffi_f_ranged_hist_float_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 229), (void *)_cffi_d_ranged_hist_float_wide },
+  { "ranged_hist_int16", (void *)_cffi_f_ranged_hist_int16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 528), (void *)_cffi_d_ranged_hist_int16 },
+  { "ranged_hist_int16_wide", (void *)_cffi_f_ranged_hist_int16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 242), (void *)_cffi_d_ranged_hist_int16_wide },
+  { "ranged_hist_uint16", (void *)_cffi_f_ranged_hist_uint16, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 541), (void *)_cffi_d_ranged_hist_uint16 },
+  { "ranged_hist_uint16_wide", (void *)_cffi_f_ranged_hist_uint16_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 255), (void *)_cffi_d_ranged_hist_uint16_wide },
+  { "ranged_hist_uint8", (void *)_cffi_f_ranged_hist_uint8, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 586), (void *)_cffi_d_ranged_hist_uint8 },
+  { "ranged_hist_uint8_wide", (void *)_cffi_f_ranged_hist_uint8_wide, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 300), (void *)_cffi_d_ranged_hist_uint8_wide },
 };
 
 static const struct _cffi_type_context_s _cffi_type_context = {
@@ -2241,40 +8057,39 @@ static const struct _cffi_type_context_s _cffi_type_context = {
   NULL,  /* no struct_unions */
   NULL,  /* no enums */
   NULL,  /* no typenames */
-  12,  /* num_globals */
+  44,  /* num_globals */
   0,  /* num_struct_unions */
   0,  /* num_enums */
   0,  /* num_typenames */
   NULL,  /* no includes */
-  146,  /* num_types */
+  601,  /* num_types */
   0,  /* flags */
 };
 
+#ifdef __GNUC__
+#  pragma GCC visibility push(default)  /* for -fvisibility= */
+#endif
+
 #ifdef PYPY_VERSION
 PyMODINIT_FUNC
 _cffi_pypyinit__histogram(const void *p[])
 {
     p[0] = (const void *)0x2601;
     p[1] = &_cffi_type_context;
+    return NULL;
 }
 #  ifdef _MSC_VER
      PyMODINIT_FUNC
-#  if PY_MAJOR_VERSION >= 3
      PyInit__histogram(void) { return NULL; }
-#  else
-     init_histogram(void) { }
-#  endif
 #  endif
-#elif PY_MAJOR_VERSION >= 3
-PyMODINIT_FUNC
-PyInit__histogram(void)
-{
-  return _cffi_init("_histogram", 0x2601, &_cffi_type_context);
-}
 #else
 PyMODINIT_FUNC
-init_histogram(void)
+PyInit__histogram(void)
 {
-  _cffi_init("_histogram", 0x2601, &_cffi_type_context);
+  return _cffi_init("ris_widget.histogram._histogram", 0x2601, &_cffi_type_context);
 }
 #endif
+
+#ifdef __GNUC__
+#  pragma GCC visibility pop
+#endif
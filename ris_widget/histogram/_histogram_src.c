@@ -2,148 +2,404 @@
 
 #include <inttypes.h>
 #include <math.h>
+#include <stddef.h>
+#include <string.h>
 
-void hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint8_t *min, uint8_t *max) {
-    uint8_t working_min = *(uint8_t *) image;
-    uint8_t working_max = *(uint8_t *) image;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            histogram[val]++;
+// DIM_T (image dimensions and mask spans), STRIDE_T (byte strides) and COUNT_T (histogram bin counts)
+// are filled in by build_histogram.py, which compiles each kernel once with narrow types for ordinary
+// images and once more, with a "_wide" suffix, with types large enough for any image.
+
+// The integral kernels count consecutive pixels in SUB_HISTS interleaved sub-histograms, which are summed
+// at the end. Counting every pixel in the same histogram stalls whenever neighboring pixels fall in the
+// same bin (as is common in dark backgrounds), as each increment must wait for the previous one to be
+// stored. Rows of contiguous pixels are read through typed pointers, and their min and max are found in a
+// separate pass over each row while it is in cache, which the compiler can vectorize. Out-of-range values
+// are counted in a discard bin past the end of each sub-histogram, rather than branched around.
+// This is a trade-off for uint16 images: those with dark backgrounds or little variation are histogrammed
+// about 2.5 times as fast as by counting every pixel in one histogram, but uniformly distributed values,
+// which rarely repeat a bin, about 10% more slowly.
+// Unranged uint16 histograms have UINT16_BINS bins (shift is image_bits - 10); values beyond image_bits
+// are discarded. Ranged uint16 histograms may have at most UINT16_BINS bins.
+// int16 images are histogrammed by the uint16 kernels with offset binning: each value is xored with flip
+// (INT16_FLIP, rather than 0, for int16 images), which maps int16 values in order onto uint16 values (value +
+// 32768), so that the bins and min and max are those of the offset values.
+
+#define SUB_HISTS 4
+#define UINT8_BINS 256
+#define UINT16_BINS 1024
+#define INT16_FLIP 0x8000
+
+// bin_uint8 holds the bin (or discard bin) of each uint8 value
+static inline void row_hist_uint8(const char *row, size_t n, STRIDE_T c_stride, const uint16_t *bin_uint8,
+    COUNT_T *sub_hists, uint8_t *min, uint8_t *max) {
+    COUNT_T *h0 = sub_hists, *h1 = h0 + UINT8_BINS + 1, *h2 = h1 + UINT8_BINS + 1, *h3 = h2 + UINT8_BINS + 1;
+    uint8_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint8_t)) {
+        const uint8_t *p = (const uint8_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[bin_uint8[p[i]]]++;
+            h1[bin_uint8[p[i+1]]]++;
+            h2[bin_uint8[p[i+2]]]++;
+            h3[bin_uint8[p[i+3]]]++;
+        }
+        for (; i < n; i++) h0[bin_uint8[p[i]]]++;
+        for (i = 0; i < n; i++) {
+            working_min = p[i] < working_min ? p[i] : working_min;
+            working_max = p[i] > working_max ? p[i] : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint8_t val0 = *(const uint8_t *) pixel, val1 = *(const uint8_t *) (pixel + c_stride),
+                val2 = *(const uint8_t *) (pixel + 2*c_stride), val3 = *(const uint8_t *) (pixel + 3*c_stride);
+            h0[bin_uint8[val0]]++;
+            h1[bin_uint8[val1]]++;
+            h2[bin_uint8[val2]]++;
+            h3[bin_uint8[val3]]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint8_t val = *(const uint8_t *) pixel;
+            h0[bin_uint8[val]]++;
             if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+            if (val > working_max) working_max = val;
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void ranged_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
-    uint8_t working_min = *(uint8_t *) image;
-    uint8_t working_max = *(uint8_t *) image;
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            if (val >= hist_min && val <= hist_max) histogram[val - hist_min]++;
+static inline uint16_t shifted_bin_uint16(uint16_t val, uint8_t shift) {
+    uint16_t bin = val >> shift;
+    return bin < UINT16_BINS ? bin : UINT16_BINS;
+}
+
+static inline uint16_t ranged_bin_uint16(uint16_t val, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
+    float bin_factor) {
+    if (val >= hist_min && val < hist_max) return (uint16_t) (bin_factor * (val - hist_min));
+    return val == hist_max ? n_bins - 1 : UINT16_BINS;
+}
+
+static inline void row_hist_uint16(const char *row, size_t n, STRIDE_T c_stride, uint16_t flip, uint8_t shift,
+    COUNT_T *sub_hists, uint16_t *min, uint16_t *max) {
+    COUNT_T *h0 = sub_hists, *h1 = h0 + UINT16_BINS + 1, *h2 = h1 + UINT16_BINS + 1, *h3 = h2 + UINT16_BINS + 1;
+    uint16_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint16_t)) {
+        const uint16_t *p = (const uint16_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[shifted_bin_uint16(p[i] ^ flip, shift)]++;
+            h1[shifted_bin_uint16(p[i+1] ^ flip, shift)]++;
+            h2[shifted_bin_uint16(p[i+2] ^ flip, shift)]++;
+            h3[shifted_bin_uint16(p[i+3] ^ flip, shift)]++;
+        }
+        for (; i < n; i++) h0[shifted_bin_uint16(p[i] ^ flip, shift)]++;
+        for (i = 0; i < n; i++) {
+            uint16_t val = p[i] ^ flip;
+            working_min = val < working_min ? val : working_min;
+            working_max = val > working_max ? val : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint16_t val0 = *(const uint16_t *) pixel ^ flip, val1 = *(const uint16_t *) (pixel + c_stride) ^ flip,
+                val2 = *(const uint16_t *) (pixel + 2*c_stride) ^ flip, val3 = *(const uint16_t *) (pixel + 3*c_stride) ^ flip;
+            h0[shifted_bin_uint16(val0, shift)]++;
+            h1[shifted_bin_uint16(val1, shift)]++;
+            h2[shifted_bin_uint16(val2, shift)]++;
+            h3[shifted_bin_uint16(val3, shift)]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint16_t val = *(const uint16_t *) pixel ^ flip;
+            h0[shifted_bin_uint16(val, shift)]++;
             if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+            if (val > working_max) working_max = val;
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void masked_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t *min, uint8_t *max) {
-        // ends are exclusive bounds
-    uint8_t working_min, working_max;
-    working_min = working_max = *(uint8_t *) (image + (*starts)*c_stride);
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            histogram[val]++;
+static inline void row_ranged_hist_uint16(const char *row, size_t n, STRIDE_T c_stride, uint16_t flip, uint16_t n_bins,
+    uint16_t hist_min, uint16_t hist_max, float bin_factor, COUNT_T *sub_hists, uint16_t *min, uint16_t *max) {
+    COUNT_T *h0 = sub_hists, *h1 = h0 + UINT16_BINS + 1, *h2 = h1 + UINT16_BINS + 1, *h3 = h2 + UINT16_BINS + 1;
+    uint16_t working_min = *min, working_max = *max;
+    size_t i;
+    if (c_stride == sizeof(uint16_t)) {
+        const uint16_t *p = (const uint16_t *) row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS) {
+            h0[ranged_bin_uint16(p[i] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h1[ranged_bin_uint16(p[i+1] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h2[ranged_bin_uint16(p[i+2] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+            h3[ranged_bin_uint16(p[i+3] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+        }
+        for (; i < n; i++) h0[ranged_bin_uint16(p[i] ^ flip, n_bins, hist_min, hist_max, bin_factor)]++;
+        for (i = 0; i < n; i++) {
+            uint16_t val = p[i] ^ flip;
+            working_min = val < working_min ? val : working_min;
+            working_max = val > working_max ? val : working_max;
+        }
+    } else {
+        const char *pixel = row;
+        for (i = 0; i + SUB_HISTS <= n; i += SUB_HISTS, pixel += SUB_HISTS*c_stride) {
+            uint16_t val0 = *(const uint16_t *) pixel ^ flip, val1 = *(const uint16_t *) (pixel + c_stride) ^ flip,
+                val2 = *(const uint16_t *) (pixel + 2*c_stride) ^ flip, val3 = *(const uint16_t *) (pixel + 3*c_stride) ^ flip;
+            h0[ranged_bin_uint16(val0, n_bins, hist_min, hist_max, bin_factor)]++;
+            h1[ranged_bin_uint16(val1, n_bins, hist_min, hist_max, bin_factor)]++;
+            h2[ranged_bin_uint16(val2, n_bins, hist_min, hist_max, bin_factor)]++;
+            h3[ranged_bin_uint16(val3, n_bins, hist_min, hist_max, bin_factor)]++;
+            if (val0 < working_min) working_min = val0;
+            if (val0 > working_max) working_max = val0;
+            if (val1 < working_min) working_min = val1;
+            if (val1 > working_max) working_max = val1;
+            if (val2 < working_min) working_min = val2;
+            if (val2 > working_max) working_max = val2;
+            if (val3 < working_min) working_min = val3;
+            if (val3 > working_max) working_max = val3;
+        }
+        for (; i < n; i++, pixel += c_stride) {
+            uint16_t val = *(const uint16_t *) pixel ^ flip;
+            h0[ranged_bin_uint16(val, n_bins, hist_min, hist_max, bin_factor)]++;
             if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+            if (val > working_max) working_max = val;
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void masked_ranged_hist_uint8(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
-        // ends are exclusive bounds
-    uint8_t working_min, working_max;
-    working_min = working_max = *(uint8_t *) (image + (*starts)*c_stride);
-    const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint8_t val = *(uint8_t *) pixel;
-            if (val >= hist_min && val <= hist_max) histogram[val - hist_min]++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
-        }
+static inline void merge_sub_hists(const COUNT_T *sub_hists, uint16_t sub_hist_bins, uint16_t n_bins, COUNT_T *histogram) {
+    // each sub-histogram has sub_hist_bins bins, plus the discard bin
+    uint16_t bin;
+    uint8_t s;
+    for (s = 0; s < SUB_HISTS; s++) {
+        for (bin = 0; bin < n_bins; bin++) histogram[bin] += sub_hists[s*(sub_hist_bins + 1) + bin];
+    }
+}
+
+static void hist_uint8_impl(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint8_t hist_min, uint8_t hist_max,
+    uint8_t *min, uint8_t *max) {
+    // starts and ends may be NULL for no mask; ends are exclusive bounds
+    COUNT_T sub_hists[SUB_HISTS*(UINT8_BINS + 1)] = {0};
+    uint16_t bin_uint8[UINT8_BINS];
+    uint8_t working_min = UINT8_MAX, working_max = 0;
+    const char *row_start;
+    DIM_T start, end;
+    unsigned val;
+    for (val = 0; val < UINT8_BINS; val++) bin_uint8[val] = val >= hist_min && val <= hist_max ? val - hist_min : UINT8_BINS;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        row_hist_uint8(row_start + start*c_stride, end - start, c_stride, bin_uint8, sub_hists, &working_min, &working_max);
     }
+    merge_sub_hists(sub_hists, UINT8_BINS, UINT8_BINS, histogram);
     *min = working_min;
     *max = working_max;
 }
 
-void hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
-    uint16_t working_min = *(uint16_t *) image;
-    uint16_t working_max = *(uint16_t *) image;
-    const char *row_start, *pixel;
+static void hist_uint16_impl(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint16_t flip, uint8_t ranged, uint8_t shift,
+    uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
+    // starts and ends may be NULL for no mask; ends are exclusive bounds
+    COUNT_T sub_hists[SUB_HISTS*(UINT16_BINS + 1)] = {0};
+    uint16_t working_min = UINT16_MAX, working_max = 0;
+    float bin_factor = ranged ? (float) n_bins / (hist_max - hist_min) : 0;
+    const char *row_start;
+    DIM_T start, end;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            histogram[val >> shift]++;
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
-        }
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        if (ranged) row_ranged_hist_uint16(row_start + start*c_stride, end - start, c_stride, flip, n_bins, hist_min,
+            hist_max, bin_factor, sub_hists, &working_min, &working_max);
+        else row_hist_uint16(row_start + start*c_stride, end - start, c_stride, flip, shift, sub_hists, &working_min,
+            &working_max);
     }
+    merge_sub_hists(sub_hists, UINT16_BINS, ranged ? n_bins : UINT16_BINS, histogram);
     *min = working_min;
     *max = working_max;
 }
 
-void ranged_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
-    uint16_t working_min = *(uint16_t *) image;
-    uint16_t working_max = *(uint16_t *) image;
-    const char *row_start, *pixel;
-    float bin_factor = (float) n_bins / (hist_max - hist_min);
-    uint32_t *last_bin = histogram + n_bins - 1;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            if (val >= hist_min && val < hist_max) histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
-            else if (val == hist_max) (*last_bin)++;
+void hist_uint8(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, UINT8_MAX, min, max);
+}
 
-            if (val < working_min) working_min = val;
-            else if (val > working_max) working_max = val;
+void ranged_hist_uint8(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, hist_min, hist_max, min, max);
+}
+
+void masked_hist_uint8(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, UINT8_MAX, min, max);
+}
+
+void masked_ranged_hist_uint8(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint8_t hist_min, uint8_t hist_max, uint8_t *min, uint8_t *max) {
+    hist_uint8_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, hist_min, hist_max, min, max);
+}
+
+void hist_uint16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, 0, shift, 0, 0, 0, min, max);
+}
+
+void ranged_hist_uint16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, 0, 1, 0, n_bins, hist_min, hist_max, min, max);
+}
+
+void masked_hist_uint16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, 0, shift, 0, 0, 0, min, max);
+}
+
+void masked_ranged_hist_uint16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
+    uint16_t *min, uint16_t *max) {
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, 0, 1, 0, n_bins, hist_min, hist_max, min, max);
+}
+
+// min and max are flipped back from offset values; hist_min and hist_max are flipped to them.
+
+void hist_int16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint8_t shift, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, INT16_FLIP, 0, shift, 0, 0, 0,
+        &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void ranged_hist_int16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint16_t n_bins, int16_t hist_min, int16_t hist_max, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, NULL, NULL, histogram, INT16_FLIP, 1, 0, n_bins,
+        (uint16_t) hist_min ^ INT16_FLIP, (uint16_t) hist_max ^ INT16_FLIP, &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void masked_hist_int16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint8_t shift, int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, INT16_FLIP, 0, shift, 0, 0, 0,
+        &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+void masked_ranged_hist_int16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint16_t n_bins, int16_t hist_min, int16_t hist_max,
+    int16_t *min, int16_t *max) {
+    uint16_t offset_min, offset_max;
+    hist_uint16_impl(image, rows, cols, r_stride, c_stride, starts, ends, histogram, INT16_FLIP, 1, 0, n_bins,
+        (uint16_t) hist_min ^ INT16_FLIP, (uint16_t) hist_max ^ INT16_FLIP, &offset_min, &offset_max);
+    *min = (int16_t) (offset_min ^ INT16_FLIP);
+    *max = (int16_t) (offset_max ^ INT16_FLIP);
+}
+
+// The min and max alone, of uint16 values or, with flip INT16_FLIP, of offset int16 values (as for the
+// histogram kernels). starts and ends may be NULL for no mask; ends are exclusive bounds.
+void minmax_uint16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, uint16_t flip, uint16_t *min, uint16_t *max) {
+    uint16_t working_min = UINT16_MAX, working_max = 0;
+    const char *row_start;
+    DIM_T start, end;
+    size_t i, n;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        start = starts ? *starts++ : 0;
+        end = ends ? *ends++ : cols;
+        if (end <= start) continue;
+        n = end - start;
+        if (c_stride == sizeof(uint16_t)) {
+            // (integer min and max reductions may be reordered, so the compiler can vectorize this loop)
+            const uint16_t *p = (const uint16_t *) row_start + start;
+            for (i = 0; i < n; i++) {
+                uint16_t val = p[i] ^ flip;
+                working_min = val < working_min ? val : working_min;
+                working_max = val > working_max ? val : working_max;
+            }
+        } else {
+            const char *pixel = row_start + start*c_stride;
+            for (i = 0; i < n; i++, pixel += c_stride) {
+                uint16_t val = *(const uint16_t *) pixel ^ flip;
+                if (val < working_min) working_min = val;
+                if (val > working_max) working_max = val;
+            }
         }
     }
     *min = working_min;
     *max = working_max;
 }
 
-void masked_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint8_t shift, uint16_t *min, uint16_t *max) {
-    // ends are exclusive bounds
-    uint16_t working_min, working_max;
-    working_min = working_max = *(uint16_t *) (image + (*starts)*c_stride);
+// Contiguous rows are scanned in MINMAX_LANES independent lanes, which the compiler can vectorize (a single
+// running min and max cannot be, as floating-point min and max reductions may not be reordered).
+#define MINMAX_LANES 8
+
+void minmax_float(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    float *min, float *max) {
+    float working_min = *(float *) image;
+    float working_max = *(float *) image;
+    float lane_mins[MINMAX_LANES], lane_maxs[MINMAX_LANES];
     const char *row_start, *pixel;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            histogram[val >> shift]++;
+    size_t i, lane;
+    for (lane = 0; lane < MINMAX_LANES; lane++) lane_mins[lane] = lane_maxs[lane] = working_min;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        if (c_stride == sizeof(float)) {
+            const float *p = (const float *) row_start;
+            for (i = 0; i + MINMAX_LANES <= cols; i += MINMAX_LANES) {
+                for (lane = 0; lane < MINMAX_LANES; lane++) {
+                    lane_mins[lane] = p[i+lane] < lane_mins[lane] ? p[i+lane] : lane_mins[lane];
+                    lane_maxs[lane] = p[i+lane] > lane_maxs[lane] ? p[i+lane] : lane_maxs[lane];
+                }
+            }
+            pixel = row_start + i*c_stride;
+        } else {
+            pixel = row_start;
+        }
+        for (; pixel != row_start + cols*c_stride; pixel += c_stride) {
+            float val = *(float *) pixel;
             if (val < working_min) working_min = val;
             else if (val > working_max) working_max = val;
         }
     }
+    for (lane = 0; lane < MINMAX_LANES; lane++) {
+        if (lane_mins[lane] < working_min) working_min = lane_mins[lane];
+        if (lane_maxs[lane] > working_max) working_max = lane_maxs[lane];
+    }
     *min = working_min;
     *max = working_max;
 }
 
-void masked_ranged_hist_uint16(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t n_bins, uint16_t hist_min, uint16_t hist_max,
-    uint16_t *min, uint16_t *max) {
+void masked_minmax_float(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, float *min, float *max) {
     // ends are exclusive bounds
-    uint16_t working_min, working_max;
-    working_min = working_max = *(uint16_t *) (image + (*starts)*c_stride);
+    float working_min, working_max;
+    working_min = working_max = *(float *) (image + (*starts)*c_stride);
     const char *row_start, *pixel;
-    float bin_factor = (float) n_bins / (hist_max - hist_min);
-    uint32_t *last_bin = histogram + n_bins - 1;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
         for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            uint16_t val = *(uint16_t *) pixel;
-            if (val >= hist_min && val < hist_max) histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
-            else if (val == hist_max) (*last_bin)++;
-
+            float val = *(float *) pixel;
             if (val < working_min) working_min = val;
             else if (val > working_max) working_max = val;
         }
@@ -152,14 +408,20 @@ void masked_ranged_hist_uint16(const char *image, uint16_t rows, uint16_t cols,
     *max = working_max;
 }
 
-void minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    float *min, float *max) {
+void ranged_hist_float(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    COUNT_T *histogram, uint16_t n_bins, float hist_min, float hist_max, float *min, float *max) {
     float working_min = *(float *) image;
     float working_max = *(float *) image;
     const char *row_start, *pixel;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    COUNT_T *last_bin = histogram + n_bins - 1;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
         for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
             float val = *(float *) pixel;
+            if (val >= hist_min && val < hist_max)
+                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+            else if (val == hist_max) (*last_bin)++;
+
             if (val < working_min) working_min = val;
             else if (val > working_max) working_max = val;
         }
@@ -168,15 +430,22 @@ void minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_st
     *max = working_max;
 }
 
-void masked_minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, float *min, float *max) {
+void masked_ranged_hist_float(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, COUNT_T *histogram, uint16_t n_bins, float hist_min, float hist_max,
+    float *min, float *max) {
     // ends are exclusive bounds
     float working_min, working_max;
     working_min = working_max = *(float *) (image + (*starts)*c_stride);
     const char *row_start, *pixel;
+    float bin_factor = (float) n_bins / (hist_max - hist_min);
+    COUNT_T *last_bin = histogram + n_bins - 1;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
         for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
             float val = *(float *) pixel;
+            if (val >= hist_min && val < hist_max)
+                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+            else if (val == hist_max) (*last_bin)++;
+
             if (val < working_min) working_min = val;
             else if (val > working_max) working_max = val;
         }
@@ -185,33 +454,212 @@ void masked_minmax_float(const char *image, uint16_t rows, uint16_t cols, uint32
     *max = working_max;
 }
 
-void ranged_hist_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    uint32_t *histogram, uint16_t n_bins, float hist_min, float hist_max) {
-    const char *row_start, *pixel;
+// Multichannel kernels: each pixel has n_channels (at most 4) components, ch_stride bytes apart. For each
+// channel, the min, max and (if histograms is not NULL) histogram are accumulated in one pass; histograms
+// holds n_channels consecutive histograms of n_bins each, each followed by a discard bin for values
+// outside the histogram (as is luma_histogram). If luma_histogram is not NULL, the CIE 1931
+// linear luminance of the first three channels is also calculated and histogrammed on the fly, with
+// the same arithmetic as the equivalent numpy expression. starts and ends may be NULL for no mask.
+// As for a single channel, int16 images are histogrammed by the uint16 kernel, with offset binning.
+
+void channel_hist_uint8(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, STRIDE_T ch_stride, uint8_t n_channels,
+    COUNT_T *histograms, COUNT_T *luma_histogram, uint8_t hist_min, uint8_t hist_max,
+    uint8_t *mins, uint8_t *maxs, uint8_t *luma_min, uint8_t *luma_max) {
+    // ends are exclusive bounds
+    uint8_t working_mins[4] = {UINT8_MAX, UINT8_MAX, UINT8_MAX, UINT8_MAX}, working_maxs[4] = {0, 0, 0, 0};
+    uint8_t working_luma_min = UINT8_MAX, working_luma_max = 0;
+    const char *row_start, *pixel, *row_end;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                uint8_t val = *(uint8_t *) (pixel + c*ch_stride);
+                if (histograms && val >= hist_min && val <= hist_max) histograms[c*(UINT8_BINS + 1) + val - hist_min]++;
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma_histogram) {
+                uint8_t val = (uint8_t) (0.2126 * *(uint8_t *) pixel + 0.7152 * *(uint8_t *) (pixel + ch_stride) +
+                    0.0722 * *(uint8_t *) (pixel + 2*ch_stride));
+                if (val >= hist_min && val <= hist_max) luma_histogram[val - hist_min]++;
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
+
+void channel_hist_uint16(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, STRIDE_T ch_stride, uint8_t n_channels,
+    COUNT_T *histograms, COUNT_T *luma_histogram, uint16_t flip, uint8_t ranged, uint8_t shift, uint16_t n_bins,
+    uint16_t hist_min, uint16_t hist_max, uint16_t *mins, uint16_t *maxs, uint16_t *luma_min, uint16_t *luma_max) {
+    // ends are exclusive bounds. Each value is first xored with flip (INT16_FLIP for int16 images, else 0). If ranged
+    // is zero, values are binned by shifting right by shift bits (and those beyond the n_bins bins, i.e. beyond
+    // image_bits, are discarded); otherwise, values in [hist_min, hist_max] are binned into n_bins equal bins.
+    uint16_t working_mins[4] = {UINT16_MAX, UINT16_MAX, UINT16_MAX, UINT16_MAX}, working_maxs[4] = {0, 0, 0, 0};
+    uint16_t working_luma_min = UINT16_MAX, working_luma_max = 0;
+    const char *row_start, *pixel, *row_end;
     float bin_factor = (float) n_bins / (hist_max - hist_min);
-    uint32_t *last_bin = histogram + n_bins - 1;
+    uint8_t c;
     for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
-        for (pixel = row_start; pixel != row_start + cols*c_stride; pixel += c_stride) {
-            float val = *(float *) pixel;
-            if (val >= hist_min && val < hist_max)
-                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
-            else if (val == hist_max) (*last_bin)++;
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                uint16_t val = *(uint16_t *) (pixel + c*ch_stride) ^ flip;
+                if (histograms) {
+                    COUNT_T *histogram = histograms + c*(n_bins + 1);
+                    if (!ranged) histogram[val >> shift < n_bins ? val >> shift : n_bins]++;
+                    else if (val >= hist_min && val < hist_max) histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                    else if (val == hist_max) histogram[n_bins - 1]++;
+                }
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma_histogram) {
+                uint16_t val = (uint16_t) (0.2126 * (*(uint16_t *) pixel ^ flip) +
+                    0.7152 * (*(uint16_t *) (pixel + ch_stride) ^ flip) +
+                    0.0722 * (*(uint16_t *) (pixel + 2*ch_stride) ^ flip));
+                if (!ranged) luma_histogram[val >> shift < n_bins ? val >> shift : n_bins]++;
+                else if (val >= hist_min && val < hist_max) luma_histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                else if (val == hist_max) luma_histogram[n_bins - 1]++;
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
         }
     }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
 }
 
-void masked_ranged_hist_float(const char *image, uint16_t rows, uint16_t cols, uint32_t r_stride, uint32_t c_stride,
-    const uint16_t *starts, const uint16_t *ends, uint32_t *histogram, uint16_t n_bins, float hist_min, float hist_max) {
+void channel_minmax_float(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, STRIDE_T ch_stride, uint8_t n_channels,
+    uint8_t luma, float *mins, float *maxs, float *luma_min, float *luma_max) {
     // ends are exclusive bounds
-    const char *row_start, *pixel;
+    float working_mins[4] = {INFINITY, INFINITY, INFINITY, INFINITY}, working_maxs[4] = {-INFINITY, -INFINITY, -INFINITY, -INFINITY};
+    float working_luma_min = INFINITY, working_luma_max = -INFINITY;
+    const char *row_start, *pixel, *row_end;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            for (c = 0; c < n_channels; c++) {
+                float val = *(float *) (pixel + c*ch_stride);
+                if (val < working_mins[c]) working_mins[c] = val;
+                if (val > working_maxs[c]) working_maxs[c] = val;
+            }
+            if (luma) {
+                float val = 0.2126f * *(float *) pixel + 0.7152f * *(float *) (pixel + ch_stride) +
+                    0.0722f * *(float *) (pixel + 2*ch_stride);
+                if (val < working_luma_min) working_luma_min = val;
+                if (val > working_luma_max) working_luma_max = val;
+            }
+        }
+    }
+    for (c = 0; c < n_channels; c++) {
+        mins[c] = working_mins[c];
+        maxs[c] = working_maxs[c];
+    }
+    *luma_min = working_luma_min;
+    *luma_max = working_luma_max;
+}
+
+void channel_hist_float(const char *image, DIM_T rows, DIM_T cols, STRIDE_T r_stride, STRIDE_T c_stride,
+    const DIM_T *starts, const DIM_T *ends, STRIDE_T ch_stride, uint8_t n_channels,
+    COUNT_T *histograms, COUNT_T *luma_histogram, uint16_t n_bins, float hist_min, float hist_max) {
+    // ends are exclusive bounds
+    const char *row_start, *pixel, *row_end;
     float bin_factor = (float) n_bins / (hist_max - hist_min);
-    uint32_t *last_bin = histogram + n_bins - 1;
-    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride, starts++, ends++) {
-        for (pixel = row_start + (*starts)*c_stride; pixel != row_start + (*ends)*c_stride; pixel += c_stride) {
-            float val = *(float *) pixel;
-            if (val >= hist_min && val < hist_max)
-                histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
-            else if (val == hist_max) (*last_bin)++;
+    uint8_t c;
+    for (row_start = image; row_start != image + rows*r_stride; row_start += r_stride) {
+        pixel = starts ? row_start + (*starts++)*c_stride : row_start;
+        row_end = ends ? row_start + (*ends++)*c_stride : row_start + cols*c_stride;
+        for (; pixel != row_end; pixel += c_stride) {
+            if (histograms) {
+                for (c = 0; c < n_channels; c++) {
+                    float val = *(float *) (pixel + c*ch_stride);
+                    COUNT_T *histogram = histograms + c*(n_bins + 1);
+                    if (val >= hist_min && val < hist_max)
+                        histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                    else if (val == hist_max) histogram[n_bins - 1]++;
+                }
+            }
+            if (luma_histogram) {
+                float val = 0.2126f * *(float *) pixel + 0.7152f * *(float *) (pixel + ch_stride) +
+                    0.0722f * *(float *) (pixel + 2*ch_stride);
+                if (val >= hist_min && val < hist_max)
+                    luma_histogram[(uint16_t) (bin_factor * (val - hist_min))]++;
+                else if (val == hist_max) luma_histogram[n_bins - 1]++;
+            }
+        }
+    }
+}
+
+// Copying pixels between memory layouts (e.g. to transpose an image) one row at a time reads or writes with a
+// stride of a whole row, touching a new cache line for every pixel. copy_pixels instead copies square blocks
+// of COPY_BLOCK x COPY_BLOCK pixels, whose source and destination cache lines stay in cache while each block is
+// copied. Pixels have n_channels items of item_bytes (1, 2, 4, or 8) bytes each, and the destination's channels
+// must be contiguous. Within a block, the inner loop runs along the columns, so the destination's contiguous
+// axis should be the column axis.
+
+#define COPY_BLOCK 64
+
+// item_bytes is a constant in each call, so that the memcpy calls compile to single loads and stores
+static inline void copy_block(const char *src, char *dst, DIM_T rows, DIM_T cols, STRIDE_T src_r_stride,
+    STRIDE_T src_c_stride, STRIDE_T src_channel_stride, STRIDE_T dst_r_stride, STRIDE_T dst_c_stride,
+    uint8_t n_channels, const size_t item_bytes) {
+    DIM_T r, c;
+    uint8_t channel;
+    for (r = 0; r < rows; r++) {
+        const char *src_pixel = src + r * src_r_stride;
+        char *dst_pixel = dst + r * dst_r_stride;
+        if (n_channels == 1) {
+            for (c = 0; c < cols; c++, src_pixel += src_c_stride, dst_pixel += dst_c_stride) {
+                memcpy(dst_pixel, src_pixel, item_bytes);
+            }
+        } else {
+            for (c = 0; c < cols; c++, src_pixel += src_c_stride, dst_pixel += dst_c_stride) {
+                for (channel = 0; channel < n_channels; channel++) {
+                    memcpy(dst_pixel + channel * item_bytes, src_pixel + channel * src_channel_stride, item_bytes);
+                }
+            }
         }
     }
-}
\ No newline at end of file
+}
+
+void copy_pixels(const char *src, char *dst, DIM_T rows, DIM_T cols, STRIDE_T src_r_stride, STRIDE_T src_c_stride,
+    STRIDE_T src_channel_stride, STRIDE_T dst_r_stride, STRIDE_T dst_c_stride, uint8_t n_channels, uint8_t item_bytes) {
+    DIM_T r0, c0, block_rows, block_cols;
+    for (r0 = 0; r0 < rows; r0 += block_rows) {
+        block_rows = rows - r0 < COPY_BLOCK ? rows - r0 : COPY_BLOCK;
+        for (c0 = 0; c0 < cols; c0 += block_cols) {
+            const char *src_block = src + r0 * src_r_stride + c0 * src_c_stride;
+            char *dst_block = dst + r0 * dst_r_stride + c0 * dst_c_stride;
+            block_cols = cols - c0 < COPY_BLOCK ? cols - c0 : COPY_BLOCK;
+            switch (item_bytes) {
+                case 1: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 1); break;
+                case 2: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 2); break;
+                case 4: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 4); break;
+                case 8: copy_block(src_block, dst_block, block_rows, block_cols, src_r_stride, src_c_stride,
+                    src_channel_stride, dst_r_stride, dst_c_stride, n_channels, 8); break;
+            }
+        }
+    }
+}
@@ -0,0 +1,85 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+"""Time the histogram kernels, and the copy kernel used by Image to change memory layouts, on synthetic
+images. Run as:
+    python -m ris_widget.histogram.benchmark [repeats]
+"""
+
+import sys
+import time
+import numpy
+
+from .histogram import histogram
+from . import transpose
+
+SHAPE = (2560, 2160) # sCMOS camera frame
+COPY_SHAPE = (2048, 2048) # 4 megapixels
+
+def _images():
+    rng = numpy.random.default_rng(0)
+    uniform8 = rng.integers(0, 256, size=SHAPE, dtype=numpy.uint8)
+    uniform16 = rng.integers(0, 65536, size=SHAPE, dtype=numpy.uint16)
+    # A dark background with a little read noise: most neighboring pixels fall in the same few bins.
+    dark = rng.normal(100, 3, size=SHAPE).round()
+    yield 'uint8 uniform', uniform8, {}
+    yield 'uint8 dark', dark.astype(numpy.uint8), {}
+    yield 'uint16 uniform', uniform16, {}
+    yield 'uint16 dark', dark.astype(numpy.uint16), {}
+    yield '12-bit uniform', uniform16 >> 4, dict(image_bits=12)
+    yield '12-bit dark', dark.astype(numpy.uint16), dict(image_bits=12)
+    yield '12-bit dark, ranged', dark.astype(numpy.uint16), dict(image_bits=12, range=(50, 150))
+    yield '12-bit dark, masked', dark.astype(numpy.uint16), dict(image_bits=12, mask_geometry=(0.5, 0.5, 0.5))
+
+def _best_time(func, repeats):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+def run(repeats=10):
+    """Print the best time of each kernel over the given number of repeats, single-threaded, for images with
+    contiguous pixels and with pixels two apart (as in the gray channel of a GA image). numpy.bincount, which
+    counts one value at a time, is timed for comparison."""
+    print('{:<24} {:>12} {:>12} {:>12}'.format('image', 'contiguous', 'strided', 'bincount'))
+    for name, image, kws in _images():
+        contiguous = numpy.asfortranarray(image)
+        strided = numpy.repeat(contiguous[:,:,numpy.newaxis], 2, axis=2)[:,:,0]
+        t_contiguous = _best_time(lambda: histogram(contiguous, threads=1, **kws), repeats)
+        t_strided = _best_time(lambda: histogram(strided, threads=1, **kws), repeats)
+        flat = contiguous.ravel(order='F')
+        t_bincount = _best_time(lambda: numpy.bincount(flat, minlength=256), repeats)
+        print('{:<24} {:>10.2f}ms {:>10.2f}ms {:>10.2f}ms'.format(name, 1000*t_contiguous, 1000*t_strided, 1000*t_bincount))
+
+def _copy_sources():
+    rng = numpy.random.default_rng(0)
+    for dtype in (numpy.uint16, numpy.float32):
+        image = numpy.asfortranarray(rng.integers(0, 4096, size=COPY_SHAPE).astype(dtype))
+        name = numpy.dtype(dtype).name
+        yield name + ' transpose', numpy.ascontiguousarray(image), 'F'
+        yield name + ' crop', image[32:-32, 32:-32], 'F'
+        yield name + ' subsample', image[::2, ::2], 'F'
+
+def _flat_copy(src, order):
+    dst = numpy.empty(src.shape, src.dtype, order=order)
+    dst.flat = src.flat
+    return dst
+
+def run_copy(repeats=10):
+    """Print the best time to copy 4-megapixel (x, y) arrays into Fortran order, as Image does for arrays
+    it cannot use as-is: by assignment through .flat (as Image formerly did), with numpy.copyto, and with
+    transpose.copy, single-threaded and with all available CPUs."""
+    print('{:<24} {:>12} {:>12} {:>12} {:>12}'.format('copy', '.flat', 'copyto', '1 thread', 'all threads'))
+    for name, src, order in _copy_sources():
+        dst = numpy.empty(src.shape, src.dtype, order=order)
+        t_flat = _best_time(lambda: _flat_copy(src, order), repeats)
+        t_copyto = _best_time(lambda: numpy.copyto(dst, src), repeats)
+        t_blocked = _best_time(lambda: transpose.copy(src, dst, threads=1), repeats)
+        t_threaded = _best_time(lambda: transpose.copy(src, dst), repeats)
+        print('{:<24} {:>10.2f}ms {:>10.2f}ms {:>10.2f}ms {:>10.2f}ms'.format(name, 1000*t_flat, 1000*t_copyto, 1000*t_blocked, 1000*t_threaded))
+
+if __name__ == '__main__':
+    run(*map(int, sys.argv[1:]))
+    print()
+    run_copy(*map(int, sys.argv[1:]))
@@ -7,9 +7,26 @@ import pathlib
 hist_src = pathlib.Path(__file__).parent / '_histogram_src.c'
 
 with hist_src.open() as f:
-    hist_source = f.read()
+    hist_template = f.read()
+
+# The narrow kernels (16-bit dimensions and mask spans, 32-bit strides and bin counts) are the fastest and
+# suffice for ordinary camera images. The wide kernels handle images with dimensions over 65535 pixels,
+# more than 4 GB of extent, or enough pixels to overflow 32-bit bin counts.
+KERNEL_TYPES = [
+    ('', dict(DIM_T='uint16_t', STRIDE_T='uint32_t', COUNT_T='uint32_t')),
+    ('_wide', dict(DIM_T='size_t', STRIDE_T='size_t', COUNT_T='uint64_t'))
+]
+
+def instantiate_kernels(suffix, types):
+    # suffix the names of all functions (including static helpers, wherever they are called)
+    names = re.findall(r'^(?:static )?(?:inline )?\w+ (\w+)\(', hist_template, flags=re.MULTILINE)
+    source = re.sub(r'\b({})\b'.format('|'.join(names)), r'\g<1>{}'.format(suffix), hist_template)
+    return re.sub(r'\b({})\b'.format('|'.join(types)), lambda m: types[m.group(1)], source)
+
+hist_source = '\n'.join(instantiate_kernels(suffix, types) for suffix, types in KERNEL_TYPES)
+hist_typedef = re.compile(r'^typedef struct \{.+?\} \w+;', flags=re.MULTILINE|re.DOTALL)
 hist_def = re.compile(r'^void.+?\)', flags=re.MULTILINE|re.DOTALL)
-hist_headers = '\n'.join(h + ';' for h in hist_def.findall(hist_source))
+hist_headers = '\n'.join(hist_typedef.findall(hist_source) + [h + ';' for h in hist_def.findall(hist_source)])
 
 ffibuilder = cffi.FFI()
 
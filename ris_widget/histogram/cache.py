@@ -0,0 +1,52 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+import collections
+import weakref
+
+class HistogramCache:
+    """Bounded least-recently-used cache of histogram results for Image instances.
+
+    Results are stored under an image's identity and generation (which Image.refresh() increments), plus a
+    key describing how the histogram was calculated (range, mask, &c.), so a result is reused only if
+    neither the image data nor the histogram settings have changed since it was calculated. Entries hold
+    only a weak reference to the image, and are dropped when it is deleted.
+
+    The hits and misses attributes count the lookups that did and did not find a result.
+    """
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image, key):
+        """Return the cached result for image with the given key, or None if there is none."""
+        entry = self._entries.get((id(image), image.generation, key))
+        if entry is None or entry[0]() is not image:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((id(image), image.generation, key))
+        self.hits += 1
+        return entry[1]
+
+    def contains(self, image, key):
+        """Return whether there is a cached result for image with the given key, without counting a lookup."""
+        entry = self._entries.get((id(image), image.generation, key))
+        return entry is not None and entry[0]() is image
+
+    def put(self, image, key, result):
+        """Store result for image with the given key, evicting the least recently used entries if needed."""
+        self._entries[(id(image), image.generation, key)] = weakref.ref(image, self._remove_dead), result
+        self._entries.move_to_end((id(image), image.generation, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _remove_dead(self, image_ref):
+        for k in [k for k, (ref, result) in self._entries.items() if ref is image_ref]:
+            del self._entries[k]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
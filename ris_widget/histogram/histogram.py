@@ -1,36 +1,66 @@
 # This code is licensed under the MIT License (see LICENSE file for details)
 
+import builtins
+import concurrent.futures as futures
 import functools
+import math
+import multiprocessing
 import numpy
 
 from . import _histogram
 
-_mn = _histogram.ffi.new('uint8_t *')
-_mx = _histogram.ffi.new('uint8_t *')
-_mn16 = _histogram.ffi.new('uint16_t *')
-_mx16 = _histogram.ffi.new('uint16_t *')
-_mnf = _histogram.ffi.new('float *')
-_mxf = _histogram.ffi.new('float *')
+_ffi = _histogram.ffi
 
 _int_hists = {
-    # dtype, ranged, masked: (hist_func, min_var, max_var)
-    (numpy.uint16, False, False): (_histogram.lib.hist_uint16, _mn16, _mx16),
-    (numpy.uint8, False, False): (_histogram.lib.hist_uint8, _mn, _mx),
-    (numpy.uint16, False, True): (_histogram.lib.masked_hist_uint16, _mn16, _mx16),
-    (numpy.uint8, False, True): (_histogram.lib.masked_hist_uint8, _mn, _mx),
-    (numpy.uint16, True, True): (_histogram.lib.masked_ranged_hist_uint16, _mn16, _mx16),
-    (numpy.uint8, True, True): (_histogram.lib.masked_ranged_hist_uint8, _mn, _mx),
-    (numpy.uint16, True, False): (_histogram.lib.ranged_hist_uint16, _mn16, _mx16),
-    (numpy.uint8, True, False): (_histogram.lib.ranged_hist_uint8, _mn, _mx),
+    # dtype, ranged, masked: (hist_func name, min/max c type)
+    (numpy.uint16, False, False): ('hist_uint16', 'uint16_t *'),
+    (numpy.uint8, False, False): ('hist_uint8', 'uint8_t *'),
+    (numpy.uint16, False, True): ('masked_hist_uint16', 'uint16_t *'),
+    (numpy.uint8, False, True): ('masked_hist_uint8', 'uint8_t *'),
+    (numpy.uint16, True, True): ('masked_ranged_hist_uint16', 'uint16_t *'),
+    (numpy.uint8, True, True): ('masked_ranged_hist_uint8', 'uint8_t *'),
+    (numpy.uint16, True, False): ('ranged_hist_uint16', 'uint16_t *'),
+    (numpy.uint8, True, False): ('ranged_hist_uint8', 'uint8_t *'),
+    (numpy.int16, False, False): ('hist_int16', 'int16_t *'),
+    (numpy.int16, False, True): ('masked_hist_int16', 'int16_t *'),
+    (numpy.int16, True, True): ('masked_ranged_hist_int16', 'int16_t *'),
+    (numpy.int16, True, False): ('ranged_hist_int16', 'int16_t *'),
 }
 
+# Image dtypes histogrammed as float32 values: with no range given, over the range of the image values,
+# rather than over that of the dtype. int32 and float64 images have no kernels of their own: a float32 copy
+# is histogrammed, so values not exactly representable as float32 are rounded.
+FLOAT_DTYPES = {numpy.float32, numpy.int32, numpy.float64}
+
+# kernel suffix, mask span dtype and c type, and bin count dtype and c type for each kernel width
+# (see build_histogram.py)
+_NARROW_KERNELS = '', numpy.uint16, 'uint16_t *', numpy.uint32, 'uint32_t *'
+_WIDE_KERNELS = '_wide', numpy.uintp, 'size_t *', numpy.uint64, 'uint64_t *'
+
+# Percentiles found from a histogram are refined (see percentiles()) unless they are resolved to within
+# this fraction of the span between the lowest and highest of them: when they are used to scale an image
+# for display, finer resolution than that of an 8-bit display is not needed.
+PERCENTILE_RESOLUTION = 1/256
+_MAX_PERCENTILE_REFINEMENTS = 3
+
+# Splitting an image into bands smaller than this (in pixels) costs more in thread
+# overhead than it saves.
+MIN_PIXELS_PER_THREAD = 2**18
+
+_THREAD_POOL = None
+def _thread_pool():
+    global _THREAD_POOL
+    if _THREAD_POOL is None:
+        _THREAD_POOL = futures.ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())
+    return _THREAD_POOL
+
 def _scanline_bounds(cx, cy, r):
     # based on 8-connected super-circle algorithm from comments in http://www.willperone.net/Code/codecircle.php
     # and:
     # A Chronological and Mathematical Overview of Digital Circle Generation Algorithms - Introducing Efficient 4 and 8-Connected Circles
     # DOI: 10.1080/00207160.2015.1056170
     # stores start and end position (on x axis) along each scanline of the circle
-    bounds = numpy.empty((2*r + 1, 2), dtype=numpy.int16)
+    bounds = numpy.empty((2*r + 1, 2), dtype=numpy.int64)
     x = 0
     y = r
     d = -r/2
@@ -47,7 +77,7 @@ def _scanline_bounds(cx, cy, r):
     return bounds
 
 @functools.lru_cache(maxsize=16)
-def _circle_mask(cx, cy, r, image_shape):
+def _circle_mask(cx, cy, r, image_shape, span_dtype):
     sx, sy = image_shape
     bounds = _scanline_bounds(cx, cy, r)
     ymin = cy - r
@@ -57,7 +87,7 @@ def _circle_mask(cx, cy, r, image_shape):
     ymin += to_trim_bottom
     ymax -= to_trim_top
     bounds = bounds[to_trim_bottom:len(bounds)-to_trim_top]
-    bounds = bounds.clip(0, sx).astype(numpy.uint16)
+    bounds = bounds.clip(0, sx).astype(span_dtype)
     starts = bounds[:,0].copy()
     ends = bounds[:,1].copy()
     if ymin == 0 and ymax == sy and numpy.all(starts == 0) and numpy.all(ends == sx):
@@ -68,26 +98,94 @@ def _circle_mask(cx, cy, r, image_shape):
 def _fast_index_first(image):
     image = numpy.asarray(image)
     if image.strides[0] > image.strides[1]:
-        return image.T, True
+        return image.swapaxes(0, 1), True
     else:
         return image, False
 
-def histogram(image, range=(None, None), image_bits=None, mask_geometry=None):
+def _as_float32(image):
+    """Return a float32 copy of an int32 or float64 image, or else the image itself."""
+    if image.dtype.type in FLOAT_DTYPES and image.dtype != numpy.float32:
+        with numpy.errstate(over='ignore'):
+            return image.astype(numpy.float32)
+    return image
+
+def _needs_wide_kernels(image):
+    """Return whether image (in fast-index-first order) is too large for the narrow kernels."""
+    extent = max(abs(image.strides[0]) * image.shape[0], abs(image.strides[1]) * image.shape[1])
+    return max(image.shape) > 0xFFFF or image.size > 0xFFFFFFFF or extent > 0xFFFFFFFF
+
+def _row_bands(rows, cols, threads):
+    """Split the rows of an image into contiguous (start, stop) bands, one per thread."""
+    if threads is None:
+        threads = multiprocessing.cpu_count()
+    n_bands = max(1, min(threads, rows, (rows * cols) // MIN_PIXELS_PER_THREAD))
+    edges = [rows * b // n_bands for b in range(n_bands + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+def _map_bands(band_func, bands):
+    """Run band_func on each band, using the thread pool if there is more than one.
+    The cffi kernels release the GIL, so the bands are processed in parallel."""
+    if len(bands) == 1:
+        return [band_func(bands[0])]
+    return list(_thread_pool().map(band_func, bands))
+
+def _kernel_setup(image, mask_geometry, threads):
+    """Return the image in fast-index-first order (cropped to the mask rows, if any), the kernel suffix,
+    bin count dtype and c type, the row bands to process, and a function returning the arguments
+    common to all kernels for a band: image pointer, rows, cols, row stride, column stride, and then
+    the mask spans if the image is masked (or always, as NULL if not, if null_spans is True)."""
+    i, transpose = _fast_index_first(image)
+    suffix, span_dtype, span_type, count_dtype, count_type = _WIDE_KERNELS if _needs_wide_kernels(i) else _NARROW_KERNELS
+    starts = ends = None
+    if mask_geometry is not None:
+        # multiply cx, cy, and r by the shape of the original image
+        cx, cy, r = (numpy.array(mask_geometry) * [image.shape[0], image.shape[1], image.shape[0]]).astype(int)
+        if transpose:
+            cx, cy = cy, cx
+        ymin, ymax, starts, ends = _circle_mask(cx, cy, r, i.shape[:2], span_dtype)
+        if ymin is not None: # otherwise mask is whole region
+            i = i[:,ymin:ymax]
+    bands = _row_bands(i.shape[1], i.shape[0], threads)
+
+    def band_args(band, null_spans=False):
+        start, stop = band
+        args = [_ffi.cast('char *', i.ctypes.data + start * i.strides[1]), stop - start, i.shape[0], i.strides[1], i.strides[0]]
+        if starts is not None:
+            args += [_ffi.cast(span_type, starts[start:].ctypes.data), _ffi.cast(span_type, ends[start:].ctypes.data)]
+        elif null_spans:
+            args += [_ffi.NULL, _ffi.NULL]
+        return args
+    return i, starts is not None, suffix, count_dtype, count_type, bands, band_args
+
+def histogram(image, range=(None, None), image_bits=None, mask_geometry=None, threads=None):
     """
     image: 2-dimensional greyscale image, or GA, RGB, or RGBA image in (x, y, c) index order.
         If RGB(A), the RGB channels will be converted to greyscale first. Alpha channels are ignored.
+        The dtype may be bool, uint8, uint16, int16, int32, float32 or float64.
     range: [low, high] range over which histogram is calculated
     image_bits: only applies to uint16 images. If None, images are assumed to occupy full 16-bit range.
     mask_geometry: (cx, cy, radius) of a vignette mask, as fractions of image.shape.
         (cx and radius will be in terms of image.shape[0], cy in terms of image.shape[1])
+    threads: maximum number of threads over which to split the calculation. If None, use
+        all available CPUs; if 1, run serially. Each thread processes a band of image rows
+        into its own histogram, and the results are merged afterward, so the output does
+        not depend on the number of threads.
     returns: min, max, hist
         min, max: image min and max values (possibly outside the range, if specified)
-        hist: histogram
+        hist: histogram. The bin counts are uint32, except for images too large for the fast
+            kernels (over 65535 pixels on a side or over 4 GB), for which they are uint64.
+
+    int16 images are histogrammed by the uint16 kernels, offset by 32768 (see _histogram_src.c), so
+    the full range of an unranged int16 histogram is [-32768, 32767].
     """
-    image = numpy.asarray(image)
-    assert image.dtype.type in {numpy.bool8, numpy.uint8, numpy.uint16, numpy.float32}
+    image = _as_float32(numpy.asarray(image))
+    assert image.dtype.type in {numpy.bool8, numpy.uint8, numpy.uint16, numpy.int16, numpy.float32}
     if image.ndim == 3:
         if image.shape[2] in (3, 4): # RGB/RGBA
+            if image.dtype != numpy.bool8:
+                # luma is calculated on the fly by the multichannel kernels
+                mins, maxs, hists = _channel_histograms(image, range, image_bits, mask_geometry, threads, channels=False, luma=True)
+                return mins[-1], maxs[-1], hists[-1]
             r, g, b = numpy.rollaxis(image, -1)[:3]
             luma = 0.2126*r + 0.7152*g + 0.0722*b # use CIE 1931 linear luminance
             image = luma.astype(image.dtype)
@@ -101,73 +199,316 @@ def histogram(image, range=(None, None), image_bits=None, mask_geometry=None):
         image = image.view(numpy.uint8)
     else:
         was_bool = False
-    masked = mask_geometry is not None
     range = tuple(range)
     ranged = range != (None, None)
     r_min, r_max = range
 
-    i, transpose = _fast_index_first(image)
-    if masked:
-        # multiply cx, cy, and r by the shape of the original image
-        cx, cy, r = (numpy.array(mask_geometry) * [image.shape[0], image.shape[1], image.shape[0]]).astype(int)
-        if transpose:
-            cx, cy = cy, cx
-        ymin, ymax, starts, ends = _circle_mask(cx, cy, r, i.shape)
-        if ymin is None:
-            # mask is whole region
-            masked = False
-        else:
-            i = i[:,ymin:ymax]
-    args = [_histogram.ffi.cast('char *', i.ctypes.data), i.shape[1], i.shape[0], i.strides[1], i.strides[0]]
-    if masked:
-        sp = _histogram.ffi.cast('uint16_t *', starts.ctypes.data)
-        ep = _histogram.ffi.cast('uint16_t *', ends.ctypes.data)
-        args += [sp, ep]
-
-    if image.dtype == numpy.uint8:
-        hist = numpy.zeros(256, dtype=numpy.uint32)
-    else:
-        hist = numpy.zeros(1024, dtype=numpy.uint32)
-    args.append(_histogram.ffi.cast('uint32_t *', hist.ctypes.data))
+    i, masked, suffix, count_dtype, count_type, bands, band_args = _kernel_setup(image, mask_geometry, threads)
+    n_bins = 256 if image.dtype == numpy.uint8 else 1024
 
     if image.dtype == numpy.float32:
-        mn, mx = _mnf, _mxf
-        if masked:
-            minmax_func = _histogram.lib.masked_minmax_float
-            hist_func = _histogram.lib.masked_ranged_hist_float
+        prefix = 'masked_' if masked else ''
+        minmax_func = getattr(_histogram.lib, prefix + 'minmax_float' + suffix)
+        hist_func = getattr(_histogram.lib, prefix + 'ranged_hist_float' + suffix)
+        def band_minmax(band):
+            mn, mx = _ffi.new('float *'), _ffi.new('float *')
+            minmax_func(*band_args(band), mn, mx)
+            return mn[0], mx[0]
+        def band_hist(band):
+            hist = numpy.zeros(n_bins, dtype=count_dtype)
+            mn, mx = _ffi.new('float *'), _ffi.new('float *')
+            hist_func(*band_args(band), _ffi.cast(count_type, hist.ctypes.data), n_bins, r_min, r_max, mn, mx)
+            return mn[0], mx[0], hist
+        if None in range:
+            # the range depends on the image min and/or max, which are found first
+            band_mins, band_maxs = zip(*_map_bands(band_minmax, bands))
+            image_min, image_max = min(band_mins), max(band_maxs)
+            if r_min is None:
+                r_min = image_min
+            if r_max is None:
+                r_max = image_max
+            hists = [hist for mn, mx, hist in _map_bands(band_hist, bands)]
         else:
-            minmax_func = _histogram.lib.minmax_float
-            hist_func = _histogram.lib.ranged_hist_float
-        minmax_args = args[:-1] + [mn, mx] # ditch the hist pointer, and add the min and max pointers
-        minmax_func(*minmax_args)
-        if r_min is None:
-            r_min = mn[0]
-        if r_max is None:
-            r_max = mx[0]
-        args += [len(hist), r_min, r_max]
+            band_mins, band_maxs, hists = zip(*_map_bands(band_hist, bands))
+            image_min, image_max = min(band_mins), max(band_maxs)
     else: # integral type image
-        hist_func, mn, mx = _int_hists[(image.dtype.type, ranged, masked)]
-        if image.dtype == numpy.uint16:
+        hist_func_name, minmax_type = _int_hists[(image.dtype.type, ranged, masked)]
+        hist_func = getattr(_histogram.lib, hist_func_name + suffix)
+        extra_args = []
+        if image.dtype != numpy.uint8:
             if image_bits is None:
                 image_bits = 16
             if ranged:
-                args.append(len(hist)) # nbins arg
+                extra_args.append(n_bins) # nbins arg
             else:
                 assert image_bits >= 10
-                args.append(image_bits - 10) # bit shift arg
+                extra_args.append(image_bits - 10) # bit shift arg
         if ranged:
-            if r_min is None:
-                r_min = 0
-            if r_max is None:
-                if image.dtype == numpy.uint8:
-                    r_max = 255
-                else:
-                    r_max = 2**image_bits - 1
-            args += [int(r_min), int(r_max)]
-        args += [mn, mx]
-    hist_func(*args)
+            r_min, r_max = _default_int_range(image.dtype, range, image_bits)
+            extra_args += [r_min, r_max]
+        def band_hist(band):
+            hist = numpy.zeros(n_bins, dtype=count_dtype)
+            mn, mx = _ffi.new(minmax_type), _ffi.new(minmax_type)
+            hist_func(*band_args(band), _ffi.cast(count_type, hist.ctypes.data), *extra_args, mn, mx)
+            return mn[0], mx[0], hist
+        band_mins, band_maxs, hists = zip(*_map_bands(band_hist, bands))
+        image_min, image_max = min(band_mins), max(band_maxs)
+    hist = hists[0]
+    for h in hists[1:]:
+        hist += h
     if was_bool:
         hist = hist[:2]
         r_min, r_max = bool(r_min), bool(r_max)
-    return mn[0], mx[0], hist
+    return image_min, image_max, hist
+
+def _int16_offset(dtype):
+    """Return the offset of the values of an image of the given dtype in the multichannel kernels: for int16
+    images, which they histogram with offset binning (see _histogram_src.c), flipping the sign bit of each
+    value maps int16 values in order onto uint16 values, offset by 32768 (which is also the flip value)."""
+    return 2**15 if dtype == numpy.int16 else 0
+
+def _default_int_range(dtype, range, image_bits):
+    r_min, r_max = range
+    if r_min is None:
+        r_min = -2**15 if dtype == numpy.int16 else 0
+    if r_max is None:
+        if dtype == numpy.uint8:
+            r_max = 255
+        elif dtype == numpy.int16:
+            r_max = 2**15 - 1
+        else:
+            r_max = 2**image_bits - 1
+    return int(r_min), int(r_max)
+
+def channel_histograms(image, range=(None, None), image_bits=None, mask_geometry=None, threads=None, luma=False):
+    """
+    Calculate the histogram of each channel of a multichannel image in a single pass over the data.
+
+    image: GA, RGB, or RGBA image in (x, y, c) index order.
+    range, image_bits, mask_geometry, threads: as for histogram(). All channels are binned over the
+        same range; for float images with no range specified, this is the range of the luma values
+        if luma is True, or else the range of all channels together.
+    luma: if True, also calculate the histogram of the CIE 1931 linear luminance of the RGB channels
+        (exactly as histogram() does for RGB and RGBA images), in the same pass.
+    returns: mins, maxs, hists
+        mins, maxs: lists of the min and max value of each channel, followed by those of the luma
+            values if luma is True.
+        hists: array of shape (channels, bins), with one histogram per channel, followed by the
+            luma histogram if luma is True.
+    """
+    image = _as_float32(numpy.asarray(image))
+    assert image.dtype.type in {numpy.uint8, numpy.uint16, numpy.int16, numpy.float32}
+    if image.ndim != 3 or image.shape[2] not in (2, 3, 4):
+        raise ValueError('Only GA, RGB, and RGBA images are supported')
+    if luma and image.shape[2] == 2:
+        raise ValueError('Luma histograms require an RGB or RGBA image')
+    return _channel_histograms(image, range, image_bits, mask_geometry, threads, channels=True, luma=luma)
+
+def _channel_histograms(image, range, image_bits, mask_geometry, threads, channels, luma):
+    n_channels = image.shape[2]
+    range = tuple(range)
+    offset = _int16_offset(image.dtype)
+    if offset:
+        range = tuple(None if r is None else int(r) + offset for r in range)
+        image_bits = None
+    r_min, r_max = range
+    i, masked, suffix, count_dtype, count_type, bands, band_args = _kernel_setup(image, mask_geometry, threads)
+    n_bins = 256 if image.dtype == numpy.uint8 else 1024
+    channel_args = [i.strides[2], n_channels]
+
+    def new_hists():
+        # each histogram is followed by a discard bin (see _histogram_src.c)
+        hists = numpy.zeros((n_channels + 1, n_bins + 1), dtype=count_dtype)
+        hist_ptr = _ffi.cast(count_type, hists.ctypes.data) if channels else _ffi.NULL
+        luma_ptr = _ffi.cast(count_type, hists[-1].ctypes.data) if luma else _ffi.NULL
+        return hists, hist_ptr, luma_ptr
+
+    if image.dtype == numpy.float32:
+        minmax_func = getattr(_histogram.lib, 'channel_minmax_float' + suffix)
+        hist_func = getattr(_histogram.lib, 'channel_hist_float' + suffix)
+        def band_minmax(band):
+            mins, maxs = _ffi.new('float[4]'), _ffi.new('float[4]')
+            luma_min, luma_max = _ffi.new('float *'), _ffi.new('float *')
+            minmax_func(*band_args(band, null_spans=True), *channel_args, luma, mins, maxs, luma_min, luma_max)
+            return list(mins)[:n_channels] + [luma_min[0]], list(maxs)[:n_channels] + [luma_max[0]]
+        band_mins, band_maxs = zip(*_map_bands(band_minmax, bands))
+        mins = [min(band_min) for band_min in zip(*band_mins)]
+        maxs = [max(band_max) for band_max in zip(*band_maxs)]
+        if r_min is None:
+            r_min = mins[-1] if luma else min(mins[:-1])
+        if r_max is None:
+            r_max = maxs[-1] if luma else max(maxs[:-1])
+        def band_hist(band):
+            hists, hist_ptr, luma_ptr = new_hists()
+            hist_func(*band_args(band, null_spans=True), *channel_args, hist_ptr, luma_ptr, n_bins, r_min, r_max)
+            return hists
+        hists = _map_bands(band_hist, bands)
+    else: # integral type image
+        if image.dtype == numpy.uint8:
+            c_type = 'uint8_t'
+            extra_args = list(_default_int_range(image.dtype, range, image_bits))
+        else:
+            c_type = 'uint16_t'
+            if image_bits is None:
+                image_bits = 16
+            ranged = range != (None, None)
+            if not ranged:
+                assert image_bits >= 10
+            extra_args = [offset, ranged, image_bits - 10 if not ranged else 0, n_bins,
+                *_default_int_range(numpy.uint16, range, image_bits)]
+        hist_func = getattr(_histogram.lib, 'channel_hist_{}{}'.format(c_type[:-2], suffix))
+        def band_hist(band):
+            hists, hist_ptr, luma_ptr = new_hists()
+            mins, maxs = _ffi.new(c_type + '[4]'), _ffi.new(c_type + '[4]')
+            luma_min, luma_max = _ffi.new(c_type + ' *'), _ffi.new(c_type + ' *')
+            hist_func(*band_args(band, null_spans=True), *channel_args, hist_ptr, luma_ptr, *extra_args, mins, maxs, luma_min, luma_max)
+            return list(mins)[:n_channels] + [luma_min[0]], list(maxs)[:n_channels] + [luma_max[0]], hists
+        band_mins, band_maxs, hists = zip(*_map_bands(band_hist, bands))
+        mins = [min(band_min) - offset for band_min in zip(*band_mins)]
+        maxs = [max(band_max) - offset for band_max in zip(*band_maxs)]
+    hist = hists[0]
+    for h in hists[1:]:
+        hist += h
+    hist = numpy.ascontiguousarray(hist[:, :n_bins])
+    if not luma:
+        mins, maxs, hist = mins[:-1], maxs[:-1], hist[:-1]
+    if not channels:
+        mins, maxs, hist = mins[-1:], maxs[-1:], hist[-1:]
+    return mins, maxs, hist
+
+def min_max(image, mask_geometry=None, threads=None):
+    """
+    Find the min and max of an image in a single pass, without calculating its histogram.
+
+    image, mask_geometry, threads: as for histogram(). As there, the luma values of RGB and RGBA
+        images are used, and alpha channels are ignored.
+    returns: min, max (the same values as returned by histogram())
+    """
+    image = _as_float32(numpy.asarray(image))
+    assert image.dtype.type in {numpy.bool8, numpy.uint8, numpy.uint16, numpy.int16, numpy.float32}
+    if image.ndim == 2:
+        image = image[:,:,numpy.newaxis]
+    elif image.ndim != 3 or image.shape[2] not in (2, 3, 4):
+        raise ValueError('Only 2D, GA, RGB, and RGBA images are supported')
+    if image.dtype == numpy.bool8:
+        image = image.view(numpy.uint8)
+    luma = image.shape[2] >= 3
+    offset = _int16_offset(image.dtype)
+    if not luma and image.dtype in (numpy.uint16, numpy.int16):
+        # 16-bit greyscale values (or those of the first channel) need not be binned at all
+        i, masked, suffix, count_dtype, count_type, bands, band_args = _kernel_setup(image[:,:,0], mask_geometry, threads)
+        minmax_func = getattr(_histogram.lib, 'minmax_uint16' + suffix)
+        def band_minmax(band):
+            mn, mx = _ffi.new('uint16_t *'), _ffi.new('uint16_t *')
+            minmax_func(*band_args(band, null_spans=True), offset, mn, mx)
+            return mn[0], mx[0]
+    else:
+        # only the luma values, or else the first channel, are considered
+        channel_args = [image.strides[2], 0 if luma else 1]
+        i, masked, suffix, count_dtype, count_type, bands, band_args = _kernel_setup(image, mask_geometry, threads)
+        if image.dtype == numpy.float32:
+            c_type = 'float'
+            minmax_func = getattr(_histogram.lib, 'channel_minmax_float' + suffix)
+            def hist_args(luma_hist):
+                return [luma]
+        else:
+            # The integral multichannel kernels find the min and max while histogramming: with no channel
+            # histograms, only the luma values (if any) are histogrammed.
+            if image.dtype == numpy.uint8:
+                c_type, n_bins, extra_args = 'uint8_t', 256, [0, 255]
+            else:
+                c_type, n_bins, extra_args = 'uint16_t', 1024, [offset, False, 6, 1024, 0, 65535]
+            minmax_func = getattr(_histogram.lib, 'channel_hist_{}{}'.format(c_type[:-2], suffix))
+            def hist_args(luma_hist):
+                luma_ptr = _ffi.cast(count_type, luma_hist.ctypes.data) if luma else _ffi.NULL
+                return [_ffi.NULL, luma_ptr, *extra_args]
+        def band_minmax(band):
+            luma_hist = numpy.zeros(n_bins + 1, dtype=count_dtype) if luma and image.dtype != numpy.float32 else None
+            mins, maxs = _ffi.new(c_type + '[4]'), _ffi.new(c_type + '[4]')
+            luma_min, luma_max = _ffi.new(c_type + ' *'), _ffi.new(c_type + ' *')
+            minmax_func(*band_args(band, null_spans=True), *channel_args, *hist_args(luma_hist), mins, maxs, luma_min, luma_max)
+            return (luma_min[0], luma_max[0]) if luma else (mins[0], maxs[0])
+    band_mins, band_maxs = zip(*_map_bands(band_minmax, bands))
+    return min(band_mins) - offset, max(band_maxs) - offset
 
+def _bin_edges(dtype, range, image_bits, n_bins, image_min, image_max):
+    """Return the n_bins + 1 edges of the bins of a histogram calculated by histogram()."""
+    r_min, r_max = range
+    if dtype.type in FLOAT_DTYPES:
+        if r_min is None:
+            r_min = image_min
+        if r_max is None:
+            r_max = image_max
+        return numpy.linspace(r_min, r_max, n_bins + 1)
+    if image_bits is None:
+        image_bits = 16
+    if dtype not in (numpy.uint16, numpy.int16):
+        # each bin holds a single value
+        r_min = 0 if r_min is None else int(r_min)
+        return r_min + numpy.arange(n_bins + 1)
+    if range == (None, None):
+        offset = -2**15 if dtype == numpy.int16 else 0
+        return numpy.linspace(offset, offset + 2**image_bits, n_bins + 1)
+    return numpy.linspace(*_default_int_range(dtype, range, image_bits), n_bins + 1)
+
+def _quantiles(hist, edges, targets):
+    """Return the values below which the target numbers of values in hist fall, interpolating linearly
+    within bins, and the bins holding them."""
+    cumulative = numpy.cumsum(hist, dtype=numpy.float64)
+    occupied = hist.nonzero()[0]
+    bins = numpy.searchsorted(cumulative, targets, side='right').clip(occupied[0], occupied[-1])
+    fractions = numpy.clip((targets - (cumulative[bins] - hist[bins])) / hist[bins], 0, 1)
+    return edges[bins] + fractions * (edges[bins + 1] - edges[bins]), bins
+
+def percentiles(image, percentiles, range=(None, None), image_bits=None, mask_geometry=None, threads=None, hist=None):
+    """
+    Find the values at the given percentiles of an image from its histogram, rather than by sorting its values.
+
+    image, range, image_bits, mask_geometry, threads: as for histogram().
+    percentiles: sequence of percentiles, in [0, 100].
+    hist: the (min, max, hist) result of histogram() for the same arguments, if it has already been calculated.
+    returns: array of the value at each percentile, or NaN if there are no values in the histogram.
+
+    Values are interpolated linearly within histogram bins. Where a bin is too coarse for the value found in it to
+    be resolved to PERCENTILE_RESOLUTION of the span between the lowest and highest values found (or of the image
+    range, for a single percentile), as when a few outlying values stretch the range of a float image, the values
+    in that bin are histogrammed again, into sub-bins.
+    """
+    image = numpy.asarray(image)
+    if hist is None:
+        hist = histogram(image, range, image_bits, mask_geometry, threads)
+    image_min, image_max, hist = hist
+    range = tuple(range)
+    total = hist.sum(dtype=numpy.float64)
+    if total == 0:
+        return numpy.full(len(percentiles), numpy.nan)
+    edges = _bin_edges(image.dtype, range, image_bits, len(hist), image_min, image_max)
+    targets = numpy.asarray(percentiles, dtype=numpy.float64) / 100 * total
+    values, bins = _quantiles(hist, edges, targets)
+    # the histogram, bin edges, and target count within it from which each value was found
+    sources = [(hist, edges, target) for target in targets]
+    for refinement in builtins.range(_MAX_PERCENTILE_REFINEMENTS):
+        span = values.max() - values.min() if len(values) > 1 else float(image_max) - float(image_min)
+        refined = False
+        for i, (bin, (hist, edges, target)) in enumerate(zip(bins, sources)):
+            low, high = edges[bin], edges[bin + 1]
+            if high - low <= PERCENTILE_RESOLUTION * span:
+                continue
+            if image.dtype.type in FLOAT_DTYPES:
+                sub_range = low, high
+            else:
+                # the integers in [low, high)
+                sub_range = int(math.ceil(low)), int(math.ceil(high)) - 1
+                if sub_range[1] <= sub_range[0]:
+                    continue
+            sub_min, sub_max, sub_hist = histogram(image, sub_range, image_bits, mask_geometry, threads)
+            if not sub_hist.any():
+                continue
+            sub_edges = _bin_edges(image.dtype, sub_range, image_bits, len(sub_hist), sub_min, sub_max)
+            sub_target = min(target - hist[:bin].sum(dtype=numpy.float64), sub_hist.sum())
+            (values[i],), (bins[i],) = _quantiles(sub_hist, sub_edges, [sub_target])
+            sources[i] = sub_hist, sub_edges, sub_target
+            refined = True
+        if not refined:
+            break
+    return values.clip(image_min, image_max)
@@ -0,0 +1,50 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+import numpy
+
+from . import _histogram
+from .histogram import _map_bands, _needs_wide_kernels, _row_bands
+
+_ffi = _histogram.ffi
+
+def copy(src, dst, threads=None):
+    """
+    Copy src into dst, and return dst.
+
+    src, dst: (x, y) or (x, y, c) arrays of the same shape and dtype. The channels of dst (if any) must be
+        contiguous; otherwise, either array may have any memory layout.
+    threads: maximum number of threads over which to split the copy. If None, use all available CPUs;
+        if 1, run serially.
+
+    When the layouts of src and dst differ, as when transposing an image, pixels are copied in blocks small
+    enough to stay in cache, which is much faster than numpy (let alone assignment through .flat). When
+    they are the same, e.g. when src is a crop of a larger image, numpy's row-by-row copy is fastest.
+    """
+    src = numpy.asarray(src)
+    if src.shape != dst.shape or src.dtype != dst.dtype:
+        raise ValueError('src and dst must have the same shape and dtype.')
+    if (src.ndim not in (2, 3) or src.size == 0 or src.itemsize not in (1, 2, 4, 8) or
+            min(src.strides + dst.strides) < 0 or (dst.ndim == 3 and dst.strides[2] != dst.itemsize)):
+        numpy.copyto(dst, src)
+        return dst
+    out = dst
+    if dst.strides[0] > dst.strides[1]:
+        # the kernel writes along the rows of dst in its inner loop: make those the contiguous ones
+        src, dst = src.swapaxes(0, 1), dst.swapaxes(0, 1)
+    if src.strides[0] <= src.strides[1] and (src.ndim == 2 or src.strides[2] == src.itemsize):
+        # no transposition needed
+        numpy.copyto(dst, src)
+        return out
+    suffix = '_wide' if _needs_wide_kernels(src) or _needs_wide_kernels(dst) else ''
+    copy_pixels = getattr(_histogram.lib, 'copy_pixels' + suffix)
+    n_channels = 1 if src.ndim == 2 else src.shape[2]
+    channel_stride = src.itemsize if src.ndim == 2 else src.strides[2]
+    cols, rows = src.shape[:2]
+
+    def copy_band(band):
+        start, stop = band
+        copy_pixels(_ffi.cast('char *', src.ctypes.data + start * src.strides[1]),
+            _ffi.cast('char *', dst.ctypes.data + start * dst.strides[1]), stop - start, cols,
+            src.strides[1], src.strides[0], channel_stride, dst.strides[1], dst.strides[0], n_channels, src.itemsize)
+    _map_bands(copy_band, _row_bands(rows, cols, threads))
+    return out
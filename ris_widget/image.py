@@ -5,12 +5,20 @@ import ctypes
 import numpy
 from PyQt5 import Qt
 
+from .histogram import transpose
+
 class Image(Qt.QObject):
     """An instance of the Image class is a wrapper around a Numpy ndarray representing a single image.
 
     Images are immutable: do not try to change the .data or .valid_range attributes after construction.
 
     The .data array can be modified in-place after construction, however: just call .refresh() afterward.
+    Each call to .refresh() increments .generation, which identifies the current version of the image
+    contents (e.g. for caching results calculated from them).
+
+    .data is always indexed as (x, y) or (x, y, c), but its pixels may be stored in memory with either x
+    or y varying fastest, as recorded by .axis_order ('xy' or 'yx'), so that arrays in either layout are
+    used without copying. Use Image.from_yx() for (y, x) arrays, as read by most image libraries.
     """
     # TODO: update documentation after image simplification
     changed = Qt.pyqtSignal(object)
@@ -19,21 +27,41 @@ class Image(Qt.QObject):
         numpy.bool8: (False, True),
         numpy.uint8: (0, 255),
         numpy.uint16: (0, 65535),
-        numpy.float32: (-numpy.inf, numpy.inf)}
+        numpy.int16: (-32768, 32767),
+        numpy.int32: (-2**31, 2**31-1),
+        numpy.float32: (-numpy.inf, numpy.inf),
+        numpy.float64: (-numpy.inf, numpy.inf)}
 
     def __init__(self, data, image_bits=None, name=None, parent=None):
         """
         image_bits: only applies to uint16 images. If None, images are assumed to occupy full 16-bit range.
         The shape of image and mask data is interpreted as (x,y) for 2-d arrays and (x,y,c) for 3-d arrays.  If your image or mask was loaded as (y,x),
-        array.T will produce an (x,y)-shaped array.  In case of (y,x,c) image data, array.swapaxes(0,1) is required."""
+        array.T will produce an (x,y)-shaped array.  In case of (y,x,c) image data, array.swapaxes(0,1) is required (or use Image.from_yx()).
+        Arrays whose pixels are contiguous, with channels (if any) varying fastest and then either x or y, are
+        used without copying; others are copied. Data of the types in NUMPY_DTYPE_TO_RANGE (in native byte order)
+        are used as they are; other integer and floating-point data are converted to float32."""
+        self._init_without_data(name, parent)
+        self._set_data(data, image_bits)
+
+    def _init_without_data(self, name, parent):
+        # Initialize all but the data and the attributes that depend on it (which _set_data() sets), so that
+        # subclasses that set the data later (e.g. flipbook.LazyImage) need not repeat the rest.
         super().__init__(parent)
+        self.name = name
+        self.generation = 0
+        self.previous_region_data = None
+        self._data = None
+        self.type = self.size = self.image_bits = self.valid_range = self.axis_order = None
 
+    def _set_data(self, data, image_bits):
         data = numpy.asarray(data)
         if not (data.ndim == 2 or (data.ndim == 3 and data.shape[2] in (2,3,4))):
             raise ValueError('data argument must be a 2D (grayscale) or 3D (grayscale with alpha, rgb, or rgba) iterable.')
 
-        if data.dtype not in (bool, numpy.uint8, numpy.uint16, numpy.float32):
+        if data.dtype.type not in self.NUMPY_DTYPE_TO_RANGE or not data.dtype.isnative:
             if numpy.issubdtype(data.dtype, numpy.floating) or numpy.issubdtype(data.dtype, numpy.integer):
+                # astype() keeps the memory layout of data where it can (order='K'), so that the converted
+                # array usually needs no further copy below
                 data = data.astype(numpy.float32)
             else:
                 raise ValueError('Image data must be integer or floating-point.')
@@ -41,12 +69,22 @@ class Image(Qt.QObject):
             raise ValueError('The image_bits argument may only be used if data is of type uint16.')
 
         bpe = data.itemsize
-        desired_strides = (bpe, data.shape[0]*bpe) if data.ndim == 2 else (data.shape[2]*bpe, data.shape[0]*data.shape[2]*bpe, bpe)
-        if desired_strides == data.strides:
+        pixel_bytes = bpe if data.ndim == 2 else data.shape[2]*bpe
+        channel_strides = () if data.ndim == 2 else (bpe,)
+        xy_strides = (pixel_bytes, data.shape[0]*pixel_bytes) + channel_strides
+        yx_strides = (data.shape[1]*pixel_bytes, pixel_bytes) + channel_strides
+        if data.strides == xy_strides:
             self._data = data
+            self.axis_order = 'xy'
+        elif data.strides == yx_strides:
+            # e.g. a (y, x) array in C order, transposed
+            self._data = data
+            self.axis_order = 'yx'
         else:
-            self._data = numpy.ndarray(data.shape, strides=desired_strides, dtype=data.dtype)
-            self._data.flat = data.flat
+            # copy into whichever layout is nearer that of data
+            self.axis_order = 'yx' if abs(data.strides[1]) < abs(data.strides[0]) else 'xy'
+            strides = yx_strides if self.axis_order == 'yx' else xy_strides
+            self._data = transpose.copy(data, numpy.ndarray(data.shape, strides=strides, dtype=data.dtype))
 
         if self._data.ndim == 2:
             self.type = 'G'
@@ -60,12 +98,16 @@ class Image(Qt.QObject):
         else:
             self.valid_range = self.NUMPY_DTYPE_TO_RANGE[data.dtype.type]
 
-        self.name = name
+    @classmethod
+    def from_yx(cls, data, image_bits=None, name=None, parent=None):
+        """Return an Image of (y, x) or (y, x, c) data, such as an array from a camera, from tifffile, or from
+        numpy.load(), without copying it if it is C-contiguous (or, for 2-d data, Fortran-contiguous)."""
+        return cls(numpy.asarray(data).swapaxes(0, 1), image_bits, name, parent)
 
     def __repr__(self):
         return '{}; {}x{} ({})>'.format(super().__repr__()[:-1], self.size.width(), self.size.height(), self.type)
 
-    def refresh(self, changed_region=None):
+    def refresh(self, changed_region=None, previous_region_data=None):
         """
         The .refresh method should be called after modifying the contents of .data.
 
@@ -73,9 +115,17 @@ class Image(Qt.QObject):
         another numpy view of the same memory.
 
         If only a portion of the image changed, call with (l, t, w, h) as the
-        bounds of the changed_region.
+        bounds of the changed_region. If a copy of the contents of changed_region from before the change is
+        also given as previous_region_data, layers showing the image update their histograms from the
+        region alone, rather than recalculating them. (It is available to receivers of the changed signal
+        as .previous_region_data.)
         """
-        self.changed.emit(changed_region)
+        self.generation += 1
+        self.previous_region_data = previous_region_data
+        try:
+            self.changed.emit(changed_region)
+        finally:
+            self.previous_region_data = None
 
     def generate_contextual_info_for_pos(self, x, y):
         if not (0 <= x < self.size.width() and 0 <= y < self.size.height()):
@@ -96,7 +146,7 @@ class Image(Qt.QObject):
         return self._data
 
 def array_from_qimage(qimage):
-    if qimage.isNull() or qimage.format() != Qt.QImage.Format_Invalid:
+    if qimage.isNull() or qimage.format() == Qt.QImage.Format_Invalid:
         return
 
     if qimage.hasAlphaChannel():
@@ -107,18 +157,12 @@ def array_from_qimage(qimage):
         channel_count = 3
     if qimage.format() != desired_format:
         qimage = qimage.convertToFormat(desired_format)
-    if channel_count == 3:
-        # 24-bit RGB QImage rows are padded to 32-bit chunks, which we must match
-        row_stride = qimage.width() * 3
-        row_stride += 4 - (row_stride % 4)
-        padded = numpy.ctypeslib.as_array(ctypes.cast(int(qimage.bits()), ctypes.POINTER(ctypes.c_uint8)), shape=(qimage.height(), row_stride))
-        padded = padded[:, qimage.width() * 3].reshape((qimage.height(), qimage.width(), 3))
-        npyimage = numpy.empty((qimage.height(), qimage.width(), 3), dtype=numpy.uint8)
-        npyimage.flat = padded.flat
-    else:
-        npyimage = numpy.ctypeslib.as_array(
-            ctypes.cast(int(qimage.bits()), ctypes.POINTER(ctypes.c_uint8)),
-            shape=(qimage.height(), qimage.width(), channel_count))
+    # QImage rows are padded to 32-bit chunks (which matters for 24-bit RGB), so view just the pixels of each
+    # row, and copy them out of the QImage (whose memory is freed with it)
+    padded = numpy.ctypeslib.as_array(ctypes.cast(int(qimage.bits()), ctypes.POINTER(ctypes.c_uint8)),
+        shape=(qimage.height(), qimage.bytesPerLine()))
+    pixels = padded[:, :qimage.width() * channel_count].reshape((qimage.height(), qimage.width(), channel_count))
+    npyimage = transpose.copy(pixels, numpy.empty(pixels.shape, dtype=numpy.uint8))
     if qimage.isGrayscale():
         # Note: Qt does not support grayscale with alpha channels, so we don't need to worry about that case
         npyimage=npyimage[...,0]
@@ -0,0 +1,61 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+import json
+import pathlib
+
+import numpy
+
+# Files with these suffixes are mapped into memory, rather than read: opening them reads no pixels, and
+# pages of pixels are read (and later dropped) by the OS as they are used. They are mapped copy-on-write,
+# so the arrays may be modified (e.g. by the layer stack painter) without changing the files.
+NPY_SUFFIXES = {'.npy'}
+RAW_SUFFIXES = {'.raw'}
+
+# the sidecar file of a directory of raw files that all have the same format (see read_raw_format())
+RAW_FORMAT_FILENAME = 'raw_format.json'
+
+def is_mapped(path):
+    """Return whether the file at path is read by read_mapped()."""
+    return pathlib.Path(path).suffix.lower() in NPY_SUFFIXES | RAW_SUFFIXES
+
+def read_mapped(path, raw_format=None):
+    """Map a .npy or raw file into memory, and return (data, image_bits), where data is the (x, y[, c])
+    array of its pixels and image_bits is None unless specified for a raw file. As for raw files, the
+    array in a .npy file is taken to be (y, x[, c]), as saved with numpy.save() from a camera frame or
+    image file (see image.Image.from_yx()), and is swapped into (x, y[, c]) order without copying.
+
+    raw_format: for raw files without a sidecar file describing their format (see read_raw_format()), a
+        dict of the shape, dtype, and optionally image_bits and offset arguments of read_raw()."""
+    path = pathlib.Path(path)
+    if path.suffix.lower() in NPY_SUFFIXES:
+        # Image uses the swapped array without copying whether it is C- or Fortran-ordered.
+        return numpy.load(str(path), mmap_mode='c').swapaxes(0, 1), None
+    sidecar_format = read_raw_format(path)
+    if sidecar_format is not None:
+        raw_format = sidecar_format
+    elif raw_format is None:
+        raise ValueError('No sidecar file found for raw file {}, and no format given.'.format(path))
+    return read_raw(path, **raw_format)
+
+def read_raw(path, shape, dtype, image_bits=None, offset=0):
+    """Map a headerless raw file into memory, and return (data, image_bits).
+
+    shape: (width, height) or (width, height, channels) of the image. Pixels are stored row by row, as
+        by most cameras, with channels (if any) interleaved.
+    dtype: numpy dtype of the pixel values (e.g. 'uint16').
+    image_bits: for uint16 images, the number of significant bits (see image.Image).
+    offset: number of bytes before the first pixel."""
+    width, height, *channels = shape
+    data = numpy.memmap(str(path), dtype=numpy.dtype(dtype), mode='c', offset=offset, shape=(height, width, *channels))
+    return data.swapaxes(0, 1), image_bits
+
+def read_raw_format(path):
+    """Return the format of a raw file, as a dict of arguments to read_raw(), from its sidecar JSON file:
+    either the file of the same name with .json appended (e.g. frame_0001.raw.json), or else
+    RAW_FORMAT_FILENAME in the same directory. Returns None if there is neither."""
+    path = pathlib.Path(path)
+    for sidecar in (path.with_name(path.name + '.json'), path.with_name(RAW_FORMAT_FILENAME)):
+        if sidecar.exists():
+            with sidecar.open() as f:
+                return json.load(f)
+    return None
@@ -1,6 +1,9 @@
 # This code is licensed under the MIT License (see LICENSE file for details)
 
 from PyQt5 import Qt
+import concurrent.futures as futures
+import threading
+import traceback
 import warnings
 import numpy
 
@@ -49,9 +52,64 @@ NB: In case of error, calling del on the layer attribute causes it to revert to
 
 _DEBUG_NO_HIST = False
 
+# Number of threads used for histogram calculation by layers whose histogram_threads
+# property is None. If this is also None, all available CPUs are used.
+DEFAULT_HISTOGRAM_THREADS = None
+
+# Histogram results shared by all layers, so that reassigning an image that has not been refreshed since
+# (e.g. revisiting a flipbook page) with the same histogram settings skips recalculating its histogram.
+# HISTOGRAM_CACHE.hits and HISTOGRAM_CACHE.misses count cache lookups.
+HISTOGRAM_CACHE = histogram.HistogramCache()
+
+# Layers with async_histogram set calculate their histograms in this background thread (which in turn
+# splits each calculation across histogram_threads threads).
+_HISTOGRAM_EXECUTOR = None
+def _histogram_executor():
+    global _HISTOGRAM_EXECUTOR
+    if _HISTOGRAM_EXECUTOR is None:
+        _HISTOGRAM_EXECUTOR = futures.ThreadPoolExecutor(max_workers=1)
+    return _HISTOGRAM_EXECUTOR
+
+# Histograms of images that are not yet assigned to layers (see Layer.prefetch_histogram()) are calculated
+# in this background thread, so as not to delay those of the images being displayed.
+_PREFETCH_EXECUTOR = None
+def _prefetch_executor():
+    global _PREFETCH_EXECUTOR
+    if _PREFETCH_EXECUTOR is None:
+        _PREFETCH_EXECUTOR = futures.ThreadPoolExecutor(max_workers=1)
+    return _PREFETCH_EXECUTOR
+
+def _calculate_histogram(args, channels):
+    """Return image_min, image_max, histogram, and channel_histograms for a layer's image, given the
+    arguments to histogram.histogram() and whether channel histograms are wanted."""
+    if channels:
+        # the luma histogram and the red, green, and blue histograms are calculated in the same pass
+        mins, maxs, hists = histogram.channel_histograms(*args, luma=True)
+        return mins[-1], maxs[-1], hists[-1], hists[:3]
+    else:
+        return histogram.histogram(*args) + (None,)
+
+def _cache_histogram(image, key, result):
+    # cached arrays are shared, so make sure that they are not modified in place
+    for hist in result[2:]:
+        if hist is not None:
+            hist.flags.writeable = False
+    HISTOGRAM_CACHE.put(image, key, result)
+
 def coerce_to_str(v):
     return '' if v is None else str(v)
 
+def coerce_to_optional_int(v):
+    return None if v is None else int(v)
+
+def coerce_to_percentiles(v):
+    if v is None:
+        return None
+    v = tuple(map(float, v))
+    if len(v) != 2 or not 0 <= v[0] <= v[1] <= 100:
+        raise ValueError('The value assigned to auto_min_max_percentiles must be None or a (low, high) pair of percentiles, with 0 <= low <= high <= 100.')
+    return v
+
 def coerce_to_tint(v):
     v = tuple(map(float, v))
     if len(v) not in (3,4) or not all(map(lambda v_: 0 <= v_ <= 1, v)):
@@ -67,6 +125,7 @@ class Layer(qt_property.QtPropertyOwner):
         visible
         histogram_mask
         auto_min_max
+        auto_min_max_percentiles
         min
         max
         gamma
@@ -77,10 +136,22 @@ class Layer(qt_property.QtPropertyOwner):
         transform_section
         blend_function
         opacity
+        histogram_threads
+        show_channel_histograms
+        async_histogram
+        auto_min_max_waits_for_histogram
+        wait_for_texture_upload
+        mipmaps
 
     The 'changed' signal is emitted when any property impacting image presentation
     is modified or image data is explicitly changed or refreshed. Each specific
-    property also has its own changed signal, such as 'min_changed' &c.
+    property also has its own changed signal, such as 'min_changed' &c. The
+    'histogram_changed' signal is emitted when a new histogram is available,
+    and 'texture_changed' when the upload of a new image to the GPU completes.
+
+    The histogram is calculated only when it is needed (see the histogram
+    attribute), and the image min and max only when they are needed (e.g.
+    by auto_min_max) before the histogram is calculated.
     """
 
     GAMMA_RANGE = (0.0625, 16.0)
@@ -131,13 +202,35 @@ class Layer(qt_property.QtPropertyOwner):
     type_changed = Qt.pyqtSignal(object)
     size_changed = Qt.pyqtSignal(object)
     name_changed = Qt.pyqtSignal(object)
+    histogram_changed = Qt.pyqtSignal(object)
+    texture_changed = Qt.pyqtSignal(object)
+
+    _HISTOGRAM_READY_EVENT = Qt.QEvent.registerEventType()
+    _TEXTURE_READY_EVENT = Qt.QEvent.registerEventType()
+    _HISTOGRAM_PREFETCHED_EVENT = Qt.QEvent.registerEventType()
 
     def __init__(self, image=None, parent=None):
         self._retain_auto_min_max_on_min_max_change = False
         self._image = None
+        self._image_min = None
+        self._image_max = None
+        self._histogram_range = None
+        self._prefetching_histograms = set()
+        self._histogram = None
+        self._channel_histograms = None
+        # Each histogram calculation is numbered, so that the results of asynchronous calculations that have
+        # been superseded are recognized. _histogram_serial is the number of the current histogram.
+        self._histogram_request_serial = 0
+        self._histogram_submitted_serial = 0
+        self._histogram_serial = 0
+        self._histogram_lock = threading.Lock()
+        self._queued_histogram_request = None
+        self._histogram_worker_running = False
         super().__init__(parent)
         self.image_changed.connect(self.changed)
-        self.texture = async_texture.AsyncTexture()
+        self._focused = False
+        self._in_layer_stack = False
+        self.texture = async_texture.DoubleBufferedTexture(self._on_texture_ready)
         # need to be set already for self.image setter to work propery
         self.dtype = None
         self.type = None
@@ -183,6 +276,7 @@ class Layer(qt_property.QtPropertyOwner):
             self._image.changed.disconnect(self._on_image_changed)
 
         self._image = new_image
+        self._update_texture_priority()
 
         if new_image is None:
             self.dtype = None
@@ -206,14 +300,17 @@ class Layer(qt_property.QtPropertyOwner):
 
     def _on_image_changed(self, changed_region=None):
         if self.image is not None:
-            # upload texture before calculating the histogram, so that the background texture upload (slow) runs in
-            # parallel with the foreground histogram calculation (slow)
+            # upload texture before anything else, so that the background texture upload (slow) runs in
+            # parallel with any foreground histogram calculation (slow)
+            self._update_texture_class()
             self.texture.upload(self.image, changed_region)
-            self.calculate_histogram()
+            if changed_region is None or not self._update_histogram_region(changed_region):
+                self._image_min = self._image_max = None
+                self._invalidate_histogram()
         self._update_property_defaults()
         if self.image is not None:
             if self.auto_min_max:
-                self.do_auto_min_max()
+                self._update_auto_min_max()
             else:
                 l, h = self.image.valid_range
                 if self.min < l:
@@ -222,15 +319,301 @@ class Layer(qt_property.QtPropertyOwner):
                     self.max = h
         self.image_changed.emit(self)
 
+    def _get_histogram_threads(self):
+        threads = self.histogram_threads
+        if threads is None:
+            threads = DEFAULT_HISTOGRAM_THREADS
+        return threads
+
+    @property
+    def histogram(self):
+        """The histogram of the image. It is calculated only when needed: when first read after the image or
+        histogram settings change (or, if async_histogram is set, in the background, in which case the previous
+        histogram is returned until the new one is ready)."""
+        if self.image is not None and self._histogram_pending:
+            self._request_histogram()
+        return self._histogram
+
+    @property
+    def channel_histograms(self):
+        """The histograms of the red, green, and blue channels, if show_channel_histograms is set and the image is
+        RGB or RGBA; otherwise None. Calculated along with the histogram (see above)."""
+        if self.image is not None and self._histogram_pending:
+            self._request_histogram()
+        return self._channel_histograms
+
     def calculate_histogram(self):
+        """Calculate the histogram now (or start calculating it, if async_histogram is set), rather than
+        when it is next needed."""
+        self._invalidate_histogram()
+        self._request_histogram()
+
+    def prefetch_histogram(self, image):
+        """Start calculating, in the background, the histogram that this layer would have (with its current
+        histogram settings) if image were assigned to it, so that the histogram is ready in HISTOGRAM_CACHE
+        when it is."""
+        if _DEBUG_NO_HIST or image is None or image is self.image:
+            return
+        histogram_range = self._current_histogram_range()
+        key = self._histogram_cache_key(image, histogram_range)
+        request = id(image), image.generation, key
+        if request in self._prefetching_histograms or HISTOGRAM_CACHE.contains(image, key):
+            return
+        self._prefetching_histograms.add(request)
+        args = image.data, histogram_range, image.image_bits, self.histogram_mask, self._get_histogram_threads()
+        channels = self.show_channel_histograms and image.type in ('rgb', 'rgba')
+        _prefetch_executor().submit(self._histogram_prefetch_worker, image, image.generation, key, args, channels)
+
+    def _histogram_prefetch_worker(self, image, generation, key, args, channels):
+        # runs in the prefetch executor thread
+        try:
+            result = _calculate_histogram(args, channels)
+        except Exception as e:
+            result = e
+        event = Qt.QEvent(self._HISTOGRAM_PREFETCHED_EVENT)
+        event.request = image, generation, key, channels
+        event.result = result
+        Qt.QCoreApplication.postEvent(self, event)
+
+    def _on_histogram_prefetched(self, request, result):
+        image, generation, key, channels = request
+        self._prefetching_histograms.discard((id(image), generation, key))
+        if isinstance(result, Exception) or image.generation != generation:
+            # the histogram will be calculated again if the image is assigned to the layer
+            return
+        _cache_histogram(image, key, result)
+        if image is self.image and self._histogram_pending and key == self._histogram_cache_key():
+            # the image was assigned before its histogram was ready: use it as if calculated for the layer
+            self._on_histogram_ready((self._histogram_request_serial, image, generation, key, None, channels), result)
+
+    def _current_histogram_range(self):
         r_min = None if self._is_default('histogram_min') else self.histogram_min
         r_max = None if self._is_default('histogram_max') else self.histogram_max
-        if not _DEBUG_NO_HIST:
-            self.image_min, self.image_max, self.histogram = histogram.histogram(
-                self.image.data, (r_min, r_max), self.image.image_bits, self.histogram_mask)
+        return r_min, r_max
+
+    def _invalidate_histogram(self):
+        r_min, r_max = self._histogram_range = self._current_histogram_range()
+        self._histogram_request_serial += 1
+        if _DEBUG_NO_HIST:
+            self._set_histogram((r_min, r_max, numpy.zeros(256, dtype=numpy.uint32), None))
+            return
+        cached = HISTOGRAM_CACHE.get(self.image, self._histogram_cache_key())
+        if cached is not None:
+            self._set_histogram(cached)
+
+    def _request_histogram(self):
+        if not self._histogram_pending or self._histogram_submitted_serial == self._histogram_request_serial:
+            return
+        self._histogram_submitted_serial = self._histogram_request_serial
+        r_min, r_max = self._histogram_range
+        key = self._histogram_cache_key()
+        args = self.image.data, (r_min, r_max), self.image.image_bits, self.histogram_mask, self._get_histogram_threads()
+        channels = self.show_channel_histograms and self.type in ('rgb', 'rgba')
+        if self.async_histogram:
+            request = self._histogram_request_serial, self.image, self.image.generation, key, args, channels
+            with self._histogram_lock:
+                # replace any request that the worker has not yet started on
+                self._queued_histogram_request = request
+                if not self._histogram_worker_running:
+                    self._histogram_worker_running = True
+                    _histogram_executor().submit(self._histogram_worker)
+        else:
+            result = _calculate_histogram(args, channels)
+            _cache_histogram(self.image, key, result)
+            self._set_histogram(result)
+
+    def _auto_min_max_needs_histogram(self):
+        return self.auto_min_max_waits_for_histogram or self.auto_min_max_percentiles is not None
+
+    def _update_auto_min_max(self):
+        if self.async_histogram and self._auto_min_max_needs_histogram() and self._histogram_pending:
+            # min and max are set when the histogram is ready
+            self._request_histogram()
         else:
-            self.image_min, self.image_max = r_min, r_max
-            self.histogram = numpy.zeros(256, dtype=numpy.uint32)
+            self.do_auto_min_max()
+
+    @property
+    def _histogram_pending(self):
+        return self._histogram_serial != self._histogram_request_serial
+
+    def _set_histogram(self, result, serial=None):
+        self._image_min, self._image_max, self._histogram, self._channel_histograms = result
+        self._histogram_serial = self._histogram_request_serial if serial is None else serial
+        self.histogram_changed.emit(self)
+
+    def _histogram_worker(self):
+        # runs in the histogram executor thread until no more requests are queued
+        while True:
+            with self._histogram_lock:
+                request = self._queued_histogram_request
+                self._queued_histogram_request = None
+                if request is None:
+                    self._histogram_worker_running = False
+                    return
+            serial, image, generation, key, args, channels = request
+            try:
+                result = _calculate_histogram(args, channels)
+            except Exception as e:
+                traceback.print_exc()
+                result = e
+            # deliver the result to the main thread
+            event = Qt.QEvent(self._HISTOGRAM_READY_EVENT)
+            event.request = request
+            event.result = result
+            Qt.QCoreApplication.postEvent(self, event)
+
+    def _update_texture_class(self):
+        # images too large for a single texture are stored in tiles
+        texture_class = async_texture.TiledTexture if async_texture.needs_tiles(self.image) else async_texture.DoubleBufferedTexture
+        if type(self.texture) is not texture_class:
+            self.texture.destroy()
+            self.texture = texture_class(self._on_texture_ready)
+            self.texture.block = self.wait_for_texture_upload
+            self.texture.mipmaps = self.mipmaps
+            self._update_texture_priority()
+
+    def _set_focused(self, focused):
+        # called by LayerStack when this layer gains or loses focus
+        self._focused = focused
+        self._update_texture_priority()
+
+    def _set_in_layer_stack(self, in_layer_stack):
+        # called by LayerStack when this layer is added to or removed from its layers
+        self._in_layer_stack = in_layer_stack
+        self._update_texture_priority()
+
+    def _update_texture_priority(self):
+        # The focused layer's image is uploaded first, and those of invisible layers last. The textures of visible
+        # layers with images in a layer stack are pinned, so that the TextureManager never evicts a texture that a
+        # view may draw.
+        if not self.visible:
+            priority = async_texture.UPLOAD_PRIORITY_BACKGROUND
+        elif self._focused:
+            priority = async_texture.UPLOAD_PRIORITY_FOCUSED
+        else:
+            priority = async_texture.UPLOAD_PRIORITY_VISIBLE
+        self.texture.priority = priority
+        self.texture.pinned = self.visible and self._in_layer_stack and self._image is not None
+
+    def _on_texture_ready(self):
+        # called from the texture upload thread
+        Qt.QCoreApplication.postEvent(self, Qt.QEvent(self._TEXTURE_READY_EVENT))
+
+    def event(self, e):
+        if e.type() == self._HISTOGRAM_READY_EVENT:
+            self._on_histogram_ready(e.request, e.result)
+            return True
+        elif e.type() == self._HISTOGRAM_PREFETCHED_EVENT:
+            self._on_histogram_prefetched(e.request, e.result)
+            return True
+        elif e.type() == self._TEXTURE_READY_EVENT:
+            self.texture_changed.emit(self)
+            return True
+        return super().event(e)
+
+    def _on_histogram_ready(self, request, result):
+        serial, image, generation, key, args, channels = request
+        if isinstance(result, Exception):
+            # The exception was printed by the worker. (Raising it here, in an event handler, would abort the
+            # application.) If this was the current image's histogram, it is no longer pending: the layer has
+            # no histogram until the image or histogram settings change.
+            if serial == self._histogram_request_serial:
+                self._set_histogram((None, None, None, None))
+            return
+        if image.generation == generation:
+            _cache_histogram(image, key, result)
+        if serial <= self._histogram_serial or self.image is None:
+            # superseded by a histogram that is already available
+            return
+        image_min, image_max, hist, channel_hists = result
+        if serial == self._histogram_request_serial:
+            self._set_histogram(result)
+            if self.auto_min_max and self._auto_min_max_needs_histogram() and image is self.image:
+                self._set_auto_min_max(*self._auto_min_max_values(image, image_min, image_max, hist))
+        else:
+            # A newer histogram has been requested. Display this one in the meantime (so that the histogram
+            # is updated even if images change faster than histograms can be calculated), but it is not
+            # the histogram of the current image, so keep the current extrema (and min and max).
+            self._set_histogram((self._image_min, self._image_max, hist, channel_hists), serial)
+
+    def _histogram_cache_key(self, image=None, histogram_range=None):
+        # the key of the current image's histogram, or of that of another image with the given histogram range
+        if image is None:
+            image, histogram_range = self.image, self._histogram_range
+        mask = self.histogram_mask
+        return (histogram_range, None if mask is None else tuple(mask), image.image_bits,
+            self.show_channel_histograms and image.type in ('rgb', 'rgba'))
+
+    def _update_histogram_region(self, changed_region):
+        """Update the histogram after a change to only the (l, t, w, h) changed_region of the image, by
+        subtracting the bin counts of the region's previous contents (given to Image.refresh() as
+        previous_region_data) and adding those of its new contents. Returns False if an incremental update
+        is not possible, in which case the full histogram must be recalculated."""
+        old_data = self.image.previous_region_data
+        if _DEBUG_NO_HIST or old_data is None or self._histogram_pending or self._histogram is None:
+            return False
+        if self.histogram_mask is not None or self._channel_histograms is not None:
+            return False
+        x, y, w, h = changed_region
+        new_data = self.image.data[max(x, 0):max(x+w, 0), max(y, 0):max(y+h, 0)]
+        old_data = numpy.asarray(old_data)
+        if old_data.shape != new_data.shape or old_data.dtype != new_data.dtype:
+            return False
+        if new_data.size == 0:
+            return True
+        r_min, r_max = self._histogram_range
+        # The default histogram range of a float image is the image's min and max, so the existing bins are only
+        # valid for the update if the extrema do not change.
+        data_dependent_range = self.dtype.type in histogram.FLOAT_DTYPES and None in (r_min, r_max)
+        if data_dependent_range:
+            if self._image_min is None or self._image_max is None:
+                return False
+            if r_min is None:
+                r_min = self._image_min
+            if r_max is None:
+                r_max = self._image_max
+        image_bits = self.image.image_bits
+        threads = self._get_histogram_threads()
+        old_min, old_max, old_hist = histogram.histogram(old_data, (r_min, r_max), image_bits, None, threads)
+        new_min, new_max, new_hist = histogram.histogram(new_data, (r_min, r_max), image_bits, None, threads)
+        image_min, image_max = self._image_min, self._image_max
+        # If the previous extreme value may have been overwritten, the new extremum is unknown, and is
+        # recalculated from the full image only if it is needed.
+        if image_min is not None:
+            if new_min <= image_min:
+                image_min = new_min
+            elif old_min == image_min:
+                image_min = None
+        if image_max is not None:
+            if new_max >= image_max:
+                image_max = new_max
+            elif old_max == image_max:
+                image_max = None
+        if data_dependent_range and (image_min, image_max) != (self._image_min, self._image_max):
+            return False
+        result = image_min, image_max, self._histogram - old_hist + new_hist, None
+        _cache_histogram(self.image, self._histogram_cache_key(), result)
+        self._set_histogram(result)
+        return True
+
+    def _calculate_min_max(self):
+        if _DEBUG_NO_HIST:
+            self._image_min, self._image_max = self.image.valid_range
+        else:
+            self._image_min, self._image_max = histogram.min_max(
+                self.image.data, self.histogram_mask, self._get_histogram_threads())
+
+    @property
+    def image_min(self):
+        if self._image_min is None and self.image is not None:
+            self._calculate_min_max()
+        return self._image_min
+
+    @property
+    def image_max(self):
+        if self._image_max is None and self.image is not None:
+            self._calculate_min_max()
+        return self._image_max
 
     def generate_contextual_info_for_pos(self, x, y, idx=None):
         if self.image is None:
@@ -245,16 +628,43 @@ class Layer(qt_property.QtPropertyOwner):
 
     def do_auto_min_max(self):
         assert self.image is not None
+        if self.auto_min_max_percentiles is None:
+            self._set_auto_min_max(self.image_min, self.image_max)
+        else:
+            hist = self.histogram # calculated first, if need be, along with the image min and max
+            if self._histogram_pending:
+                # The histogram is being calculated in the background (see async_histogram), and the one
+                # available (if any) is not that of the current image: find the percentiles from the image.
+                hist = None
+            self._set_auto_min_max(*self._auto_min_max_values(self.image, self.image_min, self.image_max, hist))
+
+    def _auto_min_max_values(self, image, image_min, image_max, hist):
+        # hist is the histogram of image over the layer's histogram range, or None to calculate it anew
+        percentiles = self.auto_min_max_percentiles
+        if percentiles is None:
+            return image_min, image_max
+        low, high = histogram.percentiles(image.data, percentiles, self._histogram_range, image.image_bits,
+            self.histogram_mask, self._get_histogram_threads(), None if hist is None else (image_min, image_max, hist))
+        if numpy.isnan(low):
+            # no values to take percentiles of
+            return image_min, image_max
+        return low, high
+
+    def _set_auto_min_max(self, image_min, image_max):
         self._retain_auto_min_max_on_min_max_change = True
         try:
-            self.min = max(self.image_min, self.histogram_min)
-            self.max = min(self.image_max, self.histogram_max)
+            self.min = max(image_min, self.histogram_min)
+            self.max = min(image_max, self.histogram_max)
         finally:
             self._retain_auto_min_max_on_min_max_change = False
 
+    def _visible_post_set(self, v):
+        self._update_texture_priority()
+
     visible = qt_property.Property(
         default_value=True,
-        coerce_arg_fn=bool)
+        coerce_arg_fn=bool,
+        post_set_callback=_visible_post_set)
 
     def _histogram_mask_post_set(self, v):
         self._on_image_changed()
@@ -265,13 +675,25 @@ class Layer(qt_property.QtPropertyOwner):
 
     def _auto_min_max_post_set(self, v):
         if v and self.image is not None:
-            self.do_auto_min_max()
+            self._update_auto_min_max()
 
     auto_min_max = qt_property.Property(
         default_value=False,
         coerce_arg_fn=bool,
         post_set_callback=_auto_min_max_post_set)
 
+    def _auto_min_max_percentiles_post_set(self, v):
+        if self.auto_min_max and self.image is not None:
+            self._update_auto_min_max()
+
+    auto_min_max_percentiles = qt_property.Property(
+        default_value=None,
+        coerce_arg_fn=coerce_to_percentiles,
+        post_set_callback=_auto_min_max_percentiles_post_set,
+        doc='If not None, a (low, high) pair of percentiles of the image values, such as (0.5, 99.5), to which '
+            'auto_min_max sets min and max, rather than to the image min and max (so that a few outlying values '
+            'do not determine the scaling). The percentiles are found from the histogram.')
+
     def _min_default(self):
         if self.image is None:
             return 0.0
@@ -329,7 +751,7 @@ class Layer(qt_property.QtPropertyOwner):
     def _histogram_min_default(self):
         if self.image is None:
             return 0.0
-        elif self.dtype == numpy.float32:
+        elif self.dtype.type in histogram.FLOAT_DTYPES:
             return self.image_min
         else:
             return float(self.image.valid_range[0])
@@ -337,7 +759,7 @@ class Layer(qt_property.QtPropertyOwner):
     def _histogram_max_default(self):
         if self.image is None:
             return 65535.0
-        elif self.dtype == numpy.float32:
+        elif self.dtype.type in histogram.FLOAT_DTYPES:
             return self.image_max
         else:
             return float(self.image.valid_range[1])
@@ -362,7 +784,7 @@ class Layer(qt_property.QtPropertyOwner):
 
     def _histogram_min_max_post_set(self, v):
         if self.image is not None:
-            self.calculate_histogram()
+            self._invalidate_histogram()
         self._retain_auto_min_max_on_min_max_change = True
         try:
             if self.min < self.histogram_min:
@@ -372,7 +794,7 @@ class Layer(qt_property.QtPropertyOwner):
         finally:
             self._retain_auto_min_max_on_min_max_change = False
         if self.image is not None and self.auto_min_max:
-            self.do_auto_min_max()
+            self._update_auto_min_max()
 
     histogram_min = qt_property.Property(
         default_value=_histogram_min_default,
@@ -423,6 +845,64 @@ class Layer(qt_property.QtPropertyOwner):
         pre_set_callback=_blend_function_pre_set,
         doc=SHADER_PROP_HELP + '\n\nSupported blend_functions:\n    ' + '\n    '.join("'" + s + "'" for s in sorted(BLEND_FUNCTIONS.keys())))
 
+    def _histogram_threads_pre_set(self, v):
+        if v is not None and v < 1:
+            warnings.warn('histogram_threads must be None or a positive integer.')
+            return False
+
+    histogram_threads = qt_property.Property(
+        default_value=None,
+        coerce_arg_fn=coerce_to_optional_int,
+        pre_set_callback=_histogram_threads_pre_set,
+        doc='Maximum number of threads used to calculate the histogram. If None, layer.DEFAULT_HISTOGRAM_THREADS is used.')
+
+    def _show_channel_histograms_post_set(self, v):
+        if self.image is not None:
+            self._invalidate_histogram()
+
+    show_channel_histograms = qt_property.Property(
+        default_value=False,
+        coerce_arg_fn=bool,
+        post_set_callback=_show_channel_histograms_post_set,
+        doc='If True, the histograms of the red, green, and blue channels of RGB and RGBA images are also calculated '
+            '(as layer.channel_histograms) and displayed in place of the luma histogram.')
+
+    async_histogram = qt_property.Property(
+        default_value=False,
+        coerce_arg_fn=bool,
+        doc='If True, histograms are calculated in a background thread rather than when they are needed. Until '
+            'a new histogram is ready (when histogram_changed is emitted), layer.histogram retains the previous '
+            'one. If the image changes again before a histogram calculation starts, only the newest image is '
+            'histogrammed.')
+
+    auto_min_max_waits_for_histogram = qt_property.Property(
+        default_value=False,
+        coerce_arg_fn=bool,
+        doc='If True and async_histogram is True, auto_min_max sets min and max from the histogram calculation '
+            'when it is ready. Otherwise, they are set as soon as the image changes, from a separate and faster '
+            'calculation of the image min and max.')
+
+    def _wait_for_texture_upload_post_set(self, v):
+        self.texture.block = v
+
+    wait_for_texture_upload = qt_property.Property(
+        default_value=False,
+        coerce_arg_fn=bool,
+        post_set_callback=_wait_for_texture_upload_post_set,
+        doc='If True, the newest image is always drawn, even if drawing must wait for its upload to the GPU to '
+            'complete. Otherwise, the previous image is drawn until the upload of the new one completes.')
+
+    def _mipmaps_post_set(self, v):
+        self.texture.mipmaps = v
+
+    mipmaps = qt_property.Property(
+        default_value=True,
+        coerce_arg_fn=bool,
+        post_set_callback=_mipmaps_post_set,
+        doc='If True, mipmaps are used to draw the image smoothly when it is zoomed out. They are generated the '
+            'first time the image is drawn zoomed out, and kept up to date from then on. If False, zoomed-out '
+            'images are drawn with bilinear interpolation, and no time is spent generating mipmaps.')
+
     @property
     def opacity(self):
         return self.tint[3]
@@ -183,10 +183,12 @@ class LayerStack(Qt.QObject):
             # can connect without worrying that it's already connected because LayerList guarantees
             # that a given layer can only be in the lost
             layer.auto_min_max_changed.connect(self._on_layer_auto_min_max_changed)
+            layer._set_in_layer_stack(True)
 
     def _detach_layers(self, layers):
         for layer in layers:
             layer.auto_min_max_changed.disconnect(self._on_layer_auto_min_max_changed)
+            layer._set_in_layer_stack(False)
 
     def _on_inserting_into_layers(self, idx, inserted_layers):
         self._attach_layers(inserted_layers)
@@ -243,8 +245,10 @@ class LayerStack(Qt.QObject):
     def _on_layer_focus_changed(self, layer_stack, old_focused_layer, new_focused_layer):
         if old_focused_layer is not None:
             old_focused_layer.image_changed.disconnect(self._on_focused_layer_image_changed)
+            old_focused_layer._set_focused(False)
         if new_focused_layer is not None:
             new_focused_layer.image_changed.connect(self._on_focused_layer_image_changed)
+            new_focused_layer._set_focused(True)
         image = None if new_focused_layer is None else new_focused_layer.image
         self.focused_image_changed.emit(image)
 
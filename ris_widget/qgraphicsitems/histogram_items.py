@@ -9,6 +9,7 @@ from PyQt5 import Qt
 from . import shader_item
 from .. import shared_resources
 from .. import internal_util
+from ..histogram import FLOAT_DTYPES
 
 class HistogramItem(shader_item.ShaderItem):
     QGRAPHICSITEM_TYPE = shared_resources.generate_unique_qgraphicsitem_type()
@@ -35,10 +36,12 @@ class HistogramItem(shader_item.ShaderItem):
         assert self.layer is old_layer
         if old_layer is not None:
             old_layer.image_changed.disconnect(self._on_layer_histogram_change)
+            old_layer.histogram_changed.disconnect(self._on_layer_histogram_change)
             old_layer.min_changed.disconnect(self.min_item.arrow_item._on_value_changed)
             old_layer.max_changed.disconnect(self.max_item.arrow_item._on_value_changed)
             old_layer.histogram_min_changed.disconnect(self._on_layer_histogram_change)
             old_layer.histogram_max_changed.disconnect(self._on_layer_histogram_change)
+            old_layer.show_channel_histograms_changed.disconnect(self._on_layer_histogram_change)
             old_layer.gamma_changed.disconnect(self.gamma_item._on_value_changed)
         self._connect_layer(new_layer)
 
@@ -46,10 +49,12 @@ class HistogramItem(shader_item.ShaderItem):
         self.layer = layer
         if layer is not None:
             layer.image_changed.connect(self._on_layer_histogram_change)
+            layer.histogram_changed.connect(self._on_layer_histogram_change)
             layer.min_changed.connect(self.min_item.arrow_item._on_value_changed)
             layer.max_changed.connect(self.max_item.arrow_item._on_value_changed)
             layer.histogram_min_changed.connect(self._on_layer_histogram_change)
             layer.histogram_max_changed.connect(self._on_layer_histogram_change)
+            layer.show_channel_histograms_changed.connect(self._on_layer_histogram_change)
             layer.gamma_changed.connect(self.gamma_item._on_value_changed)
         self._on_layer_histogram_change()
 
@@ -68,14 +73,27 @@ class HistogramItem(shader_item.ShaderItem):
             if self._tex is not None:
                 self._tex.destroy()
                 self._tex = None
+        elif layer.histogram is None:
+            # the layer's first histogram is still being calculated in the background
+            return
         else:
             widget_size = widget.size()
             histogram = self.layer.histogram
+            channel_histograms = self.layer.channel_histograms
+            if channel_histograms is None:
+                desired_shader_type = 'G'
+                frag_shader_name = 'histogram_item_fragment_shader'
+                desired_tex_target = Qt.QOpenGLTexture.Target1D
+            else:
+                # red, green, and blue histograms are drawn together from the rows of a 2D texture
+                histogram = channel_histograms
+                desired_shader_type = 'channels'
+                frag_shader_name = 'histogram_item_channels_fragment_shader'
+                desired_tex_target = Qt.QOpenGLTexture.Target2D
             with ExitStack() as estack:
                 qpainter.beginNativePainting()
                 estack.callback(qpainter.endNativePainting)
                 QGL = shared_resources.QGL()
-                desired_shader_type = 'G'
                 if desired_shader_type in self.progs:
                     prog = self.progs[desired_shader_type]
                     if not QGL.glIsProgram(prog.programId()):
@@ -86,20 +104,23 @@ class HistogramItem(shader_item.ShaderItem):
                     prog = self.build_shader_prog(
                         desired_shader_type,
                         'planar_quad_vertex_shader',
-                        'histogram_item_fragment_shader')
-                desired_tex_width = len(histogram)
+                        frag_shader_name)
+                desired_tex_width = histogram.shape[-1]
                 tex = self._tex
                 if tex is not None:
-                    if tex.width() != desired_tex_width:
+                    if tex.width() != desired_tex_width or tex.target() != desired_tex_target:
                         tex.destroy()
                         tex = None
                 if tex is None:
-                    tex = Qt.QOpenGLTexture(Qt.QOpenGLTexture.Target1D)
+                    tex = Qt.QOpenGLTexture(desired_tex_target)
                     tex.setFormat(Qt.QOpenGLTexture.R32F)
                     tex.setWrapMode(Qt.QOpenGLTexture.ClampToEdge)
                     tex.setMipLevels(1)
                     tex.setAutoMipMapGenerationEnabled(False)
-                    tex.setSize(desired_tex_width)
+                    if histogram.ndim == 1:
+                        tex.setSize(desired_tex_width)
+                    else:
+                        tex.setSize(desired_tex_width, len(histogram))
                     tex.allocateStorage()
                     # tex stores histogram bin counts - values that are intended to be addressed by element without
                     # interpolation.  Thus, nearest neighbor for texture filtering.
@@ -112,11 +133,25 @@ class HistogramItem(shader_item.ShaderItem):
                     estack.callback(tex.release)
                 max_bin_val = histogram.max()
                 if self._hist_tex_needs_upload:
-                    GL.glTexSubImage1D(
-                        GL.GL_TEXTURE_1D, 0, 0, desired_tex_width, GL.GL_RED,
-                        GL.GL_UNSIGNED_INT,
-                        memoryview(histogram)
-                    )
+                    if histogram.dtype == numpy.uint32:
+                        source_type = GL.GL_UNSIGNED_INT
+                    else:
+                        # 64-bit bin counts (from very large images) have no GL pixel type: upload as floats,
+                        # normalized as GL would normalize GL_UNSIGNED_INT data
+                        histogram = (histogram / 4294967295).astype(numpy.float32)
+                        source_type = GL.GL_FLOAT
+                    if histogram.ndim == 1:
+                        GL.glTexSubImage1D(
+                            GL.GL_TEXTURE_1D, 0, 0, desired_tex_width, GL.GL_RED,
+                            source_type,
+                            memoryview(histogram)
+                        )
+                    else:
+                        GL.glTexSubImage2D(
+                            GL.GL_TEXTURE_2D, 0, 0, 0, desired_tex_width, len(histogram), GL.GL_RED,
+                            source_type,
+                            memoryview(numpy.ascontiguousarray(histogram))
+                        )
                     self._hist_tex_needs_upload = False
                     self._tex = tex
                 glQuad = shared_resources.GL_QUAD()
@@ -161,7 +196,7 @@ class HistogramItem(shader_item.ShaderItem):
             layer = self.layer
             if layer is not None:
                 image = layer.image
-                if image is not None:
+                if image is not None and layer.histogram is not None:
                     histogram = layer.histogram
                     hist_min = layer.histogram_min
                     hist_width = layer.histogram_max - hist_min
@@ -169,7 +204,7 @@ class HistogramItem(shader_item.ShaderItem):
                     bin_width = hist_width / n_bins
                     bin = int(self.contextual_info_pos.x() * n_bins)
                     l, r = hist_min + bin * bin_width, hist_min + (bin + 1) * bin_width
-                    if image.data.dtype == numpy.float32:
+                    if image.data.dtype.type in FLOAT_DTYPES:
                         bin_text = '[{:.8g},{:.8g}{}'.format(l, r, ']' if bin == n_bins - 1 else ')')
                     else:
                         l, r = int(math.ceil(l)), int(math.floor(r))
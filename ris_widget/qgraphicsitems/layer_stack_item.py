@@ -5,6 +5,7 @@ import numpy
 from PyQt5 import Qt
 from string import Template
 import textwrap
+from .. import async_texture
 from .. import shared_resources
 from . import shader_item
 
@@ -16,10 +17,19 @@ SRC_BLEND = '''    // blending function name: src
 
 UNIFORM_SECTION = Template(textwrap.dedent("""\
     uniform sampler2D tex_${tex_unit};
+    uniform vec4 tex_transform_${tex_unit};
+    uniform bool tex_transposed_${tex_unit};
     uniform float rescale_min_${tex_unit};
     uniform float rescale_range_${tex_unit};
     uniform float gamma_${tex_unit};
-    uniform vec4 tint_${tex_unit};"""))
+    uniform vec4 tint_${tex_unit};
+
+    vec2 tex_coord_${tex_unit}(vec2 tex_coord)
+    {
+        // images whose columns are contiguous in memory are stored as transposed textures
+        vec2 tc = tex_coord * tex_transform_${tex_unit}.xy + tex_transform_${tex_unit}.zw;
+        return tex_transposed_${tex_unit} ? tc.yx : tc;
+    }"""))
 
 COLOR_TRANSFORM = Template(textwrap.dedent("""\
     vec4 color_transform_${tex_unit}(vec4 in_, vec4 tint, float rescale_min, float rescale_range, float gamma_scalar)
@@ -33,7 +43,7 @@ COLOR_TRANSFORM = Template(textwrap.dedent("""\
 
 MAIN_SECTION = Template(textwrap.dedent("""\
         // layer_stack[${layer_index}]
-        s = texture2D(tex_${tex_unit}, tex_coord);
+        s = texture2D(tex_${tex_unit}, tex_coord_${tex_unit}(tex_coord));
         s = color_transform_${tex_unit}(${getcolor_expression}, tint_${tex_unit}, rescale_min_${tex_unit}, rescale_range_${tex_unit}, gamma_${tex_unit});
         sca = s.rgb * s.a;
     ${blend_function}
@@ -100,12 +110,14 @@ class LayerStackItem(shader_item.ShaderItem):
     def _attach_layers(self, layers):
         for layer in layers:
             layer.changed.connect(self.update)
+            layer.texture_changed.connect(self.update)
             layer.image_changed.connect(self._on_layer_image_changed)
 
     def _detach_layers(self, layers):
         for layer in layers:
             # no need to keep track of case when layer shows up in the list multiple times: LayerStack prevents that
             layer.changed.disconnect(self.update)
+            layer.texture_changed.disconnect(self.update)
             layer.image_changed.disconnect(self._on_layer_image_changed)
 
     def _base_layer_changed(self, old_base, new_base):
@@ -235,7 +247,11 @@ class LayerStackItem(shader_item.ShaderItem):
         qpainter.beginNativePainting()
         with ExitStack() as estack:
             estack.callback(qpainter.endNativePainting)
-            visible_layer_indices = self._get_visible_layer_indices_and_update_texs()
+            if widget is None:
+                # We are being called as a result of a BaseView.snapshot(..) invocation
+                widget = self.scene().views()[0].gl_widget
+            frame = self._frame(widget)
+            visible_layer_indices = self._get_visible_layer_indices_and_update_texs(frame)
             if not visible_layer_indices:
                 return
             layer_indices = [(tex_unit, layer_index, self.layer_stack.layers[layer_index]) for tex_unit, layer_index in enumerate(visible_layer_indices)]
@@ -263,9 +279,6 @@ class LayerStackItem(shader_item.ShaderItem):
                     main='\n'.join(mains))
             prog.bind()
             estack.callback(prog.release)
-            if widget is None:
-                # We are being called as a result of a BaseView.snapshot(..) invocation
-                widget = self.scene().views()[0].gl_widget
             glQuad = shared_resources.GL_QUAD()
             glQuad.buffer.bind()
             estack.callback(glQuad.buffer.release)
@@ -296,12 +309,6 @@ class LayerStackItem(shader_item.ShaderItem):
             # ratio of the unit square's projection onto the view.  Any subsequent layers in the stack use this same projection,
             # with the result that they are stretched to fill the LayerStackItem.
             frag_to_tex = Qt.QTransform()
-            frame = Qt.QPolygonF(widget.view.mapFromScene(Qt.QPolygonF(self.sceneTransform().mapToPolygon(self.boundingRect().toRect()))))
-            dpi_ratio = widget.devicePixelRatio()
-            if dpi_ratio != 1:
-                dpi_transform = Qt.QTransform()
-                dpi_transform.scale(dpi_ratio, dpi_ratio)
-                frame = dpi_transform.map(frame)
             if not qpainter.transform().quadToSquare(frame, frag_to_tex):
                 raise RuntimeError('Failed to compute gl_FragCoord to texture coordinate transformation matrix.')
             prog.setUniformValue('frag_to_tex', frag_to_tex)
@@ -322,36 +329,114 @@ class LayerStackItem(shader_item.ShaderItem):
                 prog.setUniformValue(f'rescale_range_{tex_unit}', rescale_range)
                 prog.setUniformValue(f'gamma_{tex_unit}', layer.gamma)
                 prog.setUniformValue(f'tint_{tex_unit}', Qt.QVector4D(*layer.tint))
+                prog.setUniformValue(f'tex_transform_{tex_unit}', Qt.QVector4D(1, 1, 0, 0))
+                prog.setUniformValue(f'tex_transposed_{tex_unit}', int(layer.texture.transposed))
             self.set_blend(estack)
             QGL.glEnableClientState(QGL.GL_VERTEX_ARRAY)
-            QGL.glDrawArrays(QGL.GL_TRIANGLE_FAN, 0, 4)
-        if self._new_image:
+            tiled_layers = [(tex_unit, layer) for tex_unit, layer_index, layer in layer_indices
+                            if isinstance(layer.texture, async_texture.TiledTexture)]
+            if tiled_layers:
+                self._draw_tiled(prog, QGL, tiled_layers, frame, frag_to_tex)
+            else:
+                prog.setUniformValue('cell', Qt.QVector4D(-1, -1, 2, 2))
+                QGL.glDrawArrays(QGL.GL_TRIANGLE_FAN, 0, 4)
+            # now that this paint's textures have been marked as recently drawn, free memory from others if over budget
+            async_texture.TextureManager.get().evict()
+        if self._new_image and not any(layer.texture.pending for tex_unit, layer_index, layer in layer_indices):
+            # the new image has been drawn, not the previous one while the new one is uploaded
             self.new_image_painted.emit()
             self._new_image = False
 
+    def _draw_tiled(self, prog, QGL, tiled_layers, frame, frag_to_tex):
+        """Draw the layer stack one cell at a time, where the cells are the rectangles between the tile seams of all
+        of the tiled layers, so that each cell lies within one tile of each tiled layer. Only cells within the
+        viewport are drawn, and so only the tiles of those cells are uploaded."""
+        viewport_width, viewport_height = QGL.glGetFloatv(QGL.GL_VIEWPORT)[2:]
+        corners = [frag_to_tex.map(Qt.QPointF(x, y)) for x, y in
+                   ((0, 0), (viewport_width, 0), (viewport_width, viewport_height), (0, viewport_height))]
+        visible_u = min(c.x() for c in corners), max(c.x() for c in corners)
+        visible_v = min(c.y() for c in corners), max(c.y() for c in corners)
+        frame_width, frame_height = self._frame_size(frame)
+        tiled_layers = [(tex_unit, layer, self._is_minified(layer, frame_width, frame_height)) for tex_unit, layer in tiled_layers]
+        u_seams, v_seams = [numpy.unique(numpy.concatenate(seams)) for seams in
+                            zip(*(layer.texture.boundaries() for tex_unit, layer, minified in tiled_layers))]
+        u_edges = numpy.concatenate([[0], u_seams, [1]])
+        v_edges = numpy.concatenate([[0], v_seams, [1]])
+        for i, (u0, u1) in enumerate(zip(u_edges[:-1], u_edges[1:])):
+            if u1 < visible_u[0] or u0 > visible_u[1]:
+                continue
+            for j, (v0, v1) in enumerate(zip(v_edges[:-1], v_edges[1:])):
+                if v1 < visible_v[0] or v0 > visible_v[1]:
+                    continue
+                for tex_unit, layer, minified in tiled_layers:
+                    tex_transform = layer.texture.bind_tile(tex_unit, (u0 + u1) / 2, (v0 + v1) / 2, minified)
+                    if tex_transform is None:
+                        break # tile not yet uploaded: skip this cell
+                    prog.setUniformValue(f'tex_transform_{tex_unit}', Qt.QVector4D(*map(float, tex_transform)))
+                else:
+                    # the outermost cells extend past the item's edges, which the shader discards anyway
+                    cell = (-1 if i == 0 else u0, -1 if j == 0 else v0,
+                            2 if i == len(u_edges) - 2 else u1, 2 if j == len(v_edges) - 2 else v1)
+                    prog.setUniformValue('cell', Qt.QVector4D(*map(float, cell)))
+                    QGL.glDrawArrays(QGL.GL_TRIANGLE_FAN, 0, 4)
+        for tex_unit, layer, minified in tiled_layers:
+            layer.texture.end_paint()
+
+    @staticmethod
+    def _frame_size(frame):
+        if frame is None:
+            return numpy.inf, numpy.inf
+        return Qt.QLineF(frame[0], frame[1]).length(), Qt.QLineF(frame[1], frame[2]).length()
+
+    @staticmethod
+    def _is_minified(layer, frame_width, frame_height):
+        """Return whether the layer is drawn with fewer device pixels than image pixels."""
+        size = layer.image.size
+        return frame_width < size.width() or frame_height < size.height()
+
+    def _frame(self, widget):
+        """Return the corners of LayerStackItem's bounding rect in device pixel coordinates of the given widget."""
+        frame = Qt.QPolygonF(widget.view.mapFromScene(Qt.QPolygonF(self.sceneTransform().mapToPolygon(self.boundingRect().toRect()))))
+        dpi_ratio = widget.devicePixelRatio()
+        if dpi_ratio != 1:
+            dpi_transform = Qt.QTransform()
+            dpi_transform.scale(dpi_ratio, dpi_ratio)
+            frame = dpi_transform.map(frame)
+        return frame
+
     @staticmethod
     def _normalize_for_gl(v, image):
         """Some things to note:
-        * OpenGL normalizes uint16 data uploaded to float32 texture for the full uint16 range.  We store
-        our unpacked 12-bit images in uint16 arrays.  Therefore, OpenGL will normalize by dividing by
-        65535, even though no 12-bit image will have a component value larger than 4095.
-        * float32 data uploaded to float32 texture is not normalized"""
+        * uint8 and uint16 data are stored in normalized integer textures (GL_R8, GL_R16, etc.), which OpenGL
+        samples as the stored value divided by 255 or 65535: the same normalization it applies to such data
+        uploaded to a float32 texture.  We store our unpacked 12-bit images in uint16 arrays.  Therefore, OpenGL
+        will normalize by dividing by 65535, even though no 12-bit image will have a component value larger than 4095.
+        * int16 data are stored in signed normalized textures (GL_R16_SNORM, etc.), which OpenGL samples as the
+        stored value divided by 32767 (clamped to -1).
+        * float32 data uploaded to float32 texture is not normalized, nor are int32 and float64 data, which are
+        converted to float32 as they are uploaded"""
         if image.data.dtype == numpy.uint16:
             v /= 65535
         elif image.data.dtype == numpy.uint8 or image.data.dtype == bool:
             v /= 255
-        elif image.data.dtype == numpy.float32:
+        elif image.data.dtype == numpy.int16:
+            v /= 32767
+        elif image.data.dtype in (numpy.float32, numpy.int32, numpy.float64):
             pass
         else:
             raise NotImplementedError('OpenGL-compatible normalization for {} missing.'.format(image.data.dtype))
         return v
 
-    def _get_visible_layer_indices_and_update_texs(self):
+    def _get_visible_layer_indices_and_update_texs(self, frame=None):
         """Meant to be executed between a pair of QPainter.beginNativePainting() QPainter.endNativePainting() calls or,
         at the very least, when an OpenGL context is current, _get_visible_layer_indices_and_update_texs does whatever is required,
         for every visible layer with non-None .layer in self.layer_stack, in order that self._texs[layer] represents layer, including texture
         object creation and texture data uploading, and it leaves self._texs[layer] bound to texture unit n, where n is
-        the associated visible_layer_index."""
+        the associated visible_layer_index. If frame (as returned by _frame()) is given, textures of layers drawn with fewer
+        device pixels than image pixels are bound for minification (i.e. with mipmaps). Tiled textures are not bound here,
+        but by _draw_tiled. If a texture cannot be bound without waiting for an upload (e.g. of a layer's first image, or of
+        an evicted texture), its layer is left out of those returned, so that the other layers are drawn without it until
+        the upload completes (and the layer's texture_changed signal causes a repaint), rather than waiting for it."""
         layer_stack = self.layer_stack
         if layer_stack.examine_layer_mode:
             layer_index = layer_stack.focused_layer_idx
@@ -360,10 +445,16 @@ class LayerStackItem(shader_item.ShaderItem):
             visible_layer_indices = [layer_index for layer_index, layer in enumerate(layer_stack.layers) if layer.visible and layer.image is not None]
         else:
             visible_layer_indices = []
+        frame_width, frame_height = self._frame_size(frame)
+        drawn_layer_indices = []
         bound = set()
-        for tex_unit, layer_index in enumerate(visible_layer_indices):
-            texture = layer_stack.layers[layer_index].texture
-            if texture not in bound:
-                texture.bind(tex_unit)
+        for layer_index in visible_layer_indices:
+            layer = layer_stack.layers[layer_index]
+            texture = layer.texture
+            # tiled textures are bound tile by tile as drawn: see _draw_tiled
+            if not isinstance(texture, async_texture.TiledTexture) and texture not in bound:
+                if not texture.bind(len(drawn_layer_indices), self._is_minified(layer, frame_width, frame_height)):
+                    continue
                 bound.add(texture)
-        return visible_layer_indices
\ No newline at end of file
+            drawn_layer_indices.append(layer_index)
+        return drawn_layer_indices
\ No newline at end of file
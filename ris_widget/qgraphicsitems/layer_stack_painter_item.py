@@ -94,10 +94,13 @@ class LayerStackPainterItem(Qt.QGraphicsObject):
             br.setBottom(br.bottom() - (r.bottom() - target_height + 1))
             r.setBottom(target_height - 1)
         x1, x2, y1, y2 = r.left(), r.right(), r.top(), r.bottom()
-        brush.apply(self.target_image.data[x1:x2+1, y1:y2+1], br)
-        w = x2 - x1
-        h = y2 - y1
-        self.target_image.refresh((x1, y1, w, h))
+        target_subimage = self.target_image.data[x1:x2+1, y1:y2+1]
+        # the previous contents of the painted region let layers update their histograms incrementally
+        previous_subimage = target_subimage.copy()
+        brush.apply(target_subimage, br)
+        w = x2 - x1 + 1
+        h = y2 - y1 + 1
+        self.target_image.refresh((x1, y1, w, h), previous_subimage)
         return True
 
     def _on_layer_stack_item_bounding_rect_changed(self):
@@ -0,0 +1,22 @@
+#version 120
+#line 3
+// This code is licensed under the MIT License (see LICENSE file for details)
+
+// tex holds the red, green, and blue channel histograms in rows 0, 1, and 2
+uniform sampler2D tex;
+uniform vec2 inv_view_size;
+uniform float inv_max_transformed_bin_val;
+uniform float gamma_gamma;
+uniform float opacity;
+
+void main()
+{
+    float x = gl_FragCoord.x * inv_view_size.x;
+    vec3 bin_values = vec3(texture2D(tex, vec2(x, 1.0f / 6.0f)).r,
+                           texture2D(tex, vec2(x, 3.0f / 6.0f)).r,
+                           texture2D(tex, vec2(x, 5.0f / 6.0f)).r) * 4294967295.0f;
+    vec3 bin_heights = pow(bin_values, vec3(gamma_gamma)) * inv_max_transformed_bin_val;
+    vec3 intensity = 1.0f - clamp(floor((gl_FragCoord.y * inv_view_size.y) / bin_heights), 0, 1);
+
+    gl_FragColor = vec4(intensity, max(intensity.r, max(intensity.g, intensity.b)) * opacity);
+}
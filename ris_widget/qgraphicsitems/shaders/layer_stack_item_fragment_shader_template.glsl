@@ -5,6 +5,10 @@
 uniform float layer_stack_item_opacity;
 uniform float viewport_height;
 uniform mat3 frag_to_tex;
+// Only fragments within the cell (x0, y0, x1, y1), in the half-open texture coordinate ranges [x0, x1) and
+// [y0, y1), are drawn. Tiled layers are drawn one cell at a time, where each cell lies within one tile of
+// each tiled layer.
+uniform vec4 cell;
 $uniforms
 
 vec2 transform_frag_to_tex()
@@ -27,6 +31,7 @@ void main()
     float isa, ida, osa, oda, sada;
 
     if(tex_coord.x < 0.0f || tex_coord.x > 1.0f || tex_coord.y < 0.0f || tex_coord.y > 1.0f) discard;
+    if(tex_coord.x < cell.x || tex_coord.x >= cell.z || tex_coord.y < cell.y || tex_coord.y >= cell.w) discard;
 
 $main
     gl_FragColor = vec4(dca / da, da * layer_stack_item_opacity);
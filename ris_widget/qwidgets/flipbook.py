@@ -6,11 +6,16 @@ import pathlib
 import glob
 from PyQt5 import Qt
 import os.path
+import concurrent.futures as futures
+import traceback
+import weakref
 
 from ..object_model import uniform_signaling_list
 from ..object_model import drag_drop_model_behavior
 from ..object_model import property_table_model
 from .. import image
+from .. import image_io
+from .. import async_texture
 from . import progress_thread_pool
 
 try:
@@ -18,6 +23,65 @@ try:
 except ModuleNotFoundError:
     freeimage = None
 
+LAZY_READ_THREADS = 4 # number of threads reading the images of lazily-added pages (see Flipbook.add_image_files)
+
+_LAZY_READ_EXECUTOR = None
+def _lazy_read_executor():
+    global _LAZY_READ_EXECUTOR
+    if _LAZY_READ_EXECUTOR is None:
+        _LAZY_READ_EXECUTOR = futures.ThreadPoolExecutor(max_workers=LAZY_READ_THREADS)
+    return _LAZY_READ_EXECUTOR
+
+class LazyImage(image.Image):
+    """An Image of an image file, whose pixels are read only when they are needed. A Flipbook reads the
+    images of a page of LazyImages (see Flipbook.add_image_files) when the page is focused or its textures
+    are prefetched, and unloads them again when the page is no longer near the current page.
+
+    Until the file is read (and after it is unloaded), .data is None, and .type, .size, etc. are those of
+    the last read (None if it has not yet been read). .generation is incremented when the file is read
+    again after the data were modified (see Image.refresh()), as the modifications are lost.
+    """
+    def __init__(self, path, name=None, raw_format=None, parent=None):
+        # Image.__init__ requires the data
+        self._init_without_data(str(path) if name is None else name, parent)
+        self.path = pathlib.Path(path)
+        self.raw_format = raw_format
+        self._read_generation = None
+        self._read_future = None
+
+    def __repr__(self):
+        if self._data is None:
+            return '{}; {} (not read)>'.format(Qt.QObject.__repr__(self)[:-1], self.path)
+        return super().__repr__()
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def read(self):
+        """Read the image file, and return (data, image_bits). Called from a reader thread."""
+        if image_io.is_mapped(self.path):
+            return image_io.read_mapped(self.path, self.raw_format)
+        return freeimage.read(str(self.path)), None
+
+    def _set_read_data(self, data, image_bits):
+        if self._read_generation is not None and self._read_generation != self.generation:
+            self.generation += 1
+        self._set_data(data, image_bits)
+        self._read_generation = self.generation
+
+    def unload(self):
+        """Release the image data (closing the file, if it was mapped into memory)."""
+        self._data = None
+
+class _LazyImageReadEvent(Qt.QEvent):
+    TYPE = Qt.QEvent.registerEventType()
+    def __init__(self, image, result, error=False):
+        super().__init__(self.TYPE)
+        self.image = image
+        self.result = result
+        self.error = error
+
 class ImageList(uniform_signaling_list.UniformSignalingList):
     changed = Qt.pyqtSignal(object)
 
@@ -72,7 +136,7 @@ class _ReadPageTaskDoneEvent(Qt.QEvent):
         self.error = error
 
 class _ReadPageTaskPage:
-    __slots__ = ["page", "im_fpaths", "im_names", "ims"]
+    __slots__ = ["page", "im_fpaths", "im_names", "ims", "im_bits", "raw_format"]
 
 _FLIPBOOK_PAGES_DOCSTRING = ("""
     The list of pages represented by a Flipbook instance's list view is available via a that
@@ -162,6 +226,18 @@ class Flipbook(Qt.QWidget):
         self.playback_timer.timeout.connect(self.advance_frame)
         self.playback_fps = 30
 
+        # The textures and histograms of the images on up to prefetch_pages pages on either side of the current
+        # page (or, during playback, up to twice as many pages ahead of it) are prepared in the background,
+        # using no more than prefetch_memory_limit bytes of texture memory. Set prefetch_pages to 0 to disable.
+        self.prefetch_pages = 2
+        self.prefetch_memory_limit = 2**29
+        self._prefetch_page_idx = None
+        self._prefetch_step = 1
+        # LazyImages that are being read, that have been read, and that are on or near the current page
+        self._reading_lazy_images = weakref.WeakSet()
+        self._loaded_lazy_images = weakref.WeakSet()
+        self._wanted_lazy_images = weakref.WeakSet()
+
         self._on_page_selection_changed()
         self.apply()
 
@@ -169,10 +245,13 @@ class Flipbook(Qt.QWidget):
         """Replace the image fields of the layers in .layer_stack with the images contained in the currently
         focused flipbook page, creating new layers as required, or clearing the image field of any excess
         layers. This method is called automatically when focus moves to a different page and when
-        the contents of the current page change."""
+        the contents of the current page change. If the page has LazyImages that have not been read, the
+        layers are updated once they have been."""
         current_page_idx = self.current_page_idx
         if current_page_idx is None:
             self._detach_page()
+            async_texture.TexturePrefetcher.get().retain(())
+            self._release_lazy_images(())
             return
         pages = self.pages
         current_page = pages[current_page_idx]
@@ -182,8 +261,115 @@ class Flipbook(Qt.QWidget):
             current_page.removed.connect(self.apply)
             current_page.replaced.connect(self.apply)
             self._attached_page = current_page
-        self.layer_stack.layers = current_page # setter magic takes care of rest
-        self.current_page_changed.emit(self)
+        if self._read_lazy_page(current_page):
+            self.layer_stack.layers = current_page # setter magic takes care of rest
+            self.current_page_changed.emit(self)
+        self._prefetch(current_page_idx)
+
+    def _prefetch(self, current_page_idx):
+        """Start uploading the textures and calculating the histograms of the images on the pages around the
+        current one (see prefetch_pages and prefetch_memory_limit), nearest first, favoring the direction in
+        which pages were last flipped. The LazyImages of these pages are read, and those of other pages unloaded."""
+        prefetcher = async_texture.TexturePrefetcher.get()
+        previous_idx = self._prefetch_page_idx
+        self._prefetch_page_idx = current_page_idx
+        if previous_idx is not None and previous_idx != current_page_idx:
+            self._prefetch_step = 1 if current_page_idx > previous_idx else -1
+        page_count = len(self.pages)
+        if self.playback_timer.isActive():
+            # playback advances one page at a time, wrapping around at the end
+            idxs = [(current_page_idx + offset) % page_count for offset in range(1, 2*self.prefetch_pages + 1)]
+        else:
+            idxs = []
+            for offset in range(1, self.prefetch_pages + 1):
+                idxs.append(current_page_idx + offset * self._prefetch_step)
+                idxs.append(current_page_idx - offset * self._prefetch_step)
+            idxs = [idx for idx in idxs if 0 <= idx < page_count]
+        bytes_left = self.prefetch_memory_limit
+        images = []
+        lazy_images = [image for image in self.pages[current_page_idx] if isinstance(image, LazyImage)]
+        for idx in idxs:
+            if idx == current_page_idx:
+                continue
+            lazy_images.extend(image for image in self.pages[idx] if isinstance(image, LazyImage))
+            if not self._read_lazy_page(self.pages[idx]):
+                # its images are prefetched once they have been read
+                continue
+            page_images = [(i, image) for i, image in enumerate(self.pages[idx]) if image is not None]
+            page_bytes = sum(async_texture.texture_bytes(async_texture.texture_format(image), *image.data.shape[:2])
+                for i, image in page_images)
+            if page_bytes > bytes_left:
+                break
+            bytes_left -= page_bytes
+            images.extend(page_images)
+        # release the textures of images that have left the prefetch window
+        prefetcher.retain([image for i, image in images])
+        layers = self.layer_stack.layers
+        for i, image in images:
+            prefetcher.prefetch(image)
+            if i < len(layers):
+                layers[i].prefetch_histogram(image)
+        self._release_lazy_images(lazy_images)
+
+    def _read_lazy_page(self, page):
+        """Start reading the LazyImages of page that have not been read, and return whether all have been."""
+        all_read = True
+        for image in page:
+            if isinstance(image, LazyImage) and not image.loaded:
+                all_read = False
+                if image._read_future is None:
+                    image._read_future = _lazy_read_executor().submit(self._read_lazy_image_task, image)
+                    self._reading_lazy_images.add(image)
+        return all_read
+
+    def _read_lazy_image_task(self, image):
+        try:
+            event = _LazyImageReadEvent(image, image.read())
+        except Exception:
+            traceback.print_exc()
+            event = _LazyImageReadEvent(image, None, error=True)
+        Qt.QApplication.instance().postEvent(self, event)
+
+    def _on_lazy_image_read(self, image, result, error):
+        image._read_future = None
+        self._reading_lazy_images.discard(image)
+        if not error:
+            if image not in self._wanted_lazy_images:
+                # its page is no longer on or near the current page
+                return
+            try:
+                image._set_read_data(*result)
+            except Exception:
+                traceback.print_exc()
+                error = True
+        if error:
+            # as when reading the images of a page that is not lazy fails, the page is marked and left without them
+            for page in self.pages:
+                if any(page_image is image for page_image in page):
+                    if not page.name.endswith(' (ERROR)'):
+                        page.name += ' (ERROR)'
+                    page.remove(image)
+            return
+        self._loaded_lazy_images.add(image)
+        current_page = self.current_page
+        if current_page is not None and any(page_image is image for page_image in current_page):
+            self.apply()
+        elif self.current_page_idx is not None:
+            self._prefetch(self.current_page_idx)
+
+    def _release_lazy_images(self, wanted_images):
+        """Unload the LazyImages that have been read other than wanted_images (and those shown by the layers),
+        and stop reading those that are being read, if they have not been started."""
+        self._wanted_lazy_images = weakref.WeakSet(wanted_images)
+        shown_images = [layer.image for layer in self.layer_stack.layers]
+        for image in list(self._loaded_lazy_images):
+            if image not in self._wanted_lazy_images and not any(image is shown for shown in shown_images):
+                image.unload()
+                self._loaded_lazy_images.discard(image)
+        for image in list(self._reading_lazy_images):
+            if image not in self._wanted_lazy_images and image._read_future.cancel():
+                image._read_future = None
+                self._reading_lazy_images.discard(image)
 
     def _detach_page(self):
         if self._attached_page is not None:
@@ -204,7 +390,8 @@ class Flipbook(Qt.QWidget):
         else:
             return list(path)
 
-    def add_image_files(self, image_paths, page_names=None, image_names=None, insertion_point=None):
+    def add_image_files(self, image_paths, page_names=None, image_names=None, insertion_point=None, raw_format=None,
+            lazy=False):
         """Add image files (or stacks of image files) to the flipbook.
 
         Parameters:
@@ -223,18 +410,31 @@ class Flipbook(Qt.QWidget):
             insertion_point: numerical index before which to insert the images
                 in the flipbook (negative values permitted). If not specified,
                 images will be inserted after the last entry.
-
-        Returns list of futures objects corresponding to the page-IO tasks.
-        To wait until read is done, call concurrent.futures.wait() on this list.
+            raw_format: for headerless raw files (.raw) without a sidecar file
+                describing their format (see image_io.read_raw_format), a dict
+                of the shape, dtype, and optionally image_bits and offset of the
+                images (see image_io.read_raw).
+            lazy: if True, the pages are added at once, with a LazyImage for
+                each file, which is read only when its page is focused or is
+                near the focused page (see prefetch_pages), and is unloaded
+                again when it no longer is.
+
+        .npy and raw files are mapped into memory rather than read, so that
+        their pages are added at once, and their pixels are read by the OS as
+        they are displayed. Other image files are read with freeimage.
+
+        Returns list of futures objects corresponding to the page-IO tasks
+        (empty if lazy is True). To wait until read is done, call
+        concurrent.futures.wait() on this list.
         """
-        if freeimage is None:
-            raise RuntimeError('Could not import freeimage module for image IO')
         paths = []
         for page_paths in self._expand_to_path_list(image_paths):
             paths.append(list(map(pathlib.Path, self._expand_to_path_list(page_paths))))
 
         if len(paths) == 0:
             return []
+        if freeimage is None and not self._all_mapped(paths):
+            raise RuntimeError('Could not import freeimage module for image IO')
 
         if page_names is None:
             abspaths = []
@@ -251,6 +451,19 @@ class Flipbook(Qt.QWidget):
         if image_names is None:
             image_names = [[str(p) for p in subpaths] for subpaths in paths]
 
+        if insertion_point is None:
+            insertion_point = len(self.pages)
+        if lazy:
+            pages = []
+            for file_paths, page_name, page_image_names in zip(paths, page_names, image_names):
+                assert len(page_image_names) == len(file_paths)
+                page = ImageList(LazyImage(path, name, raw_format) for path, name in zip(file_paths, page_image_names))
+                page.name = page_name
+                pages.append(page)
+            self.pages[insertion_point:insertion_point] = pages
+            self.ensure_page_focused()
+            return []
+
         task_pages = []
         for file_paths, page_name, page_image_names in zip(paths, page_names, image_names):
             task_page = _ReadPageTaskPage()
@@ -258,16 +471,18 @@ class Flipbook(Qt.QWidget):
             task_page.page.name = page_name
             task_page.im_names = page_image_names
             task_page.im_fpaths = file_paths
+            task_page.raw_format = raw_format
             assert len(task_page.im_names) == len(task_page.im_fpaths)
             task_pages.append(task_page)
-
-        if insertion_point is None:
-            insertion_point = len(self.pages)
         return self.queue_page_creation_tasks(insertion_point, task_pages)
 
 
+    @staticmethod
+    def _all_mapped(paths):
+        return all(image_io.is_mapped(path) for page_paths in paths for path in page_paths)
+
     def _handle_dropped_files(self, fpaths, dst_row, dst_column, dst_parent):
-        if freeimage is None:
+        if freeimage is None and not self._all_mapped([fpaths]):
             return False
         if dst_row in (-1, None):
             dst_row = len(self.pages)
@@ -281,18 +496,29 @@ class Flipbook(Qt.QWidget):
             if e.error:
                 e.task_page.page.name += ' (ERROR)'
             else:
-                for im, im_name in zip(e.task_page.ims, e.task_page.im_names):
-                    e.task_page.page.append(image.Image(im, name=im_name))
+                for im, im_bits, im_name in zip(e.task_page.ims, e.task_page.im_bits, e.task_page.im_names):
+                    e.task_page.page.append(image.Image(im, im_bits, name=im_name))
             # break reference cycle (see below)
             # Note: no race condition here beause event will happen in the same
             # thread as queue_page_creation_tasks, which is what sets the on_removal
             # attribute.
             del e.task_page.page.on_removal
             return True
+        if e.type() == _LazyImageReadEvent.TYPE:
+            self._on_lazy_image_read(e.image, e.result, e.error)
+            return True
         return super().event(e)
 
     def _read_page_task(self, task_page):
-        task_page.ims = [freeimage.read(str(image_fpath)) for image_fpath in task_page.im_fpaths]
+        task_page.ims = []
+        task_page.im_bits = []
+        for image_fpath in task_page.im_fpaths:
+            if image_io.is_mapped(image_fpath):
+                im, im_bits = image_io.read_mapped(image_fpath, task_page.raw_format)
+            else:
+                im, im_bits = freeimage.read(str(image_fpath)), None
+            task_page.ims.append(im)
+            task_page.im_bits.append(im_bits)
         Qt.QApplication.instance().postEvent(self, _ReadPageTaskDoneEvent(task_page))
 
     def _on_task_error(self, task_page):
@@ -78,7 +78,10 @@ class ImageValEdit(LabelEdit):
         numpy.bool8: bool,
         numpy.uint8: int,
         numpy.uint16: int,
-        numpy.float32: float}
+        numpy.int16: int,
+        numpy.int32: int,
+        numpy.float32: float,
+        numpy.float64: float}
 
     def connect_image(self, image, max_default=True):
         if image is None:
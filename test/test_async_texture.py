@@ -0,0 +1,178 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+import collections
+import unittest
+from unittest import mock
+import numpy
+
+from ris_widget import async_texture
+
+# the parts of an Image that AsyncTexture.upload() uses
+FakeImage = collections.namedtuple('FakeImage', ('type', 'data', 'axis_order'))
+
+def make_image(shape=(64, 48)):
+    return FakeImage('G', numpy.zeros(shape, numpy.uint16), 'xy')
+
+class UploadQueueTestCase(unittest.TestCase):
+    """Uploads are queued in an UploadQueue with no upload threads, from which the test takes them as an
+    upload thread would, so that no OpenGL context is required."""
+    def setUp(self):
+        self.use_bg_upload_thread = async_texture.USE_BG_UPLOAD_THREAD
+        async_texture.USE_BG_UPLOAD_THREAD = True
+        self.queue = async_texture.UploadQueue._INSTANCE = async_texture.UploadQueue(thread_count=0)
+        self.manager = async_texture.TextureManager._INSTANCE = async_texture.TextureManager()
+
+    def tearDown(self):
+        async_texture.USE_BG_UPLOAD_THREAD = self.use_bg_upload_thread
+        async_texture.UploadQueue._INSTANCE = None
+        async_texture.TextureManager._INSTANCE = None
+
+    def start_upload(self):
+        """Take the next upload from the queue, as an upload thread would, and return its texture."""
+        texture, upload_args = self.queue._next_upload()
+        return texture
+
+    def finish_upload(self, texture, gl_texture=None):
+        """Complete an upload taken by start_upload(), without uploading anything (so, by default, without
+        a GL texture to delete when the texture is destroyed)."""
+        with texture._upload_lock:
+            texture.texture = gl_texture
+            texture.status = 'uploaded'
+            texture.ready.set()
+        if texture.ready_callback is not None:
+            texture.ready_callback(texture)
+        self.queue._upload_done(texture)
+
+
+class DiscardTest(UploadQueueTestCase):
+    def test_queued_upload_cancelled(self):
+        # a discarded texture (e.g. of a page that left the prefetch window) must not be uploaded
+        texture = async_texture.AsyncTexture()
+        texture.upload(make_image())
+        self.assertIn(texture, self.queue.pending_uploads)
+        self.manager.discard(texture)
+        self.manager.evict()
+        self.assertNotIn(texture, self.queue.pending_uploads)
+        self.assertEqual(texture.status, 'waiting')
+        self.assertEqual(self.manager._discarded, [])
+
+    def test_active_upload_deferred(self):
+        texture = async_texture.AsyncTexture()
+        texture.upload(make_image())
+        self.assertIs(self.start_upload(), texture)
+        self.manager.discard(texture)
+        self.manager.evict()
+        self.assertEqual(self.manager._discarded, [texture])
+        self.finish_upload(texture)
+        self.manager.evict()
+        self.assertEqual(self.manager._discarded, [])
+
+class EvictionTest(UploadQueueTestCase):
+    def uploaded_texture(self):
+        texture = async_texture.AsyncTexture()
+        texture.upload(make_image())
+        self.finish_upload(self.start_upload())
+        self.manager.update(texture)
+        return texture
+
+    def test_pinned_not_evicted(self):
+        # e.g. the texture of a visible layer shown in a view that has not been repainted recently
+        pinned, unpinned = self.uploaded_texture(), self.uploaded_texture()
+        pinned.pinned = True
+        self.manager.budget = 0
+        self.manager.min_idle = 0
+        self.manager.evict()
+        self.assertEqual(pinned.status, 'uploaded')
+        self.assertEqual(unpinned.status, 'evicted')
+        self.assertEqual(self.manager.evictions, 1)
+
+    def test_recently_drawn_not_evicted(self):
+        texture = self.uploaded_texture()
+        self.manager.budget = 0
+        self.manager.evict()
+        self.assertEqual(texture.status, 'uploaded')
+
+    def test_double_buffered_pinning(self):
+        # only the front texture, which holds the image drawn, is pinned
+        texture = async_texture.DoubleBufferedTexture()
+        texture.pinned = True
+        self.assertTrue(texture.front.pinned)
+        self.assertFalse(texture.back.pinned)
+
+class DoubleBufferedBindTest(UploadQueueTestCase):
+    # bind() must not wait for uploads (and so needs no OpenGL context when it returns False)
+    def setUp(self):
+        super().setUp()
+        self.ready_calls = 0
+        self.texture = async_texture.DoubleBufferedTexture(self.on_ready)
+
+    def on_ready(self):
+        self.ready_calls += 1
+
+    def test_first_image(self):
+        self.texture.upload(make_image())
+        self.assertFalse(self.texture.bind(0))
+        self.finish_upload(self.start_upload(), gl_texture=1)
+        self.assertEqual(self.ready_calls, 1)
+        self.assertTrue(self.texture.front.ready_to_bind())
+
+    def test_partial_upload(self):
+        self.texture.upload(make_image())
+        self.finish_upload(self.start_upload(), gl_texture=1)
+        with mock.patch.object(async_texture.AsyncTexture, 'bind'): # (which requires an OpenGL context)
+            self.assertTrue(self.texture.bind(0))
+        self.assertIsNone(self.texture.pending)
+        # the partial update is applied to the front texture, which is not drawn until it completes
+        self.texture.upload(make_image(), (0, 0, 8, 8))
+        self.assertFalse(self.texture.bind(0))
+        self.finish_upload(self.start_upload(), gl_texture=1)
+        self.assertEqual(self.ready_calls, 2)
+        self.assertTrue(self.texture.front.ready_to_bind())
+
+class TexturePoolTest(unittest.TestCase):
+    # OpenGL calls are mocked: the pool only hands out the texture names given to it
+    FORMAT = async_texture.GL.GL_R16
+
+    def setUp(self):
+        self.texel_bytes = async_texture.GL_TEXTURE_FORMAT_TEXEL_BYTES[self.FORMAT]
+        for patcher in (mock.patch.object(async_texture, 'GL'),
+                mock.patch.object(async_texture.Qt.QOpenGLContext, 'currentContext')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        async_texture.Qt.QOpenGLContext.currentContext().format().version.return_value = (4, 1)
+        self.pool = async_texture.TexturePool(budget=2 * 64 * 48 * self.texel_bytes)
+
+    def test_lease(self):
+        self.assertIsNone(self.pool.hit_rate)
+        self.assertIsNone(self.pool.lease(self.FORMAT, 64, 48))
+        self.pool.release(1, self.FORMAT, 64, 48)
+        self.pool.release(2, self.FORMAT, 64, 48)
+        self.assertEqual(self.pool.bytes, 2 * 64 * 48 * self.texel_bytes)
+        self.assertIsNone(self.pool.lease(self.FORMAT, 48, 64))
+        # the most recently released texture is leased first, once the releasing context's fence is waited on
+        self.assertEqual(self.pool.lease(self.FORMAT, 64, 48), 2)
+        async_texture.GL.glWaitSync.assert_called_once()
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.pool.bytes, 64 * 48 * self.texel_bytes)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 2))
+        self.assertAlmostEqual(self.pool.hit_rate, 1/3)
+
+    def test_budget(self):
+        for texture in (1, 2, 3):
+            self.pool.release(texture, self.FORMAT, 64, 48)
+        async_texture.GL.glDeleteTextures.assert_called_once_with([1])
+        self.assertEqual(len(self.pool), 2)
+        self.assertLessEqual(self.pool.bytes, self.pool.budget)
+        # a texture larger than the budget is deleted rather than pooled
+        self.pool.release(4, self.FORMAT, 640, 480)
+        async_texture.GL.glDeleteTextures.assert_called_with([4])
+        self.assertEqual(len(self.pool), 2)
+
+    def test_texture_bytes(self):
+        self.assertEqual(async_texture.texture_bytes(self.FORMAT, 64, 48), 64 * 48 * self.texel_bytes)
+        # mipmap levels 64x48, 32x24, 16x12, 8x6, 4x3, 2x1, 1x1 (each dimension halved, but at least 1)
+        mipmap_texels = sum(w * h for w, h in ((64, 48), (32, 24), (16, 12), (8, 6), (4, 3), (2, 1), (1, 1)))
+        self.assertEqual(async_texture.texture_bytes(self.FORMAT, 64, 48, mipmaps=True), mipmap_texels * self.texel_bytes)
+
+if __name__ == '__main__':
+    unittest.main()
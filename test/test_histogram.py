@@ -0,0 +1,427 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+import builtins
+import importlib
+import unittest
+from unittest import mock
+import numpy
+
+from ris_widget import histogram
+
+# (the histogram function shadows the module of the same name in the package)
+histogram_module = importlib.import_module('ris_widget.histogram.histogram')
+
+def masked_values(image, mask_geometry):
+    """Return the values of a 2-d image, or the pixels of an (x, y, c) image, within the given vignette mask."""
+    if mask_geometry is not None:
+        i, transposed = histogram_module._fast_index_first(image)
+        cx, cy, r = (numpy.array(mask_geometry) * [image.shape[0], image.shape[1], image.shape[0]]).astype(int)
+        if transposed:
+            cx, cy = cy, cx
+        ymin, ymax, starts, ends = histogram_module._circle_mask(cx, cy, r, i.shape[:2], numpy.uint16)
+        if ymin is not None:
+            mask = numpy.zeros(i.shape[:2], bool)
+            for y, start, end in zip(range(ymin, ymax), starts, ends):
+                mask[start:end, y] = True
+            return i[mask]
+    return image.reshape(-1, *image.shape[2:])
+
+def reference_histogram(values, range=(None, None), image_bits=None):
+    """Return the min, max, and histogram of an array of values, as histogram() calculates them."""
+    values = values.ravel()
+    was_bool = values.dtype == bool
+    if was_bool:
+        values = values.view(numpy.uint8)
+    elif values.dtype.type in histogram.FLOAT_DTYPES:
+        values = values.astype(numpy.float32)
+    image_min, image_max = values.min(), values.max()
+    r_min, r_max = range
+    if values.dtype == numpy.float32:
+        r_min = image_min if r_min is None else numpy.float32(r_min)
+        r_max = image_max if r_max is None else numpy.float32(r_max)
+        bin_factor = numpy.float32(1024) / (r_max - r_min)
+        in_range = values[(values >= r_min) & (values < r_max)]
+        hist = numpy.bincount((bin_factor * (in_range - r_min)).astype(numpy.uint16), minlength=1024)
+        hist[-1] += (values == r_max).sum()
+    elif values.dtype == numpy.uint8:
+        r_min, r_max = histogram_module._default_int_range(values.dtype, range, image_bits)
+        in_range = values[(values >= r_min) & (values <= r_max)]
+        hist = numpy.bincount(in_range - r_min, minlength=256)
+    else:
+        # int16 values are offset into the range of uint16 values
+        offset = 2**15 if values.dtype == numpy.int16 else 0
+        offset_values = values.astype(numpy.int64) + offset
+        if range == (None, None):
+            bins = offset_values >> ((16 if image_bits is None else image_bits) - 10)
+            hist = numpy.bincount(bins[bins < 1024], minlength=1024)
+        else:
+            r_min, r_max = numpy.array(histogram_module._default_int_range(values.dtype, range, image_bits)) + offset
+            bin_factor = numpy.float32(1024) / numpy.float32(r_max - r_min)
+            in_range = offset_values[(offset_values >= r_min) & (offset_values < r_max)]
+            hist = numpy.bincount((bin_factor * (in_range - r_min).astype(numpy.float32)).astype(numpy.int64), minlength=1024)
+            hist[-1] += (offset_values == r_max).sum()
+    if was_bool:
+        hist = hist[:2]
+    return image_min, image_max, hist
+
+def layouts(image):
+    """Yield views of image with each memory layout that the kernels handle differently."""
+    yield image # C-contiguous: histogrammed transposed
+    yield numpy.asfortranarray(image) # pixels contiguous along x
+    yield image[::2, 1:] # neither rows nor columns contiguous
+
+MASKS = (None, (0.5, 0.5, 0.3), (0.1, 0.8, 0.6))
+
+def luma(image):
+    r, g, b = numpy.rollaxis(image, -1)[:3]
+    return (0.2126*r + 0.7152*g + 0.0722*b).astype(image.dtype)
+
+def shifted_hist(values, image_bits):
+    """The unranged histogram of uint16 values, as calculated by the kernels: values beyond image_bits are discarded."""
+    return numpy.bincount((values.ravel() >> (image_bits - 10)), minlength=2**(16 - (image_bits - 10)))[:1024]
+
+class OverRangeTest(unittest.TestCase):
+    # values of at least 2**image_bits must be discarded, not counted past the end of the histogram
+    def test_rgb(self):
+        for value in (4096, 65535):
+            image = numpy.full((300, 200, 3), value, numpy.uint16)
+            image_min, image_max, hist = histogram.histogram(image, image_bits=12)
+            self.assertEqual((image_min, image_max), (value, value))
+            self.assertEqual(hist.shape, (1024,))
+            self.assertEqual(hist.sum(), 0)
+
+    def test_rgb_channels(self):
+        rng = numpy.random.default_rng(0)
+        for n_channels in (2, 3, 4):
+            image = rng.integers(0, 65536, (300, 200, n_channels), dtype=numpy.uint16)
+            luma_wanted = n_channels > 2
+            mins, maxs, hists = histogram.channel_histograms(image, image_bits=12, luma=luma_wanted)
+            self.assertEqual(hists.shape, (n_channels + luma_wanted, 1024))
+            for c in range(n_channels):
+                self.assertTrue((hists[c] == shifted_hist(image[..., c], 12)).all())
+                self.assertEqual((mins[c], maxs[c]), (image[..., c].min(), image[..., c].max()))
+            if luma_wanted:
+                self.assertTrue((hists[-1] == shifted_hist(luma(image), 12)).all())
+
+class MinMaxTest(unittest.TestCase):
+    # min_max() must find the same min and max as histogram(), without histogramming greyscale images
+    def test_dtypes(self):
+        rng = numpy.random.default_rng(0)
+        for dtype in (bool, numpy.uint8, numpy.uint16, numpy.int16, numpy.int32, numpy.float32, numpy.float64):
+            for shape in ((300, 200), (300, 200, 2), (300, 200, 3), (300, 200, 4)):
+                if dtype is bool:
+                    image = rng.integers(0, 2, shape).astype(bool)
+                elif numpy.dtype(dtype).kind == 'f':
+                    image = rng.normal(0, 1000, shape).astype(dtype)
+                else:
+                    info = numpy.iinfo(dtype)
+                    image = rng.integers(max(info.min, -2**20), min(info.max, 2**20), shape, dtype=dtype, endpoint=True)
+                for view in (image, image.swapaxes(0, 1), image[::3]):
+                    for mask_geometry in (None, (0.5, 0.5, 0.4)):
+                        with self.subTest(dtype=dtype, shape=view.shape, mask_geometry=mask_geometry):
+                            self.assertEqual(histogram.min_max(view, mask_geometry),
+                                histogram.histogram(view, mask_geometry=mask_geometry)[:2])
+
+    def test_int16(self):
+        image = numpy.array([[-32768, 5], [-3, 32767]], numpy.int16)
+        self.assertEqual(histogram.min_max(image), (-32768, 32767))
+        self.assertEqual(histogram.min_max(image[:, 1:]), (5, 32767))
+        self.assertEqual(histogram.min_max(image[1:]), (-3, 32767))
+
+class KernelTestCase(unittest.TestCase):
+    def check(self, image, range=(None, None), image_bits=None):
+        """Check that the histogram (and min and max) of image match numpy's, for any memory layout and mask."""
+        for view in layouts(image):
+            for mask_geometry in MASKS:
+                with self.subTest(dtype=image.dtype, range=range, image_bits=image_bits, strides=view.strides,
+                        mask_geometry=mask_geometry):
+                    image_min, image_max, hist = histogram.histogram(view, range, image_bits, mask_geometry)
+                    wanted_min, wanted_max, wanted_hist = reference_histogram(masked_values(view, mask_geometry), range, image_bits)
+                    self.assertEqual((image_min, image_max), (wanted_min, wanted_max))
+                    self.assertTrue((hist == wanted_hist).all())
+
+class IntegerKernelTest(KernelTestCase):
+    # (odd image widths leave rows whose lengths are not a multiple of the number of sub-histograms)
+    def test_uint8(self):
+        image = numpy.random.default_rng(0).integers(0, 256, (301, 203), dtype=numpy.uint8)
+        for range in ((None, None), (10, 200), (None, 100)):
+            self.check(image, range)
+
+    def test_bool(self):
+        self.check(numpy.random.default_rng(0).integers(0, 2, (301, 203)).astype(bool))
+
+    def test_uint16(self):
+        rng = numpy.random.default_rng(0)
+        image = rng.integers(0, 65536, (301, 203), dtype=numpy.uint16)
+        for range in ((None, None), (100, 30000), (None, 3000)):
+            self.check(image, range)
+        # values beyond image_bits are not counted
+        for range in ((None, None), (100, 3000)):
+            self.check(image >> 3, range, image_bits=12)
+
+    def test_uint16_dark(self):
+        # mostly-repeated values, as in a dark background
+        image = numpy.random.default_rng(0).poisson(3, (301, 203)).astype(numpy.uint16)
+        self.check(image, image_bits=12)
+
+    def test_int16(self):
+        image = numpy.random.default_rng(0).integers(-32768, 32768, (301, 203), dtype=numpy.int16)
+        for range in ((None, None), (-1000, 5000), (None, -20000)):
+            self.check(image, range)
+
+    def test_ga(self):
+        # only the first channel is histogrammed
+        rng = numpy.random.default_rng(0)
+        for dtype in (numpy.uint8, numpy.uint16, numpy.int16):
+            info = numpy.iinfo(dtype)
+            image = rng.integers(info.min, info.max, (301, 203, 2), dtype=dtype, endpoint=True)
+            image_min, image_max, hist = histogram.histogram(image)
+            wanted_min, wanted_max, wanted_hist = reference_histogram(image[..., 0])
+            self.assertEqual((image_min, image_max), (wanted_min, wanted_max))
+            self.assertTrue((hist == wanted_hist).all())
+
+class FloatKernelTest(KernelTestCase):
+    # int32 and float64 images are histogrammed as float32
+    def test_dtypes(self):
+        rng = numpy.random.default_rng(0)
+        for dtype in (numpy.float32, numpy.float64):
+            image = rng.normal(100, 1000, (301, 203)).astype(dtype)
+            for range in ((None, None), (-500, 2000), (None, 0), (0, None)):
+                self.check(image, range)
+        image = rng.integers(-2**20, 2**20, (301, 203), dtype=numpy.int32)
+        for range in ((None, None), (-500, 2000)):
+            self.check(image, range)
+
+    def test_constant(self):
+        # all values at the top of the range are counted in the last bin
+        image = numpy.full((301, 203), 7, numpy.float32)
+        self.check(image, (0, 7))
+        min, max, hist = histogram.histogram(image, (0, 7))
+        self.assertEqual(hist[-1], image.size)
+
+class ChannelKernelTest(unittest.TestCase):
+    # each channel histogram, and the luma histogram, must match numpy's
+    def reference_luma(self, pixels):
+        if pixels.dtype == numpy.float32:
+            r, g, b = pixels[:, :3].T
+            return 0.2126*r + 0.7152*g + 0.0722*b
+        # the integral kernels calculate luma in double precision, from offset int16 values
+        offset = histogram_module._int16_offset(pixels.dtype)
+        r, g, b = (pixels[:, :3].astype(numpy.float64) + offset).T
+        return ((0.2126*r + 0.7152*g + 0.0722*b).astype(numpy.int64) - offset).astype(pixels.dtype)
+
+    def check(self, image, range=(None, None)):
+        luma_wanted = image.shape[2] > 2
+        for view in layouts(image):
+            for mask_geometry in MASKS:
+                with self.subTest(dtype=image.dtype, shape=image.shape, range=range, strides=view.strides,
+                        mask_geometry=mask_geometry):
+                    mins, maxs, hists = histogram.channel_histograms(view, range, mask_geometry=mask_geometry, luma=luma_wanted)
+                    pixels = masked_values(view, mask_geometry)
+                    values = [pixels[:, c] for c in builtins.range(image.shape[2])]
+                    if luma_wanted:
+                        values.append(self.reference_luma(pixels))
+                    channel_range = range
+                    if image.dtype == numpy.float32 and None in range:
+                        # the default range is that of the luma values, or of all channels
+                        all_values = values[-1] if luma_wanted else pixels
+                        r_min, r_max = range
+                        channel_range = (all_values.min() if r_min is None else r_min, all_values.max() if r_max is None else r_max)
+                    self.assertEqual(hists.shape, (len(values), 256 if image.dtype == numpy.uint8 else 1024))
+                    for c, channel_values in enumerate(values):
+                        wanted_min, wanted_max, wanted_hist = reference_histogram(channel_values, channel_range)
+                        self.assertEqual((mins[c], maxs[c]), (wanted_min, wanted_max))
+                        self.assertTrue((hists[c] == wanted_hist).all())
+
+    def test_dtypes(self):
+        rng = numpy.random.default_rng(0)
+        for n_channels in (2, 3, 4):
+            shape = (301, 203, n_channels)
+            self.check(rng.integers(0, 256, shape, dtype=numpy.uint8))
+            self.check(rng.integers(0, 256, shape, dtype=numpy.uint8), (10, 200))
+            image = rng.integers(0, 65536, shape, dtype=numpy.uint16)
+            self.check(image)
+            self.check(image, (100, 30000))
+            image = rng.integers(-32768, 32768, shape, dtype=numpy.int16)
+            self.check(image)
+            self.check(image, (-1000, 5000))
+            image = rng.normal(100, 1000, shape).astype(numpy.float32)
+            self.check(image)
+            self.check(image, (-500, 2000))
+            self.check(image, (None, 0))
+
+    def test_histogram_luma(self):
+        # histogram() of an RGB(A) image is the luma histogram of channel_histograms()
+        rng = numpy.random.default_rng(0)
+        for dtype in (numpy.uint8, numpy.uint16, numpy.int16, numpy.float32):
+            if dtype is numpy.float32:
+                image = rng.normal(100, 1000, (301, 203, 3)).astype(dtype)
+            else:
+                info = numpy.iinfo(dtype)
+                image = rng.integers(info.min, info.max, (301, 203, 3), dtype=dtype, endpoint=True)
+            image_min, image_max, hist = histogram.histogram(image)
+            mins, maxs, hists = histogram.channel_histograms(image, luma=True)
+            self.assertEqual((image_min, image_max), (mins[-1], maxs[-1]))
+            self.assertTrue((hist == hists[-1]).all())
+
+def sample_images():
+    """Yield an image of each kernel dtype, in each of the shapes histogram() accepts."""
+    rng = numpy.random.default_rng(0)
+    for shape in ((301, 203), (301, 203, 2), (301, 203, 3), (301, 203, 4)):
+        for dtype in (numpy.uint8, numpy.uint16, numpy.int16):
+            info = numpy.iinfo(dtype)
+            yield rng.integers(info.min, info.max, shape, dtype=dtype, endpoint=True)
+        yield rng.normal(100, 1000, shape).astype(numpy.float32)
+
+class ThreadedTest(unittest.TestCase):
+    # the results must not depend on the number of threads, or on how the rows are split into bands
+    def test_row_bands(self):
+        for rows, threads in ((301, 4), (3, 8), (1, 1)):
+            bands = histogram_module._row_bands(rows, 10**6, threads)
+            self.assertEqual(len(bands), min(rows, threads))
+            self.assertEqual([start for start, stop in bands[1:]], [stop for start, stop in bands[:-1]])
+            self.assertEqual((bands[0][0], bands[-1][1]), (0, rows))
+
+    def test_threads(self):
+        with mock.patch.object(histogram_module, 'MIN_PIXELS_PER_THREAD', 1000):
+            for image in sample_images():
+                for mask_geometry in MASKS:
+                    for range in ((None, None), (10, 200)):
+                        with self.subTest(dtype=image.dtype, shape=image.shape, mask_geometry=mask_geometry, range=range):
+                            serial = histogram.histogram(image, range, mask_geometry=mask_geometry, threads=1)
+                            threaded = histogram.histogram(image, range, mask_geometry=mask_geometry, threads=4)
+                            self.assertEqual(threaded[:2], serial[:2])
+                            self.assertTrue((threaded[2] == serial[2]).all())
+                            if image.ndim == 3:
+                                luma_wanted = image.shape[2] > 2
+                                mins, maxs, hists = histogram.channel_histograms(image, range, mask_geometry=mask_geometry,
+                                    threads=1, luma=luma_wanted)
+                                threaded = histogram.channel_histograms(image, range, mask_geometry=mask_geometry,
+                                    threads=4, luma=luma_wanted)
+                                self.assertEqual(threaded[:2], (mins, maxs))
+                                self.assertTrue((threaded[2] == hists).all())
+                            self.assertEqual(histogram.min_max(image, mask_geometry, threads=4), serial[:2])
+
+    def test_reference(self):
+        image = numpy.random.default_rng(0).integers(0, 65536, (301, 203), dtype=numpy.uint16)
+        with mock.patch.object(histogram_module, 'MIN_PIXELS_PER_THREAD', 1000):
+            image_min, image_max, hist = histogram.histogram(image, threads=7)
+        wanted_min, wanted_max, wanted_hist = reference_histogram(image)
+        self.assertEqual((image_min, image_max), (wanted_min, wanted_max))
+        self.assertTrue((hist == wanted_hist).all())
+
+class WideKernelTest(unittest.TestCase):
+    # the kernels for images too large for the narrow kernels must give the same results, with uint64 counts
+    def setUp(self):
+        self.needs_wide_kernels = histogram_module._needs_wide_kernels
+        patcher = mock.patch.object(histogram_module, '_needs_wide_kernels', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_needs_wide_kernels(self):
+        self.assertFalse(self.needs_wide_kernels(numpy.zeros((301, 203), numpy.uint16)))
+        self.assertTrue(self.needs_wide_kernels(numpy.zeros((70000, 1), numpy.uint8)))
+        # (these strides are never dereferenced)
+        far_apart = numpy.lib.stride_tricks.as_strided(numpy.zeros(1, numpy.uint8), (2, 2), (1, 2**32))
+        self.assertTrue(self.needs_wide_kernels(far_apart))
+
+    def test_wide(self):
+        for image in sample_images():
+            for mask_geometry in MASKS:
+                with self.subTest(dtype=image.dtype, shape=image.shape, mask_geometry=mask_geometry):
+                    image_min, image_max, hist = histogram.histogram(image, mask_geometry=mask_geometry)
+                    self.assertEqual(hist.dtype, numpy.uint64)
+                    if image.ndim == 2:
+                        wanted_min, wanted_max, wanted_hist = reference_histogram(masked_values(image, mask_geometry))
+                        self.assertEqual((image_min, image_max), (wanted_min, wanted_max))
+                        self.assertTrue((hist == wanted_hist).all())
+                    else:
+                        mins, maxs, hists = histogram.channel_histograms(image, mask_geometry=mask_geometry)
+                        self.assertEqual(hists.dtype, numpy.uint64)
+                        with mock.patch.object(histogram_module, '_needs_wide_kernels', return_value=False):
+                            narrow = histogram.channel_histograms(image, mask_geometry=mask_geometry)
+                        self.assertEqual((mins, maxs), narrow[:2])
+                        self.assertTrue((hists == narrow[2]).all())
+                    self.assertEqual(histogram.min_max(image, mask_geometry), (image_min, image_max))
+
+class CacheTest(unittest.TestCase):
+    class Image:
+        # the parts of an Image that HistogramCache uses
+        generation = 0
+
+    def test_hit_and_miss(self):
+        cache = histogram.HistogramCache()
+        image = self.Image()
+        self.assertIsNone(cache.get(image, 'key'))
+        cache.put(image, 'key', 'result')
+        self.assertTrue(cache.contains(image, 'key'))
+        self.assertEqual(cache.get(image, 'key'), 'result')
+        self.assertIsNone(cache.get(image, 'other key'))
+        self.assertIsNone(cache.get(self.Image(), 'key'))
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_generation(self):
+        # a result is not reused once the image data have changed
+        cache = histogram.HistogramCache()
+        image = self.Image()
+        cache.put(image, 'key', 'result')
+        image.generation += 1
+        self.assertFalse(cache.contains(image, 'key'))
+        self.assertIsNone(cache.get(image, 'key'))
+
+    def test_lru(self):
+        cache = histogram.HistogramCache(max_entries=2)
+        images = [self.Image() for i in range(3)]
+        cache.put(images[0], 'key', 0)
+        cache.put(images[1], 'key', 1)
+        cache.get(images[0], 'key')
+        cache.put(images[2], 'key', 2)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(images[0], 'key'), 0)
+        self.assertIsNone(cache.get(images[1], 'key'))
+        self.assertEqual(cache.get(images[2], 'key'), 2)
+
+    def test_dead_image(self):
+        cache = histogram.HistogramCache()
+        image = self.Image()
+        cache.put(image, 'key', 'result')
+        cache.put(image, 'other key', 'other result')
+        cache.put(self.Image(), 'key', 'result') # deleted immediately
+        self.assertEqual(len(cache), 2)
+        del image
+        self.assertEqual(len(cache), 0)
+
+class PercentilesTest(unittest.TestCase):
+    # percentiles found from the histogram must match numpy's to within the histogram resolution
+    PERCENTILES = [0.5, 50, 99.5]
+
+    def check(self, image, tolerance):
+        wanted = numpy.percentile(image, self.PERCENTILES)
+        with self.subTest(dtype=image.dtype):
+            self.assertLessEqual(numpy.abs(histogram.percentiles(image, self.PERCENTILES) - wanted).max(), tolerance)
+
+    def test_integers(self):
+        # (integral bins are refined to single values)
+        rng = numpy.random.default_rng(0)
+        self.check(rng.integers(0, 256, (301, 203), dtype=numpy.uint8), 1)
+        self.check(rng.normal(1000, 100, (301, 203)).astype(numpy.uint16), 1)
+        self.check(rng.normal(0, 100, (301, 203)).astype(numpy.int16), 1)
+
+    def test_outliers(self):
+        # a few outlying values stretch the range of a float image far beyond that of the percentiles
+        image = numpy.random.default_rng(0).normal(100, 10, (301, 203)).astype(numpy.float32)
+        image[:3, 0] = 1e6
+        wanted = numpy.percentile(image, self.PERCENTILES)
+        self.check(image, histogram_module.PERCENTILE_RESOLUTION * (wanted[-1] - wanted[0]))
+
+    def test_precalculated_hist(self):
+        image = numpy.random.default_rng(0).normal(1000, 100, (301, 203)).astype(numpy.uint16)
+        self.assertTrue((histogram.percentiles(image, self.PERCENTILES, hist=histogram.histogram(image)) ==
+            histogram.percentiles(image, self.PERCENTILES)).all())
+
+    def test_empty(self):
+        image = numpy.full((301, 203), 1000, numpy.uint16)
+        self.assertTrue(numpy.isnan(histogram.percentiles(image, self.PERCENTILES, range=(0, 10))).all())
+
+if __name__ == '__main__':
+    unittest.main()
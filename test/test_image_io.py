@@ -0,0 +1,125 @@
+# This code is licensed under the MIT License (see LICENSE file for details)
+
+import json
+import pathlib
+import tempfile
+import unittest
+import numpy
+from PyQt5 import Qt
+
+from ris_widget import image_io
+from ris_widget.qwidgets import flipbook
+
+class ImageIOTestCase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = pathlib.Path(temp_dir.name)
+        # a (y, x, c) camera frame, as saved to disk
+        self.yx = numpy.arange(30 * 20 * 3, dtype=numpy.uint16).reshape(30, 20, 3)
+
+    def write_raw(self, name, header=b''):
+        path = self.dir / name
+        path.write_bytes(header + self.yx.tobytes())
+        return path
+
+    def write_json(self, name, raw_format):
+        with (self.dir / name).open('w') as f:
+            json.dump(raw_format, f)
+
+    def check_data(self, data):
+        # the pixels are returned in (x, y, c) order
+        self.assertEqual(data.shape, (20, 30, 3))
+        self.assertTrue((data == self.yx.swapaxes(0, 1)).all())
+
+class ReadMappedTest(ImageIOTestCase):
+    def test_npy(self):
+        for array in (self.yx, numpy.asfortranarray(self.yx)):
+            path = self.dir / 'image.npy'
+            numpy.save(str(path), array)
+            data, image_bits = image_io.read_mapped(path)
+            self.check_data(data)
+            self.assertIsNone(image_bits)
+            # mapped copy-on-write: the file is not changed
+            data[0, 0] = 0
+            self.assertTrue((numpy.load(str(path)) == self.yx).all())
+
+    def test_raw_sidecar(self):
+        path = self.write_raw('frame.raw', header=b'\0' * 16)
+        self.write_json('frame.raw.json', dict(shape=[20, 30, 3], dtype='uint16', image_bits=12, offset=16))
+        data, image_bits = image_io.read_mapped(path)
+        self.check_data(data)
+        self.assertEqual(image_bits, 12)
+
+    def test_raw_format_file(self):
+        # a directory of raw files of the same format may share a sidecar file
+        path = self.write_raw('frame.RAW')
+        self.write_json(image_io.RAW_FORMAT_FILENAME, dict(shape=[20, 30, 3], dtype='uint16'))
+        self.assertTrue(image_io.is_mapped(path))
+        data, image_bits = image_io.read_mapped(path)
+        self.check_data(data)
+        self.assertIsNone(image_bits)
+
+    def test_raw_format_argument(self):
+        path = self.write_raw('frame.raw')
+        with self.assertRaises(ValueError):
+            image_io.read_mapped(path)
+        data, image_bits = image_io.read_mapped(path, dict(shape=(20, 30, 3), dtype=numpy.uint16))
+        self.check_data(data)
+        # a sidecar file takes precedence over the format given
+        self.write_json('frame.raw.json', dict(shape=[20, 30, 3], dtype='uint16', image_bits=12))
+        data, image_bits = image_io.read_mapped(path, dict(shape=(30, 20, 3), dtype=numpy.uint8))
+        self.check_data(data)
+        self.assertEqual(image_bits, 12)
+
+    def test_not_mapped(self):
+        self.assertFalse(image_io.is_mapped('image.png'))
+
+class ReadRawTest(ImageIOTestCase):
+    def test_greyscale(self):
+        self.yx = self.yx[..., 0].copy()
+        path = self.write_raw('frame.raw', header=b'\0' * 8)
+        data, image_bits = image_io.read_raw(path, (20, 30), 'uint16', offset=8)
+        self.assertEqual(data.shape, (20, 30))
+        self.assertTrue((data == self.yx.T).all())
+
+    def test_no_sidecar(self):
+        self.assertIsNone(image_io.read_raw_format(self.write_raw('frame.raw')))
+
+class LazyImageTest(ImageIOTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = self.dir / 'image.npy'
+        numpy.save(str(self.path), self.yx)
+        self.image = flipbook.LazyImage(self.path)
+
+    def read(self):
+        self.image._set_read_data(*self.image.read())
+
+    def test_read_and_unload(self):
+        self.assertFalse(self.image.loaded)
+        self.assertIsNone(self.image.data)
+        self.read()
+        self.assertTrue(self.image.loaded)
+        self.check_data(self.image.data)
+        self.assertEqual(self.image.type, 'rgb')
+        self.image.unload()
+        self.assertFalse(self.image.loaded)
+        # the properties of the last read are kept
+        self.assertEqual(self.image.size, Qt.QSize(20, 30))
+
+    def test_generation(self):
+        # rereading unmodified data does not change the generation, but the modifications are lost otherwise
+        self.read()
+        self.image.unload()
+        self.read()
+        self.assertEqual(self.image.generation, 0)
+        self.image.data[0, 0] = 0
+        self.image.refresh()
+        self.image.unload()
+        self.read()
+        self.assertEqual(self.image.generation, 2)
+        self.check_data(self.image.data)
+
+if __name__ == '__main__':
+    unittest.main()